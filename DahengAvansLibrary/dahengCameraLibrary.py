@@ -7,6 +7,7 @@
 
 import os
 import warnings
+import asyncio
 
 # ------------------------------------------------------------
 # Instellen van de omgeving voor de Daheng Galaxy SDK
@@ -29,10 +30,19 @@ from ctypes import *
 from gxipy.gxidef import *
 import numpy
 from gxipy.ImageFormatConvert import *
-import cv2
+from gxipy.NumpyFormatConvert import *
 from DahengAvansLibrary.dahengFeature import *
 from DahengAvansLibrary.dahengFeatureList import *
 
+# Uitvoerformaat zonder conversie: grab_frame levert het ruwe (Bayer-)beeld van de camera
+OUTPUT_FORMAT_RAW = GxPixelFormatEntry.UNDEFINED
+
+# Uitvoerformaten met 16 bits per kanaal (uint16): de waarden houden de bitdiepte van de camera (12 bits = 0..4095)
+OUTPUT_FORMATS_16BIT = (GxPixelFormatEntry.BGR16, GxPixelFormatEntry.RGB16, GxPixelFormatEntry.MONO16)
+
+# Ondersteunde uitvoerformaten van grab_frame
+OUTPUT_FORMATS = (GxPixelFormatEntry.BGR8, GxPixelFormatEntry.RGB8, GxPixelFormatEntry.MONO8,
+                  OUTPUT_FORMAT_RAW) + OUTPUT_FORMATS_16BIT
 
 
 
@@ -52,9 +62,15 @@ class dahengCamera:
     - Veilig sluiten en vrijgeven van de camera
     """
 
-    def __init__(self, device_index, debug=False):
-        """Initialiseer de camera-interface en open de opgegeven camera-index."""
+    def __init__(self, device_index, debug=False, output_format=GxPixelFormatEntry.BGR8):
+        """Initialiseer de camera-interface en open de opgegeven camera-index.
+
+        output_format: uitvoerformaat van grab_frame, zie setOutputFormat
+        """
         self.debug = debug
+        self.setOutputFormat(output_format)
+        self.valid_bits_cache = {}  # Geheugen van get_best_valid_bits per pixelformaat
+        self.bit_depth = None  # Geldige bits per kanaal van het laatst opgenomen frame
         if not debug:
             # ❌ Logging ban info uitzetten
             logger.addFilter(HideInfoFilter())
@@ -87,9 +103,13 @@ class dahengCamera:
         self.cam = self.device_manager.open_device_by_index(device_index)
         self.remote_device_feature = self.cam.get_remote_device_feature_control()
 
+        # Onthoud toegangsrechten en bereik van de features: elke opvraging is bij GigE een netwerkverzoek.
+        # Het geheugen wordt gewist bij schrijfacties die andere features beïnvloeden (bijv. binning)
+        self.remote_device_feature.enable_metadata_cache(True)
+
         # Configuratie van beeldverwerking: schakel kleurcorrectie uit
-        image_process_config = self.cam.create_image_process_config()
-        image_process_config.enable_color_correction(False)
+        self.image_process_config = self.cam.create_image_process_config()
+        self.image_process_config.enable_color_correction(False)
 
         # Definieer diverse camera-features (instellingen)
         for name, ftype in features:
@@ -100,8 +120,7 @@ class dahengCamera:
                 logger.error(f"Feature bestaat niet: {name}")
 
         # Laad de standaard gebruikersinstellingen van de camera
-        self.UserSetSelector.set("Default")
-        self.UserSetLoad.send_command()
+        self.applySettings({"UserSetSelector": "Default", "UserSetLoad": None})
 
         # Toon camera-informatie bij debugmodus
         if self.debug:
@@ -125,8 +144,145 @@ class dahengCamera:
         """Stop de continue beeldstreaming."""
         self.cam.stream_off()
 
+    def getStreamCount(self):
+        """Geef het aantal datastreams (kanalen) van de camera."""
+        return self.cam.get_stream_channel_num()
+
+    def getStream(self, stream_index=1):
+        """Geef het DataStream-object van een stream (index begint bij 1)."""
+        return self.cam.get_stream(stream_index)
+
+    def startStreams(self, stream_indices=None, buffer_number=None, buffer_pool=0, background_grab=None):
+        """
+        Start beeldstreaming op meerdere datastreams tegelijk.
+
+        stream_indices:  lijst met stream-indices (beginnend bij 1), None = alle streams
+        buffer_number:   aantal acquisitiebuffers per stream in de SDK, None = standaardwaarde
+        buffer_pool:     aantal vooraf gealloceerde buffers voor grab_frame, 0 = uit
+        background_grab: capaciteit van de ringbuffer voor de achtergrond-grabber, None = uit
+
+        De SDK haalt de frames van alle streams op via de wachtrij van de camera; er draait daarom één
+        achtergrond-grabber per camera, die de frames van alle streams verzamelt.
+        """
+        for stream_index in (stream_indices if stream_indices is not None else range(1, self.getStreamCount() + 1)):
+            stream = self.cam.get_stream(stream_index)
+            if buffer_number is not None:
+                stream.set_acquisition_buffer_number(buffer_number)
+            stream.set_buffer_pool(buffer_pool)
+            stream.set_background_grab(background_grab)
+
+        streams = self.cam.start_streams(stream_indices)
+        if self.debug:
+            logger.info(f"<DahengCamera: {len(streams)} stream(s) gestart>")
+        return streams
+
+    def stopStreams(self, stream_indices=None):
+        """Stop beeldstreaming op de opgegeven datastreams (None = alle streams) en leeg de wachtrijen."""
+        self.cam.stop_streams(stream_indices)
+        if self.debug:
+            logger.info("<DahengCamera: stream(s) gestopt>")
+
+    def startPreview(self, decimation=4, max_fps=10.0, stream_index=1, callback=None):
+        """
+        Start een verkleind livebeeld naast de frames op volle resolutie.
+
+        De preview wordt in een eigen thread gemaakt en remt de acquisitie nooit af: is de
+        preview nog bezig, dan wordt het frame voor de preview overgeslagen.
+
+        decimation: verkleiningsfactor per zijde (4 = 1/16 van het aantal pixels)
+        max_fps:    maximale beeldfrequentie van de preview
+        callback:   functie die met elke nieuwe preview (BGR-beeld) wordt aangeroepen, of None
+        """
+        preview_formats = (GxPixelFormatEntry.BGR8, GxPixelFormatEntry.RGB8, GxPixelFormatEntry.MONO8)
+        output_format = self.output_format if self.output_format in preview_formats else GxPixelFormatEntry.BGR8
+        return self.cam.get_stream(stream_index).start_preview(decimation, max_fps, output_format, callback)
+
+    def getPreview(self, stream_index=1):
+        """Geef de nieuwste preview als NumPy-array, of None als er (nog) geen preview is."""
+        preview_tap = self.cam.get_stream(stream_index).get_preview_tap()
+        return preview_tap.get_preview() if preview_tap is not None else None
+
+    def stopPreview(self, stream_index=1):
+        """Stop de preview van de opgegeven datastream."""
+        self.cam.get_stream(stream_index).stop_preview()
+
+    def applySettings(self, settings):
+        """
+        Stel meerdere features in één aanroep in, bijv. bij het wisselen van productvariant:
+        {"TriggerMode": "On", "TriggerSource": "Software", "ExposureTime": 5000.0, "UserSetLoad": None}
+
+        De volgorde wordt bepaald op basis van de afhankelijkheden (bijv. TriggerMode vóór TriggerSource),
+        een waarde None voert een commando uit. Geeft een dictionary terug met per mislukte feature de fout.
+        """
+        failures = self.remote_device_feature.apply(settings)
+        for name, error in failures.items():
+            logger.error(f"Kon waarde niet instellen voor: {name} ({error})")
+        return failures
+
+    def snapshotSettings(self, feature_names=None):
+        """
+        Lees de huidige waarden van de features in een dictionary, zonder bestand op schijf.
+        Zonder feature_names worden alle uitleesbare features van de camera gelezen.
+        Met restoreSettings zet je de waarden later terug, bijv. per productvariant.
+        """
+        return self.remote_device_feature.snapshot(feature_names)
+
+    def restoreSettings(self, snapshot, only_diff=True):
+        """
+        Zet de waarden van snapshotSettings terug op de camera. Met only_diff=True worden alleen de
+        features geschreven die afwijken van de huidige waarden. Geeft een dictionary terug met per
+        mislukte feature de fout.
+        """
+        failures = self.remote_device_feature.restore(snapshot, only_diff)
+        for name, error in failures.items():
+            logger.error(f"Kon waarde niet terugzetten voor: {name} ({error})")
+        return failures
+
+    def setWriteSuppression(self, enable=True):
+        """
+        Sla het schrijven van een feature over als de waarde gelijk is aan de laatst geschreven waarde,
+        bijv. bij het elke lus instellen van ExposureTime en Gain. Na UserSetLoad, een wijziging die andere
+        features beïnvloedt of een wijziging door de camera zelf wordt de waarde altijd opnieuw geschreven.
+        Gebruik <feature>.set(waarde, force=True) om toch te schrijven.
+        """
+        self.remote_device_feature.enable_write_suppression(enable)
+
+    def setOutputFormat(self, output_format):
+        """
+        Stel het uitvoerformaat van grab_frame en aframes in.
+
+        GxPixelFormatEntry.BGR8: kleurbeeld voor OpenCV (standaard)
+        GxPixelFormatEntry.RGB8: kleurbeeld in RGB-volgorde
+        GxPixelFormatEntry.MONO8: grijswaardenbeeld
+        GxPixelFormatEntry.BGR16/RGB16/MONO16: als hierboven, maar als uint16 met de volle bitdiepte
+                                 van de camera (zie getBitDepth), zonder omrekenen naar 8 bits
+        OUTPUT_FORMAT_RAW:       ruw (Bayer-)beeld zonder conversie, 10/12-bits formaten als uint16
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Niet ondersteund uitvoerformaat: {hex(output_format)}")
+        self.output_format = output_format
+
+    def getOutputFormat(self):
+        """Geef het ingestelde uitvoerformaat van grab_frame."""
+        return self.output_format
+
+    def getBitDepth(self):
+        """
+        Geef het aantal geldige bits per kanaal van het laatst opgenomen frame (bijv. 12 bij een
+        12-bits camera), None zolang er nog geen frame is opgenomen.
+
+        Bij de 16-bits uitvoerformaten en OUTPUT_FORMAT_RAW staan de geldige bits in de lage bits
+        van de uint16-waarden.
+        """
+        return self.bit_depth
+
     def get_best_valid_bits(self, pixel_format):
         """Bepaal de optimale geldige bitrange voor het opgegeven pixelformaat."""
+        # Het pixelformaat verandert zelden: het resultaat wordt per formaat onthouden
+        valid_bits = self.valid_bits_cache.get(pixel_format)
+        if valid_bits is not None:
+            return valid_bits
+
         valid_bits = DxValidBit.BIT0_7
 
         # Verschillende formaten hebben hun eigen geldige bitrange
@@ -162,6 +318,7 @@ class dahengCamera:
                               GxPixelFormatEntry.BAYER_GR16, GxPixelFormatEntry.BAYER_RG16,
                               GxPixelFormatEntry.BAYER_GB16, GxPixelFormatEntry.BAYER_BG16):
             valid_bits = DxValidBit.BIT8_15
+        self.valid_bits_cache[pixel_format] = valid_bits
         return valid_bits
 
     def convert_to_RGB(self, raw_image):
@@ -184,8 +341,16 @@ class dahengCamera:
 
         return output_image_array, buffer_out_size
 
-    def grab_frame(self, timeout=1000):
-        """Neem één frame op, converteer naar BGR (OpenCV-formaat) en retourneer als NumPy-array."""
+    def grab_frame(self, timeout=1000, stream_index=1, out=None):
+        """Neem één frame op, converteer naar het uitvoerformaat (standaard BGR, zie setOutputFormat)
+        en retourneer als NumPy-array.
+
+        Draait er een achtergrond-grabber (zie startStreams), dan komt het frame uit diens ringbuffer. Die
+        verzamelt de frames van alle streams, een stream kiezen met stream_index kan dan niet: een andere
+        stream_index dan 1 geeft een foutmelding en None.
+        Geef met out een herbruikbare NumPy-array mee; past die bij het beeld, dan wordt het frame daar direct
+        in geschreven en wordt er per frame geen nieuw geheugen gereserveerd.
+        """
         self.frame_counter += 1
         if self.debug:
             logger.info(f"<DahengCamera: grab_frame {self.frame_counter}>")
@@ -197,48 +362,123 @@ class dahengCamera:
 
         try:
             # Vraag een beeld op van de camerastream
-            raw_image = self.cam.data_stream[0].get_image(timeout)
+            grabber = self.cam.get_background_grabber()
+            if grabber is not None:
+                if stream_index != 1:
+                    logger.error(f"<DahengCamera: stream_index {stream_index} niet mogelijk, de achtergrond-grabber "
+                                 f"levert de frames van alle streams>")
+                    return None
+                raw_image = grabber.get_next(timeout)
+            else:
+                raw_image = self.cam.get_stream(stream_index).get_image(timeout)
             if raw_image is None:
                 if self.debug:
                     logger.error("<DahengCamera: Beeld ophalen mislukt>")
                 return None
 
-            # Indien het beeld niet RGB is, converteer het eerst
-            if raw_image.get_pixel_format() != GxPixelFormatEntry.RGB8:
-                rgb_image_array, rgb_image_buffer_length = self.convert_to_RGB(raw_image)
-                if rgb_image_array is None:
-                    return None
-                numpy_image = numpy.frombuffer(rgb_image_array, dtype=numpy.ubyte,
-                                               count=rgb_image_buffer_length).reshape(
-                    raw_image.frame_data.height,
-                    raw_image.frame_data.width,
-                    3
-                )
-            else:
-                # Indien al RGB, direct als NumPy-array ophalen
-                numpy_image = raw_image.get_numpy_array()
+            return self.convert_image(raw_image, out=out)
+
+        except Exception as ex:
+            if self.debug:
+                logger.error(f"Fout bij grab_frame: {str(ex)}")
+            return None
 
+    async def aframes(self, max_queue=8):
+        """
+        Asynchrone frame-iterator: levert beelden in het uitvoerformaat (standaard BGR, zie setOutputFormat)
+        als NumPy-array.
+
+        Gebruik: async for frame in camera.aframes(): ...
+        De frames komen binnen via de capture-callback van de SDK en worden in een
+        begrensde asyncio.Queue geplaatst; is de queue vol, dan vervalt het oudste frame.
+        De conversie gebeurt in een executor zodat de event loop vrij blijft.
+        """
+        if not self.open:
+            if self.debug:
+                logger.error("<DahengCamera: camera niet open>")
+            return
+
+        loop = asyncio.get_running_loop()
+        frames = self.cam.data_stream[0].aframes(max_queue)
+        try:
+            async for raw_image in frames:
+                self.frame_counter += 1
+                image = await loop.run_in_executor(None, self.convert_image, raw_image)
+                if image is not None:
+                    yield image
+        finally:
+            await frames.aclose()
+            if self.debug:
+                logger.info(f"<DahengCamera: aframes gestopt, {frames.get_dropped_count()} frames vervallen>")
+
+    def convert_image(self, raw_image, output_format=None, out=None):
+        """
+        Converteer een RawImage in één stap naar het uitvoerformaat en retourneer als NumPy-array.
+
+        output_format: een van OUTPUT_FORMATS, None = ingesteld uitvoerformaat
+        out:           optionele herbruikbare NumPy-array; heeft die de juiste vorm en het juiste type,
+                       dan wordt het beeld daar direct in geschreven
+        """
+        if output_format is None:
+            output_format = self.output_format
+
+        try:
+            pixel_format = raw_image.get_pixel_format()
+            self.bit_depth = raw_image.get_bit_depth()
+
+            # Ruw beeld: alleen kopiëren (packed formaten worden uitgepakt naar uint16)
+            if output_format == OUTPUT_FORMAT_RAW:
+                raw_array = raw_image.get_numpy_array()
+                if raw_array is None:
+                    return None
+                if out is None or out.shape != raw_array.shape or out.dtype != raw_array.dtype:
+                    return raw_array.copy()
+                out[...] = raw_array
+                return out
+
+            height = raw_image.frame_data.height
+            width = raw_image.frame_data.width
+            mono = output_format in (GxPixelFormatEntry.MONO8, GxPixelFormatEntry.MONO16)
+            shape = (height, width) if mono else (height, width, 3)
+            dtype = numpy.uint16 if output_format in OUTPUT_FORMATS_16BIT else numpy.uint8
+            if out is None or out.shape != shape or out.dtype != dtype or not out.flags.c_contiguous:
+                out = numpy.empty(shape, dtype=dtype)
+
+            valid_bits = self.get_best_valid_bits(pixel_format)
+            if pixel_format == GxPixelFormatEntry.RGB8:
                 # Verbeter eventueel de beeldkwaliteit
                 rgb_image = GxImageInfo()
-                rgb_image.image_width = raw_image.frame_data.width
-                rgb_image.image_height = raw_image.frame_data.height
+                rgb_image.image_width = width
+                rgb_image.image_height = height
                 rgb_image.image_buf = raw_image.frame_data.image_buf
                 rgb_image.image_pixel_format = GxPixelFormatEntry.RGB8
                 self.image_process.image_improvement(rgb_image, rgb_image.image_buf, self.image_process_config)
 
-                if numpy_image is None:
+            if (Utility.is_gray(pixel_format) or (pixel_format & PIXEL_COLOR_MASK) == PIXEL_COLOR) \
+                    and NumpyFormatConvert.is_supported(pixel_format, output_format):
+                # Geen Bayer-interpolatie nodig: bits selecteren of kanalen wisselen in één NumPy-stap
+                source = raw_image.get_numpy_array()
+                if source is None:
                     return None
+                NumpyFormatConvert.convert(source, pixel_format, output_format, valid_bits, False, out)
+            else:
+                # Bayer-interpolatie of een formaat dat NumPy niet kent (bijv. R8, packed), direct naar het
+                # uitvoerformaat geschreven in out
+                self.image_convert.set_dest_format(output_format)
+                self.image_convert.set_valid_bits(valid_bits)
+                self.image_convert.convert(raw_image, out.ctypes.data, out.nbytes, False)
 
-            # Converteer van RGB naar BGR (vereist door OpenCV)
-            bgr_image = cv2.cvtColor(numpy_image, cv2.COLOR_RGB2BGR)
-
-            return bgr_image
+            return out
 
         except Exception as ex:
             if self.debug:
-                logger.error(f"Fout bij grab_frame: {str(ex)}")
+                logger.error(f"Fout bij convert_image: {str(ex)}")
             return None
 
+    def convert_to_BGR(self, raw_image):
+        """Converteer een RawImage naar een BGR-beeld (OpenCV-formaat) als NumPy-array."""
+        return self.convert_image(raw_image, GxPixelFormatEntry.BGR8)
+
     def close(self):
         """Sluit de camera en geef alle resources vrij."""
         if self.debug:
@@ -82,12 +82,18 @@ class dahengFeature:
             logger.error(f"Kon waarde niet lezen: {self.feature_name}")
             return 0.0
 
-    def set(self, value):
+    def set(self, value, force=False):
         """
         Stel de waarde van de feature in, afhankelijk van het type.
         Controleert eerst of de feature schrijfbaar is.
+        Met force=True wordt ook geschreven als de waarde gelijk is aan de laatst geschreven waarde
+        (zie dahengCamera.setWriteSuppression).
         """
         try:
+            # Vergeet de laatst geschreven waarde, zodat de waarde zeker naar de camera gaat
+            if force:
+                self.remote_device_feature.invalidate_metadata(self.feature_name)
+
             # Zorg dat de waarde wordt omgezet naar het juiste Python-type
             match self.feature_type:
                 case featureType.Integer:
@@ -220,7 +226,7 @@ class dahengDummyFeature:
         logger.error(f"Feature bestaat niet: {self.feature_name}.get()")
         return None
 
-    def set(self, value):
+    def set(self, value, force=False):
         """
         Stel de waarde van de feature in, afhankelijk van het type.
         Controleert eerst of de feature schrijfbaar is.
@@ -0,0 +1,113 @@
+#!/usr/bin/python
+"""
+Voorbeeld: Benchmark van de pixelformaat-conversie
+--------------------------------------------------
+
+Dit script meet per pixelformaat hoe lang ImageFormatConvert over één conversie doet:
+- met de DxImageProc-bibliotheek van de Galaxy SDK (alleen als die geïnstalleerd is);
+- met de NumPy-backend (DxConvertBackend.NUMPY), die ook zonder SDK werkt.
+
+Er is geen camera nodig: de beelden zijn synthetisch (willekeurige pixelwaarden).
+Kies op basis van de uitkomst per formaat de snelste backend met
+ImageFormatConvert.set_backend().
+
+Vereisten:
+- gxipy Python-pakket
+- NumPy
+
+Datum:   2026-10-17
+Versie:  1.00 (initiële versie)
+"""
+
+# ------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------
+from gxipy.ImageFormatConvert import *
+from ctypes import addressof, c_ubyte
+import numpy
+import time
+
+BREEDTE = 1440          # Beeldbreedte in pixels
+HOOGTE = 1080           # Beeldhoogte in pixels
+AANTAL_METINGEN = 20    # Aantal conversies per meting
+
+# (bronformaat, doelformaat, valid bits)
+CONVERSIES = [
+    (GxPixelFormatEntry.BAYER_RG8, GxPixelFormatEntry.BGR8, DxValidBit.BIT0_7),
+    (GxPixelFormatEntry.BAYER_RG8, GxPixelFormatEntry.RGB8, DxValidBit.BIT0_7),
+    (GxPixelFormatEntry.BAYER_RG8, GxPixelFormatEntry.MONO8, DxValidBit.BIT0_7),
+    (GxPixelFormatEntry.BAYER_RG12, GxPixelFormatEntry.BGR8, DxValidBit.BIT4_11),
+    (GxPixelFormatEntry.MONO16, GxPixelFormatEntry.MONO8, DxValidBit.BIT8_15),
+    (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8, DxValidBit.BIT0_7),
+]
+
+
+# ------------------------------------------------------------
+# Metingen
+# ------------------------------------------------------------
+def maak_testbeeld(bronformaat):
+    """Maak een synthetisch beeld in het opgegeven pixelformaat."""
+    if bronformaat in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8):
+        return numpy.random.randint(0, 256, (HOOGTE, BREEDTE, 3)).astype(numpy.uint8)
+    if (bronformaat & PIXEL_BIT_MASK) == GX_PIXEL_16BIT:
+        return numpy.random.randint(0, 65536, (HOOGTE, BREEDTE)).astype(numpy.uint16)
+    return numpy.random.randint(0, 256, (HOOGTE, BREEDTE)).astype(numpy.uint8)
+
+
+def meet_conversie(backend, bronformaat, doelformaat, valid_bits):
+    """Meet de gemiddelde conversietijd in ms; retourneert None als de conversie niet ondersteund wordt."""
+    converter = ImageFormatConvert(backend)
+    converter.set_dest_format(doelformaat)
+    converter.set_valid_bits(valid_bits)
+
+    beeld = maak_testbeeld(bronformaat)
+    grootte = converter.get_buffer_size_for_conversion_ex(BREEDTE, HOOGTE, doelformaat)
+    uitvoer = (c_ubyte * grootte)()
+
+    try:
+        # Opwarmronde
+        converter.convert_ex(beeld.ctypes.data, BREEDTE, HOOGTE, bronformaat, addressof(uitvoer), grootte, False)
+    except (NoImplemented, UnexpectedError):
+        return None
+
+    start = time.perf_counter()
+    for _ in range(AANTAL_METINGEN):
+        converter.convert_ex(beeld.ctypes.data, BREEDTE, HOOGTE, bronformaat, addressof(uitvoer), grootte, False)
+    return 1000 * (time.perf_counter() - start) / AANTAL_METINGEN
+
+
+def formaat_naam(pixel_format):
+    """Zoek de naam van een pixelformaat op in GxPixelFormatEntry."""
+    for naam, waarde in vars(GxPixelFormatEntry).items():
+        if waarde == pixel_format and not naam.startswith("_"):
+            return naam
+    return hex(pixel_format)
+
+
+# ------------------------------------------------------------
+# Hoofdfunctie
+# ------------------------------------------------------------
+def main():
+    backends = [("numpy", DxConvertBackend.NUMPY)]
+    if DX_IMAGE_FORMAT_CONVERT_AVAILABLE:
+        backends.insert(0, ("DxImageProc", DxConvertBackend.SDK))
+    else:
+        print("DxImageProc niet gevonden, alleen de NumPy-backend wordt gemeten.")
+
+    print(f"Beeldgrootte {BREEDTE} x {HOOGTE}, gemiddelde van {AANTAL_METINGEN} conversies")
+    for bronformaat, doelformaat, valid_bits in CONVERSIES:
+        regel = f"{formaat_naam(bronformaat):>10} -> {formaat_naam(doelformaat):<6}"
+        for naam, backend in backends:
+            tijd = meet_conversie(backend, bronformaat, doelformaat, valid_bits)
+            if tijd is None:
+                regel += f"  {naam}: niet ondersteund"
+            else:
+                regel += f"  {naam}: {tijd:7.2f} ms"
+        print(regel)
+
+
+# ------------------------------------------------------------
+# Startpunt van het script
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    main()
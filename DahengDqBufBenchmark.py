@@ -0,0 +1,252 @@
+#!/usr/bin/python
+"""
+Voorbeeld: Microbenchmark van de dq_buf/q_buf-acquisitie
+--------------------------------------------------------
+
+Dit script meet de overhead per frame van:
+- DataStream.dq_buf/q_buf (maakt per frame een GxFrameData- en RawImage-object aan).
+- DataStream.dq_buf/q_buf met zero_copy=True (geen kopie van de beelddata).
+- De voorbereide 'hot path' van DataStream.prepare_dq_buf (ctypes-instellingen eenmalig gebonden).
+
+Gebruik een kleine ROI en een hoge framerate; dan bepaalt de Python-overhead per
+frame de maximale framerate en is het verschil tussen de varianten het duidelijkst.
+
+Zonder camera (en zonder Galaxy SDK) meet het script de ctypes-overhead per dq+q-aanroep:
+- GXDQBuf/GXQBuf met argtypes/restype per aanroep ingesteld (zoals gxipy dat eerder deed);
+- gx_dq_buf/gx_q_buf van gxwrapper, met eenmalig ingestelde prototypes;
+- de aanroep via DqBufHotPath.
+GXDQBuf/GXQBuf worden daarbij vervangen door C-aanroepbare functies die direct een vast
+frame teruggeven; die kosten zijn in elke variant gelijk, het verschil is de bespaarde overhead.
+
+Vereisten:
+- Daheng Galaxy SDK geïnstalleerd (alleen voor de meting met camera)
+- gxipy Python-pakket
+
+Datum:   2026-10-17
+Versie:  1.01 (microbenchmark zonder camera)
+"""
+
+# ------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------
+from DahengAvansLibrary.dahengCameraLibrary import dahengCamera  # Wrapper voor Daheng-camera’s
+from gxipy.gxwrapper import GxFrameBuffer, GxStatusList
+from ctypes import CFUNCTYPE, POINTER, byref, c_int, c_uint, c_void_p, cast, pointer
+from types import SimpleNamespace
+import ctypes
+import importlib
+import importlib.util
+import time
+
+AANTAL_FRAMES = 2000        # Aantal frames per meting
+AANTAL_AANROEPEN = 200000   # Aantal dq+q-aanroepen per meting zonder camera
+TIMEOUT = 1000              # Timeout per frame in ms
+NEP_HANDLE = 1              # Device handle voor de metingen zonder camera
+
+DQ_BUF_PROTOTYPE = CFUNCTYPE(c_int, c_void_p, POINTER(POINTER(GxFrameBuffer)), c_uint)
+Q_BUF_PROTOTYPE = CFUNCTYPE(c_int, c_void_p, POINTER(GxFrameBuffer))
+
+
+# ------------------------------------------------------------
+# Metingen
+# ------------------------------------------------------------
+def meet_dq_buf(data_stream, zero_copy):
+    """Meet DataStream.dq_buf/q_buf; retourneert (frames, verstreken tijd, tijd in dq/q)."""
+    frames = 0
+    tijd_in_aanroepen = 0.0
+    start = time.perf_counter()
+    for _ in range(AANTAL_FRAMES):
+        t0 = time.perf_counter()
+        raw_image = data_stream.dq_buf(TIMEOUT, zero_copy)
+        if raw_image is None:
+            continue
+        data_stream.q_buf(raw_image)
+        tijd_in_aanroepen += time.perf_counter() - t0
+        frames += 1
+    return frames, time.perf_counter() - start, tijd_in_aanroepen
+
+
+def meet_hot_path(data_stream):
+    """Meet de voorbereide hot path; retourneert (frames, verstreken tijd, tijd in dq/q)."""
+    hot_path = data_stream.prepare_dq_buf(TIMEOUT)
+    frames = 0
+    tijd_in_aanroepen = 0.0
+    start = time.perf_counter()
+    for _ in range(AANTAL_FRAMES):
+        t0 = time.perf_counter()
+        frame_buffer = hot_path.dq_buf()
+        if frame_buffer is None:
+            continue
+        hot_path.q_buf(frame_buffer)
+        tijd_in_aanroepen += time.perf_counter() - t0
+        frames += 1
+    return frames, time.perf_counter() - start, tijd_in_aanroepen
+
+
+# ------------------------------------------------------------
+# Metingen zonder camera
+# ------------------------------------------------------------
+def maak_nep_sdk():
+    """
+    Maak vervangers voor GXDQBuf/GXQBuf die direct een vast frame teruggeven.
+    Net als de functies van een geladen bibliotheek hebben ze nog geen argtypes/restype.
+    """
+    frame_ptr = pointer(GxFrameBuffer())
+
+    def dq_buf(handle, pp_frame_buffer, time_out):
+        pp_frame_buffer[0] = frame_ptr
+        return GxStatusList.SUCCESS
+
+    def q_buf(handle, p_frame_buffer):
+        return GxStatusList.SUCCESS
+
+    # De callbacks moeten blijven bestaan zolang de functies gebruikt worden
+    dq_callback = DQ_BUF_PROTOTYPE(dq_buf)
+    q_callback = Q_BUF_PROTOTYPE(q_buf)
+    return SimpleNamespace(GXDQBuf=CFUNCTYPE(c_int)(cast(dq_callback, c_void_p).value),
+                           GXQBuf=CFUNCTYPE(c_int)(cast(q_callback, c_void_p).value),
+                           callbacks=(dq_callback, q_callback))
+
+
+def meet_binding_per_aanroep(sdk):
+    """Meet dq+q met argtypes/restype per aanroep, zoals gx_dq_buf/gx_q_buf eerder; retourneert µs per dq+q."""
+    def gx_dq_buf(handle, pp_frame_buffer, time_out):
+        handle_c = c_void_p()
+        handle_c.value = handle
+        time_out_c = c_uint()
+        time_out_c.value = time_out
+        sdk.GXDQBuf.argtypes = [c_void_p, POINTER(POINTER(GxFrameBuffer)), c_uint]
+        sdk.GXDQBuf.restype = c_int
+        return sdk.GXDQBuf(handle_c, pp_frame_buffer, time_out_c)
+
+    def gx_q_buf(handle, p_frame_buffer):
+        handle_c = c_void_p()
+        handle_c.value = handle
+        sdk.GXQBuf.argtypes = [c_void_p, POINTER(GxFrameBuffer)]
+        sdk.GXQBuf.restype = c_int
+        return sdk.GXQBuf(handle_c, p_frame_buffer)
+
+    return meet_dq_q(gx_dq_buf, gx_q_buf, GxFrameBuffer)
+
+
+def laad_gxwrapper(sdk):
+    """
+    Laad een eigen kopie van gxipy.gxwrapper waarin de SDK-bibliotheek door sdk vervangen is, zodat
+    gx_dq_buf/gx_q_buf en hun eenmalig ingestelde prototypes ook zonder Galaxy SDK bestaan.
+    """
+    gxwrapper = importlib.import_module("gxipy.gxwrapper")
+    spec = importlib.util.spec_from_file_location("gxwrapper_nep_sdk", gxwrapper.__file__)
+    module = importlib.util.module_from_spec(spec)
+
+    # gxwrapper laadt de bibliotheek met CDLL (Linux) of WinDLL (Windows)
+    laders = {naam: getattr(ctypes, naam) for naam in ("CDLL", "WinDLL") if hasattr(ctypes, naam)}
+    for naam in laders:
+        setattr(ctypes, naam, lambda *args, **kwargs: sdk)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        for naam, lader in laders.items():
+            setattr(ctypes, naam, lader)
+    return module
+
+
+def meet_vaste_prototypes(sdk):
+    """Meet dq+q via gx_dq_buf/gx_q_buf van gxwrapper (eenmalig ingestelde prototypes); retourneert µs per dq+q."""
+    gxwrapper = laad_gxwrapper(sdk)
+    return meet_dq_q(gxwrapper.gx_dq_buf, gxwrapper.gx_q_buf, gxwrapper.GxFrameBuffer)
+
+
+def meet_dq_q(gx_dq_buf, gx_q_buf, frame_buffer_type):
+    """Meet dq+q via de opgegeven gx_dq_buf/gx_q_buf, zoals DataStream die aanroept; retourneert µs per dq+q."""
+    start = time.perf_counter()
+    for _ in range(AANTAL_AANROEPEN):
+        ptr_frame_buffer = POINTER(frame_buffer_type)()
+        status = gx_dq_buf(NEP_HANDLE, byref(ptr_frame_buffer), TIMEOUT)
+        if status == GxStatusList.SUCCESS:
+            frame_buffer = ptr_frame_buffer.contents
+            gx_q_buf(NEP_HANDLE, ptr_frame_buffer)
+    return 1e6 * (time.perf_counter() - start) / AANTAL_AANROEPEN
+
+
+def meet_hot_path_zonder_camera(sdk):
+    """Meet dq+q via DqBufHotPath; retourneert µs per dq+q."""
+    sdk.GXDQBuf.argtypes = [c_void_p, POINTER(POINTER(GxFrameBuffer)), c_uint]
+    sdk.GXDQBuf.restype = c_int
+    sdk.GXQBuf.argtypes = [c_void_p, POINTER(GxFrameBuffer)]
+    sdk.GXQBuf.restype = c_int
+
+    # DqBufHotPath bindt de SDK-functies in de constructor; laat het de vervangers binden
+    hot_path_module = importlib.import_module("gxipy.DqBufHotPath")
+    dll = hot_path_module.dll
+    hot_path_module.dll = sdk
+    try:
+        hot_path = hot_path_module.DqBufHotPath(NEP_HANDLE, TIMEOUT)
+    finally:
+        hot_path_module.dll = dll
+
+    start = time.perf_counter()
+    for _ in range(AANTAL_AANROEPEN):
+        frame_buffer = hot_path.dq_buf()
+        hot_path.q_buf(frame_buffer)
+    return 1e6 * (time.perf_counter() - start) / AANTAL_AANROEPEN
+
+
+def meet_zonder_camera():
+    """Meet de ctypes-overhead per dq+q-aanroep zonder camera en druk het resultaat af."""
+    print(f"Zonder camera, gemiddelde van {AANTAL_AANROEPEN} dq+q-aanroepen:")
+    per_aanroep = meet_binding_per_aanroep(maak_nep_sdk())
+    vaste_prototypes = meet_vaste_prototypes(maak_nep_sdk())
+    hot_path = meet_hot_path_zonder_camera(maak_nep_sdk())
+    print(f"{'argtypes per aanroep':<24} {per_aanroep:10.2f} µs per dq+q")
+    print(f"{'vaste prototypes':<24} {vaste_prototypes:10.2f} µs per dq+q "
+          f"({per_aanroep - vaste_prototypes:.2f} µs sneller)")
+    print(f"{'DqBufHotPath':<24} {hot_path:10.2f} µs per dq+q "
+          f"({per_aanroep - hot_path:.2f} µs sneller)")
+
+
+def toon_resultaat(naam, resultaat):
+    """Druk het resultaat van één meting af."""
+    frames, verstreken, tijd_in_aanroepen = resultaat
+    if frames == 0:
+        print(f"{naam:<24} geen frames ontvangen")
+        return
+    print(f"{naam:<24} {frames / verstreken:10.1f} fps {1e6 * tijd_in_aanroepen / frames:10.1f} µs per dq+q")
+
+
+# ------------------------------------------------------------
+# Hoofdfunctie
+# ------------------------------------------------------------
+def main():
+    meet_zonder_camera()
+
+    if importlib.import_module("gxipy.gxwrapper").dll is None:
+        print("Galaxy SDK niet gevonden, alleen de meting zonder camera is uitgevoerd.")
+        return
+
+    camera = dahengCamera(1)
+
+    if not camera.isOpen():
+        print("❌ Geen camera gevonden of kan camera niet openen, alleen de meting zonder camera is uitgevoerd.")
+        return
+
+    print("Met camera:")
+
+    camera.startStream()
+    data_stream = camera.cam.data_stream[0]
+
+    # Eerste meting als opwarmronde herhalen, zodat alle buffers al in gebruik zijn geweest
+    meet_dq_buf(data_stream, False)
+
+    toon_resultaat("dq_buf (kopie)", meet_dq_buf(data_stream, False))
+    toon_resultaat("dq_buf (zero_copy)", meet_dq_buf(data_stream, True))
+    toon_resultaat("prepare_dq_buf", meet_hot_path(data_stream))
+
+    camera.stopStream()
+    camera.close()
+
+
+# ------------------------------------------------------------
+# Startpunt van het script
+# ------------------------------------------------------------
+if __name__ == "__main__":
+    main()
@@ -72,6 +72,9 @@ def main():
     # --------------------------------------------------------
     camera.startStream()
 
+    # De hoofd-lus schrijft elke keer ExposureTime en Gain: schrijf alleen als de schuifbalk is verplaatst
+    camera.setWriteSuppression(True)
+
     # --------------------------------------------------------
     # Maak OpenCV-venster en trackbar voor ExposureTime
     # --------------------------------------------------------
@@ -47,15 +47,16 @@ def set_cam_parameters_and_start_acquisition(cam_list):
     print("setting cam ActionCommand parameters")
     for cam, sn in cam_list:
         remote_device_feature = cam.get_remote_device_feature_control()
-        # load default parameters
-        remote_device_feature.get_enum_feature("UserSetSelector").set("Default")
-        remote_device_feature.get_command_feature("UserSetLoad").send_command()
-        # trigger setting
-        remote_device_feature.get_enum_feature("TriggerMode").set("On")
-        remote_device_feature.get_enum_feature("TriggerSource").set("Action0")
-        remote_device_feature.get_int_feature("ActionDeviceKey").set(1)
-        remote_device_feature.get_int_feature("ActionGroupKey").set(1)
-        remote_device_feature.get_int_feature("ActionGroupMask").set(0xFFFFFFFF)
+        # load default parameters and trigger setting in one call
+        failures = remote_device_feature.apply({"UserSetSelector": "Default",
+                                                "UserSetLoad": None,
+                                                "TriggerMode": "On",
+                                                "TriggerSource": "Action0",
+                                                "ActionDeviceKey": 1,
+                                                "ActionGroupKey": 1,
+                                                "ActionGroupMask": 0xFFFFFFFF})
+        for feature_name, error in failures.items():
+            print("SN:", sn, " set", feature_name, "failed:", error)
         # start acquisition
         cam.stream_on()
     print("setting success")
@@ -0,0 +1,109 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+from gxipy.Exception import *
+import asyncio
+
+
+class AsyncFrameIterator:
+    def __init__(self, data_stream, max_queue):
+        """
+        :brief      Constructor for instance initialization, use DataStream.aframes to create an iterator
+        :param      data_stream:    DataStream object the frames come from
+        :param      max_queue:      bounded queue size, the oldest frame is dropped while the queue is full
+        """
+        if not isinstance(max_queue, int):
+            raise ParameterTypeError("AsyncFrameIterator.__init__: "
+                                     "Expected max_queue type is int, not %s" % type(max_queue))
+
+        if max_queue < 1:
+            raise OutOfRange("AsyncFrameIterator.__init__: max_queue out of bounds, minimum=1")
+
+        self.__data_stream = data_stream
+        self.__max_queue = max_queue
+        self.__loop = None
+        self.__queue = None
+        self.__closed = False
+        self.__dropped_count = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.__closed:
+            raise StopAsyncIteration
+
+        if self.__queue is None:
+            self.__start()
+
+        image = await self.__queue.get()
+        if image is None:
+            raise StopAsyncIteration
+        return image
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+        return False
+
+    async def aclose(self):
+        """
+        :brief      Stop delivering frames and unregister the capture callback
+        :return:    none
+        """
+        self.close()
+
+    def close(self):
+        """
+        :brief      Stop delivering frames and unregister the capture callback, a pending
+                    __anext__ ends the iteration
+        :return:    none
+        """
+        if self.__closed:
+            return
+
+        self.__closed = True
+        if self.__queue is not None:
+            self.__data_stream.unregister_capture_callback()
+            self.__put(None)
+
+    def get_dropped_count(self):
+        """
+        :brief      Get the number of frames dropped because the consumer was too slow
+        :return:    dropped frame count
+        """
+        return self.__dropped_count
+
+    def __start(self):
+        """
+        :brief      Bind to the running event loop and register the capture callback
+        :return:    none
+        """
+        self.__loop = asyncio.get_running_loop()
+        self.__queue = asyncio.Queue(self.__max_queue)
+
+        def on_capture(raw_image):
+            try:
+                self.__loop.call_soon_threadsafe(self.__put, raw_image)
+            except RuntimeError:
+                # event loop already closed
+                pass
+
+        self.__data_stream.register_capture_callback(on_capture)
+
+    def __put(self, image):
+        """
+        :brief      Put a frame into the queue on the event loop thread, drops the oldest frame when full
+        :param      image:  RawImage object, None ends the iteration
+        :return:    none
+        """
+        if self.__closed and image is not None:
+            return
+
+        if self.__queue.full():
+            self.__queue.get_nowait()
+            self.__dropped_count += 1
+        self.__queue.put_nowait(image)
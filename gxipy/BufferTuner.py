@@ -0,0 +1,263 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+from gxipy.gxidef import *
+from gxipy.Exception import *
+import threading
+import time
+import sys
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+# number of quiet sample intervals before the buffer number is shrunk
+TUNER_SHRINK_QUIET_INTERVALS = 10
+
+
+class BufferTuner:
+    def __init__(self, data_stream, memory_budget, min_buffer_num, max_buffer_num, interval):
+        """
+        :brief      Constructor for instance initialization, use DataStream.start_buffer_tuning to create a tuner
+        :param      data_stream:        DataStream object to tune
+        :param      memory_budget:      maximum memory of the acquisition buffers, unit: byte
+        :param      min_buffer_num:     minimum acquisition buffer number, range:[1, 0xFFFFFFFF]
+        :param      max_buffer_num:     maximum acquisition buffer number, range:[min_buffer_num, 0xFFFFFFFF]
+        :param      interval:           sample interval, unit: second
+        """
+        if not isinstance(memory_budget, INT_TYPE):
+            raise ParameterTypeError("BufferTuner.__init__: "
+                                     "Expected memory_budget type is int, not %s" % type(memory_budget))
+
+        if not isinstance(min_buffer_num, INT_TYPE):
+            raise ParameterTypeError("BufferTuner.__init__: "
+                                     "Expected min_buffer_num type is int, not %s" % type(min_buffer_num))
+
+        if not isinstance(max_buffer_num, INT_TYPE):
+            raise ParameterTypeError("BufferTuner.__init__: "
+                                     "Expected max_buffer_num type is int, not %s" % type(max_buffer_num))
+
+        if not isinstance(interval, (INT_TYPE, float)):
+            raise ParameterTypeError("BufferTuner.__init__: "
+                                     "Expected interval type is float, not %s" % type(interval))
+
+        if min_buffer_num < 1 or max_buffer_num < min_buffer_num or max_buffer_num > UNSIGNED_INT_MAX:
+            raise OutOfRange("BufferTuner.__init__: buffer number out of bounds, "
+                             "1 <= min_buffer_num <= max_buffer_num <= %s" % hex(UNSIGNED_INT_MAX).__str__())
+
+        if memory_budget <= 0 or interval <= 0:
+            raise OutOfRange("BufferTuner.__init__: memory_budget and interval must be greater than 0")
+
+        self.__data_stream = data_stream
+        self.__memory_budget = memory_budget
+        self.__min_buffer_num = min_buffer_num
+        self.__max_buffer_num = max_buffer_num
+        self.__interval = interval
+        self.__buffer_num = min_buffer_num
+        self.__applied_buffer_num = None
+        self.__socket_buffer_size = None
+        self.__max_num_queue_buffer = None
+        self.__lock = threading.Lock()
+        self.__stop_event = threading.Event()
+        self.__thread = None
+        self.__history = []
+        self.__last_counts = None
+        self.__quiet_intervals = 0
+        self.__request_time = None
+        self.__frame_time = None
+        self.__max_latency = 0.0
+
+    def start(self):
+        """
+        :brief      Start the sample thread
+        :return:    none
+        """
+        if self.__thread is not None:
+            return
+
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__tune_loop, name="BufferTuner")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        :brief      Stop the sample thread, the tuned values stay in effect
+        :return:    none
+        """
+        self.__stop_event.set()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+    def is_running(self):
+        """
+        :brief      Whether the sample thread is running
+        :return:    True/False
+        """
+        return self.__thread is not None
+
+    def get_buffer_num(self):
+        """
+        :brief      Get the tuned acquisition buffer number
+        :return:    buffer number
+        """
+        return self.__buffer_num
+
+    def get_history(self):
+        """
+        :brief      Get the list of changes made by the tuner
+        :return:    list of dict: time, name, old, new, reason
+        """
+        with self.__lock:
+            return list(self.__history)
+
+    def on_request(self):
+        """
+        :brief      Called by DataStream when the consumer asks for the next frame
+        :return:    none
+        """
+        frame_time = self.__frame_time
+        if frame_time is not None:
+            latency = time.monotonic() - frame_time
+            if latency > self.__max_latency:
+                self.__max_latency = latency
+            self.__frame_time = None
+
+    def on_frame(self):
+        """
+        :brief      Called by DataStream when a frame has been handed to the consumer
+        :return:    none
+        """
+        self.__frame_time = time.monotonic()
+
+    def apply(self):
+        """
+        :brief      Apply the tuned values that need a stopped stream, called by Device.start_streams and
+                    Device.stream_on before the acquisition starts
+        :return:    none
+        """
+        if self.__applied_buffer_num != self.__buffer_num:
+            self.__data_stream.set_acquisition_buffer_number(self.__buffer_num)
+            self.__applied_buffer_num = self.__buffer_num
+
+        self.__apply_gev_feature('SocketBufferSize', self.__socket_buffer_size)
+        self.__apply_gev_feature('MaxNumQueueBuffer', self.__max_num_queue_buffer)
+
+    def sample(self):
+        """
+        :brief      Run one tuning step: grow the buffer number on lost frames or a slow consumer,
+                    shrink it after TUNER_SHRINK_QUIET_INTERVALS quiet intervals
+        :return:    none
+        """
+        if self.__data_stream.acquisition_flag is False:
+            self.__last_counts = None
+            return
+
+        counts = (self.__data_stream.StreamLostFrameCount.get(),
+                  self.__data_stream.StreamIncompleteFrameCount.get(),
+                  self.__data_stream.StreamDeliveredFrameCount.get())
+        last_counts = self.__last_counts
+        self.__last_counts = counts
+        if last_counts is None:
+            return
+
+        lost, incomplete, delivered = [max(0, now - last) for now, last in zip(counts, last_counts)]
+        max_latency = self.__max_latency
+        self.__max_latency = 0.0
+
+        # frames that arrive while the consumer is busy with one frame
+        frame_rate = delivered / self.__interval
+        latency_frames = int(max_latency * frame_rate) + 1
+
+        budget_buffer_num = self.__memory_budget // max(1, self.__data_stream.payload_size)
+        upper = max(self.__min_buffer_num, min(self.__max_buffer_num, budget_buffer_num))
+
+        if lost > 0 or latency_frames > self.__buffer_num // 2:
+            self.__quiet_intervals = 0
+            new_buffer_num = min(upper, max(self.__buffer_num * 2, latency_frames * 2))
+            reason = "lost %d frames, consumer latency %.1f ms" % (lost, max_latency * 1000)
+            self.__change_buffer_num(new_buffer_num, reason)
+        else:
+            self.__quiet_intervals += 1
+            if self.__quiet_intervals >= TUNER_SHRINK_QUIET_INTERVALS and latency_frames < self.__buffer_num // 4:
+                self.__quiet_intervals = 0
+                new_buffer_num = max(self.__min_buffer_num, self.__buffer_num - max(1, self.__buffer_num // 4))
+                reason = "no lost frames in %d intervals" % TUNER_SHRINK_QUIET_INTERVALS
+                self.__change_buffer_num(new_buffer_num, reason)
+
+        if incomplete > 0:
+            self.__grow_gev_feature('SocketBufferSize', "incomplete %d frames" % incomplete)
+            self.__grow_gev_feature('MaxNumQueueBuffer', "incomplete %d frames" % incomplete)
+
+    def __tune_loop(self):
+        """
+        :brief      Sample thread
+        :return:    none
+        """
+        while not self.__stop_event.wait(self.__interval):
+            try:
+                self.sample()
+            except Exception as error:
+                print("BufferTuner: sample failed, %s" % error)
+
+    def __record(self, name, old, new, reason):
+        """
+        :brief      Record and print a change
+        :return:    none
+        """
+        with self.__lock:
+            self.__history.append({'time': time.time(), 'name': name, 'old': old, 'new': new, 'reason': reason})
+        print("BufferTuner: %s %s -> %s (%s)" % (name, old, new, reason))
+
+    def __change_buffer_num(self, new_buffer_num, reason):
+        """
+        :brief      Change the acquisition buffer number, it takes effect at the next stream start
+        :return:    none
+        """
+        if new_buffer_num == self.__buffer_num:
+            return
+
+        self.__record('AcquisitionBufferNumber', self.__buffer_num, new_buffer_num, reason)
+        self.__buffer_num = new_buffer_num
+        if self.__data_stream.acquisition_flag is False:
+            self.apply()
+
+    def __grow_gev_feature(self, name, reason):
+        """
+        :brief      Double a GEV stream feature within its range, it is written now when writable,
+                    otherwise at the next stream start
+        :param      name:   'SocketBufferSize' or 'MaxNumQueueBuffer'
+        :return:    none
+        """
+        feature = getattr(self.__data_stream, name, None)
+        if feature is None or not feature.is_implemented():
+            return
+
+        int_range = feature.get_range()
+        old = feature.get()
+        new = min(int_range["max"], old * 2)
+        if int_range["inc"] > 1:
+            new -= (new - int_range["min"]) % int_range["inc"]
+        if new <= old:
+            return
+
+        self.__record(name, old, new, reason)
+        if name == 'SocketBufferSize':
+            self.__socket_buffer_size = new
+        else:
+            self.__max_num_queue_buffer = new
+        self.__apply_gev_feature(name, new)
+
+    def __apply_gev_feature(self, name, value):
+        """
+        :brief      Write a GEV stream feature when it is writable
+        :return:    none
+        """
+        feature = getattr(self.__data_stream, name, None)
+        if value is None or feature is None or not feature.is_writable():
+            return
+
+        feature.set(value)
@@ -12,10 +12,28 @@ from gxipy.Interface import *
 from gxipy.Feature import *
 from gxipy.Exception import *
 from gxipy.ImageProc import *
+from gxipy.FrameGrabber import *
+from gxipy.FrameDescriptor import *
+from gxipy.DqBufHotPath import *
+from gxipy.BufferTuner import *
+from gxipy.FrameStatistics import *
+from gxipy.PreviewTap import *
 import ctypes
 import types
+import threading
+import weakref
+
+if sys.version_info.major > 2:
+    from gxipy.AsyncFrameIterator import *
 
 class DataStream:
+    StreamAnnouncedBufferCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_ANNOUNCED_BUFFER_COUNT)
+    StreamDeliveredFrameCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_DELIVERED_FRAME_COUNT)
+    StreamLostFrameCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_LOST_FRAME_COUNT)
+    StreamIncompleteFrameCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_INCOMPLETE_FRAME_COUNT)
+    StreamDeliveredPacketCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_DELIVERED_PACKET_COUNT)
+    StreamBufferHandlingMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_STREAM_BUFFER_HANDLING_MODE)
+
     def __init__(self, dev_handle, stream_handle):
         """
         :brief  Constructor for instance initialization
@@ -26,20 +44,31 @@ class DataStream:
 
         self.__c_capture_callback = CAP_CALL(self.__on_capture_callback)
         self.__py_capture_callback = None
+        self.__capture_fast_mode = False
 
-        self.StreamAnnouncedBufferCount = IntFeature(self.__dev_handle, GxFeatureID.INT_ANNOUNCED_BUFFER_COUNT)
-        self.StreamDeliveredFrameCount = IntFeature(self.__dev_handle, GxFeatureID.INT_DELIVERED_FRAME_COUNT)
-        self.StreamLostFrameCount = IntFeature(self.__dev_handle, GxFeatureID.INT_LOST_FRAME_COUNT)
-        self.StreamIncompleteFrameCount = IntFeature(self.__dev_handle, GxFeatureID.INT_INCOMPLETE_FRAME_COUNT)
-        self.StreamDeliveredPacketCount = IntFeature(self.__dev_handle, GxFeatureID.INT_DELIVERED_PACKET_COUNT)
-        self.StreamBufferHandlingMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_STREAM_BUFFER_HANDLING_MODE)
         self.payload_size = 0
         self.acquisition_flag = False
         self.__data_stream_handle = stream_handle
         self.__stream_feature_control = FeatureControl(stream_handle)
         self.__frame_buf_map = {}
+        self.__frame_image_map = {}
         self.__register_buf_param_map = {}
         self.__register_buf_param_content_map = {}
+        self.__buffer_pool_num = 0
+        self.__buffer_pool_block = None
+        self.__buffer_pool_generation = 0
+        self.__buffer_pool_free = []
+        self.__buffer_pool_used = []
+        self.__buffer_pool_lock = threading.Lock()
+        self.__buffer_pool_served_count = 0
+        self.__buffer_pool_reuse_count = 0
+        self.__buffer_pool_exhausted_count = 0
+        self.__frame_grabber = None
+        self.__background_grab_param = None
+        self.__buffer_tuner = None
+        self.__frame_statistics = FrameStatistics()
+        self.__preview_tap = None
+        self.__dq_buf_hot_path = None
 
     def get_feature_control(self):
         """
@@ -48,6 +77,13 @@ class DataStream:
         """
         return self.__stream_feature_control
 
+    def get_feature_handle(self):
+        """
+        :brief      Get the handle the feature attributes are created with
+        :return:    Device handle
+        """
+        return self.__dev_handle
+
     def get_payload_size(self):
         """
         :brief      Get device stream payload size
@@ -77,13 +113,22 @@ class DataStream:
             print("DataStream.get_image: Current data steam don't  start acquisition")
             return None
 
+        if self.__buffer_tuner is not None:
+            self.__buffer_tuner.on_request()
+
         frame_data = GxFrameData()
         frame_data.image_size = self.payload_size
         frame_data.image_buf = None
-        image = RawImage(frame_data)
+        image = RawImage(frame_data, image_buffer=self.__acquire_pool_buffer())
 
         status = gx_get_image(self.__dev_handle, image.frame_data, timeout)
         if status == GxStatusList.SUCCESS:
+            if self.__buffer_tuner is not None:
+                self.__buffer_tuner.on_frame()
+            self.__frame_statistics.update(frame_data.frame_id, frame_data.timestamp, frame_data.status)
+            if self.__preview_tap is not None:
+                self.__preview_tap.offer(frame_data)
+
             try:
                 if sys.platform != 'linux2' and sys.platform != 'linux':
                     image.user_param = self.__register_buf_param_content_map[frame_data.user_param]
@@ -97,7 +142,17 @@ class DataStream:
             StatusProcessor.process(status, 'DataStream', 'get_image')
             return None
 
-    def dq_buf(self, timeout=1000):
+    def dq_buf(self, timeout=1000, zero_copy=False):
+        """
+        :brief          Dequeue a frame buffer from the SDK, give it back with q_buf
+        :param          timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :param          zero_copy:  True:  the image maps the SDK frame buffer without copying,
+                                           accessing its data after q_buf raises InvalidCall. Numpy
+                                           arrays of get_numpy_array are read only and not checked,
+                                           copy them before q_buf
+                                    False: the image data is copied
+        :return:        image object
+        """
         if not isinstance(timeout, INT_TYPE):
             raise ParameterTypeError("DataStream.dq_buf: "
                                      "Expected timeout type is int, not %s" % type(timeout))
@@ -115,41 +170,131 @@ class DataStream:
             print("DataStream.get_image: Current data steam don't  start acquisition")
             return None
 
+        if self.__buffer_tuner is not None:
+            self.__buffer_tuner.on_request()
+
         ptr_frame_buffer = ctypes.POINTER(GxFrameBuffer)()
         status = gx_dq_buf(self.__dev_handle, ctypes.byref(ptr_frame_buffer), timeout)
         if status == GxStatusList.SUCCESS:
-            frame_buffer = ptr_frame_buffer.contents
-            self.__frame_buf_map[frame_buffer.buf_id] = ptr_frame_buffer
-            frame_data = GxFrameData()
-            frame_data.status = frame_buffer.status
-            frame_data.image_buf = frame_buffer.image_buf
-            frame_data.width = frame_buffer.width
-            frame_data.height = frame_buffer.height
-            frame_data.pixel_format = frame_buffer.pixel_format
-            frame_data.image_size = frame_buffer.image_size
-            frame_data.frame_id = frame_buffer.frame_id
-            frame_data.timestamp = frame_buffer.timestamp
-            frame_data.user_param = frame_buffer.user_param
-            frame_data.buf_id = frame_buffer.buf_id
-            frame_data.chunk_data_handle = frame_buffer.chunk_data_handle
-
-            if sys.platform == 'linux2' or sys.platform == 'linux':
-                frame_data.offset_x = frame_buffer.offset_x
-                frame_data.offset_y = frame_buffer.offset_y
-
-            image = RawImage(frame_data)
-            try:
-                image.user_param = self.__register_buf_param_content_map[frame_data.user_param]
-            except KeyError:
-                image.user_param = None
-
-            return image
+            if self.__buffer_tuner is not None:
+                self.__buffer_tuner.on_frame()
+            return self.__frame_buffer_to_image(ptr_frame_buffer, zero_copy)
         elif status == GxStatusList.TIMEOUT:
             return None
         else:
             StatusProcessor.process(status, 'DataStream', 'dq_buf')
             return None
 
+    def dq_all_bufs(self, max_count, timeout=1000, zero_copy=False):
+        """
+        :brief          Dequeue all the frame buffers already acquired in one call, at most max_count,
+                        give them back with q_all_bufs
+        :param          max_count:  maximum number of frames, range:[1, 0xFFFFFFFF]
+        :param          timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :param          zero_copy:  True:  the images map the SDK frame buffers without copying,
+                                           accessing their data after q_all_bufs raises InvalidCall
+                                    False: the image data is copied
+        :return:        image object list, empty on timeout
+        """
+        if not hasattr(dll, 'GXDQAllBufs'):
+            raise NoImplemented("DataStream.dq_all_bufs: GXDQAllBufs is not supported by this GxIAPI version")
+
+        if not isinstance(max_count, INT_TYPE):
+            raise ParameterTypeError("DataStream.dq_all_bufs: "
+                                     "Expected max_count type is int, not %s" % type(max_count))
+
+        if not isinstance(timeout, INT_TYPE):
+            raise ParameterTypeError("DataStream.dq_all_bufs: "
+                                     "Expected timeout type is int, not %s" % type(timeout))
+
+        if (max_count < 1) or (max_count > UNSIGNED_INT_MAX):
+            print("DataStream.dq_all_bufs: "
+                  "max_count out of bounds, minimum=1, maximum=%s"
+                  % hex(UNSIGNED_INT_MAX).__str__())
+            return []
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            print("DataStream.dq_all_bufs: "
+                  "timeout out of bounds, minimum=0, maximum=%s"
+                  % hex(UNSIGNED_INT_MAX).__str__())
+            return []
+
+        if self.__py_capture_callback != None:
+            raise InvalidCall("Can't call dq_all_bufs after register capture callback")
+
+        if self.acquisition_flag is False:
+            print("DataStream.dq_all_bufs: Current data steam don't  start acquisition")
+            return []
+
+        ptr_frame_buffer_array = (ctypes.POINTER(GxFrameBuffer) * max_count)()
+        status, frame_count = gx_dequeue_all_bufs(self.__dev_handle, ptr_frame_buffer_array, max_count, timeout)
+        if status == GxStatusList.SUCCESS:
+            return [self.__frame_buffer_to_image(ptr_frame_buffer_array[i], zero_copy) for i in range(frame_count)]
+        elif status == GxStatusList.TIMEOUT:
+            return []
+        else:
+            StatusProcessor.process(status, 'DataStream', 'dq_all_bufs')
+            return []
+
+    def __frame_buffer_to_image(self, ptr_frame_buffer, zero_copy):
+        """
+        :brief          Create the image object of a dequeued frame buffer and record the buffer for q_buf
+        :param          ptr_frame_buffer:   GxFrameBuffer pointer
+        :param          zero_copy:          map the frame buffer without copying
+        :return:        image object
+        """
+        frame_buffer = ptr_frame_buffer.contents
+        self.__frame_statistics.update(frame_buffer.frame_id, frame_buffer.timestamp, frame_buffer.status)
+        if self.__preview_tap is not None:
+            self.__preview_tap.offer(frame_buffer)
+        frame_data = GxFrameData()
+        frame_data.status = frame_buffer.status
+        frame_data.image_buf = frame_buffer.image_buf
+        frame_data.width = frame_buffer.width
+        frame_data.height = frame_buffer.height
+        frame_data.pixel_format = frame_buffer.pixel_format
+        frame_data.image_size = frame_buffer.image_size
+        frame_data.frame_id = frame_buffer.frame_id
+        frame_data.timestamp = frame_buffer.timestamp
+        frame_data.user_param = frame_buffer.user_param
+        frame_data.buf_id = frame_buffer.buf_id
+        frame_data.chunk_data_handle = frame_buffer.chunk_data_handle
+
+        if sys.platform == 'linux2' or sys.platform == 'linux':
+            frame_data.offset_x = frame_buffer.offset_x
+            frame_data.offset_y = frame_buffer.offset_y
+
+        image = RawImage(frame_data, zero_copy)
+        try:
+            image.user_param = self.__register_buf_param_content_map[frame_data.user_param]
+        except KeyError:
+            image.user_param = None
+
+        self.__frame_buf_map[frame_buffer.buf_id] = ptr_frame_buffer
+        self.__frame_image_map[frame_buffer.buf_id] = weakref.ref(image)
+        return image
+
+    def prepare_dq_buf(self, timeout=1000):
+        """
+        :brief          Prepare a dq_buf/q_buf path with the ctypes setup bound once, for high frame rates.
+                        It returns the SDK GxFrameBuffer without creating RawImage objects or copying data.
+        :param          timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :return:        DqBufHotPath object
+        """
+        if not isinstance(timeout, INT_TYPE):
+            raise ParameterTypeError("DataStream.prepare_dq_buf: "
+                                     "Expected timeout type is int, not %s" % type(timeout))
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            raise OutOfRange("DataStream.prepare_dq_buf: timeout out of bounds, minimum=0, maximum=%s"
+                             % hex(UNSIGNED_INT_MAX).__str__())
+
+        if self.__py_capture_callback != None:
+            raise InvalidCall("Can't call prepare_dq_buf after register capture callback")
+
+        self.__dq_buf_hot_path = DqBufHotPath(self.__dev_handle, timeout, self.__frame_statistics, self.__preview_tap)
+        return self.__dq_buf_hot_path
+
     def q_buf(self, image):
         if not isinstance(image, RawImage):
             raise ParameterTypeError("DataStream.q_buf: "
@@ -172,6 +317,34 @@ class DataStream:
         status = gx_q_buf(self.__dev_handle, ptr_frame_buffer)
         StatusProcessor.process(status, 'DataStream', 'q_buf')
         self.__frame_buf_map.pop(image.frame_data.buf_id)
+        self.__frame_image_map.pop(image.frame_data.buf_id, None)
+        image.release()
+
+    def q_all_bufs(self):
+        """
+        :brief      Give all the dequeued frame buffers back to the SDK, zero-copy images of
+                    these buffers become invalid
+        :return:    none
+        """
+        if not hasattr(dll, 'GXQAllBufs'):
+            raise NoImplemented("DataStream.q_all_bufs: GXQAllBufs is not supported by this GxIAPI version")
+
+        if self.acquisition_flag is False:
+            print("DataStream.q_all_bufs: Current data steam don't  start acquisition")
+            return
+
+        if self.__py_capture_callback != None:
+            raise InvalidCall("Can't call q_all_bufs after register capture callback")
+
+        status = gx_queue_all_bufs(self.__dev_handle)
+        StatusProcessor.process(status, 'DataStream', 'q_all_bufs')
+
+        for image_ref in self.__frame_image_map.values():
+            image = image_ref()
+            if image is not None:
+                image.release()
+        self.__frame_buf_map.clear()
+        self.__frame_image_map.clear()
 
     def flush_queue(self):
         status = gx_flush_queue(self.__dev_handle)
@@ -182,8 +355,26 @@ class DataStream:
         self.payload_size = payload_size
 
     def set_acquisition_flag(self, flag):
+        if flag and not self.acquisition_flag:
+            self.__frame_statistics.restart_sequence()
         self.acquisition_flag = flag
 
+    def stats(self):
+        """
+        :brief      Get a snapshot of the frame sequence statistics of the delivered frames:
+                    frame id gaps, duplicate and out of order frame ids, incomplete frames
+                    and timestamp interval percentiles, See detail in FrameStatistics.snapshot
+        :return:    statistics dict
+        """
+        return self.__frame_statistics.snapshot()
+
+    def reset_stats(self):
+        """
+        :brief      Clear the frame sequence statistics
+        :return:    none
+        """
+        self.__frame_statistics.reset()
+
     def set_acquisition_buffer_number(self, buf_num):
         """
         :brief      set the number of acquisition buffer
@@ -202,16 +393,283 @@ class DataStream:
         status = gx_set_acquisition_buffer_number(self.__dev_handle, buf_num)
         StatusProcessor.process(status, 'DataStream', 'set_acquisition_buffer_number')
 
-    def register_capture_callback(self, callback_func):
+    def set_buffer_pool(self, buffer_num):
+        """
+        :brief      Set the number of preallocated payload-sized buffers used by get_image,
+                    the pool is allocated at stream_on and released at stream_off
+        :param      buffer_num:     the number of pool buffers, 0 disables the pool, range:[0, 0xFFFFFFFF]
+        :return:    none
+        """
+        if not isinstance(buffer_num, INT_TYPE):
+            raise ParameterTypeError("DataStream.set_buffer_pool: "
+                                     "Expected buffer_num type is int, not %s" % type(buffer_num))
+
+        if (buffer_num < 0) or (buffer_num > UNSIGNED_INT_MAX):
+            print("DataStream.set_buffer_pool: "
+                  "buffer_num out of bounds, minimum=0, maximum=%s"
+                  % hex(UNSIGNED_INT_MAX).__str__())
+            return
+
+        self.__buffer_pool_num = buffer_num
+
+    def allocate_buffer_pool(self):
+        """
+        :brief      Allocate the get_image buffer pool with the current payload size,
+                    called by Device.stream_on, nothing is done when the pool is disabled
+        :return:    none
+        """
+        with self.__buffer_pool_lock:
+            self.__buffer_pool_generation += 1
+            self.__buffer_pool_block = None
+            self.__buffer_pool_free = []
+            self.__buffer_pool_used = []
+            if self.__buffer_pool_num == 0 or self.payload_size == 0:
+                return
+
+            self.__buffer_pool_block = (ctypes.c_ubyte * (self.payload_size * self.__buffer_pool_num))()
+            self.__buffer_pool_free = list(range(self.__buffer_pool_num))
+            self.__buffer_pool_used = [False] * self.__buffer_pool_num
+
+    def release_buffer_pool(self):
+        """
+        :brief      Release the get_image buffer pool, called by Device.stream_off.
+                    Images still holding a pool buffer keep their data.
+        :return:    none
+        """
+        with self.__buffer_pool_lock:
+            self.__buffer_pool_generation += 1
+            self.__buffer_pool_block = None
+            self.__buffer_pool_free = []
+            self.__buffer_pool_used = []
+
+    def get_buffer_pool_info(self):
+        """
+        :brief      Get the get_image buffer pool state
+        :return:    dict: buffer_num:       the number of pool buffers
+                          free_num:         the number of buffers ready for the next frame
+                          served_count:     frames served from the pool
+                          reuse_count:      frames served from a buffer that was used before
+                          exhausted_count:  frames that found the pool empty and allocated a new buffer
+        """
+        with self.__buffer_pool_lock:
+            return {
+                'buffer_num': self.__buffer_pool_num if self.__buffer_pool_block is not None else 0,
+                'free_num': len(self.__buffer_pool_free),
+                'served_count': self.__buffer_pool_served_count,
+                'reuse_count': self.__buffer_pool_reuse_count,
+                'exhausted_count': self.__buffer_pool_exhausted_count,
+            }
+
+    def __acquire_pool_buffer(self):
+        """
+        :brief      Take a free buffer from the pool, the buffer goes back to the pool
+                    when the last image or numpy array referring to it is freed
+        :return:    ctypes buffer, or None when the pool is disabled or exhausted
+        """
+        with self.__buffer_pool_lock:
+            if self.__buffer_pool_block is None:
+                return None
+
+            if len(self.__buffer_pool_free) == 0:
+                self.__buffer_pool_exhausted_count += 1
+                return None
+
+            index = self.__buffer_pool_free.pop()
+            self.__buffer_pool_served_count += 1
+            if self.__buffer_pool_used[index]:
+                self.__buffer_pool_reuse_count += 1
+            self.__buffer_pool_used[index] = True
+
+            pool_buffer = (ctypes.c_ubyte * self.payload_size).from_buffer(self.__buffer_pool_block,
+                                                                           index * self.payload_size)
+            weakref.finalize(pool_buffer, self.__recycle_pool_buffer, self.__buffer_pool_generation, index)
+            return pool_buffer
+
+    def __recycle_pool_buffer(self, generation, index):
+        """
+        :brief      Give a pool buffer back, buffers of a released pool are dropped
+        :param      generation:     pool generation the buffer was taken from
+        :param      index:          buffer index in the pool
+        :return:    none
+        """
+        with self.__buffer_pool_lock:
+            if generation == self.__buffer_pool_generation:
+                self.__buffer_pool_free.append(index)
+
+    def start_buffer_tuning(self, memory_budget, min_buffer_num=4, max_buffer_num=64, interval=1.0):
+        """
+        :brief      Start tuning the acquisition buffer number from StreamLostFrameCount,
+                    StreamIncompleteFrameCount and the consumer latency, within a memory budget.
+                    On GEV streams SocketBufferSize and MaxNumQueueBuffer are raised on incomplete frames.
+                    The buffer number takes effect at the next Device.start_streams or Device.stream_on, every
+                    change is printed and recorded in BufferTuner.get_history.
+        :param      memory_budget:      maximum memory of the acquisition buffers, unit: byte
+        :param      min_buffer_num:     minimum acquisition buffer number
+        :param      max_buffer_num:     maximum acquisition buffer number
+        :param      interval:           sample interval, unit: second
+        :return:    BufferTuner object
+        """
+        self.stop_buffer_tuning()
+        self.__buffer_tuner = BufferTuner(self, memory_budget, min_buffer_num, max_buffer_num, interval)
+        if self.acquisition_flag is False:
+            self.__buffer_tuner.apply()
+        self.__buffer_tuner.start()
+        return self.__buffer_tuner
+
+    def stop_buffer_tuning(self):
+        """
+        :brief      Stop the buffer tuning, the tuned values stay in effect
+        :return:    none
+        """
+        if self.__buffer_tuner is not None:
+            self.__buffer_tuner.stop()
+            self.__buffer_tuner = None
+
+    def get_buffer_tuner(self):
+        """
+        :brief      Get the buffer tuning object
+        :return:    BufferTuner object, None when start_buffer_tuning was not called
+        """
+        return self.__buffer_tuner
+
+    def apply_buffer_tuning(self):
+        """
+        :brief      Apply the tuned values that need a stopped stream, called by Device.start_streams and
+                    Device.stream_on
+        :return:    none
+        """
+        if self.__buffer_tuner is not None:
+            self.__buffer_tuner.apply()
+
+    def set_background_grab(self, capacity=8, policy=GxGrabPolicyList.FIFO_DROP_OLDEST, timeout=1000):
+        """
+        :brief      Start a background grab with these parameters whenever Device.start_streams starts this stream
+        :param      capacity:   ring buffer capacity, range:[1, 0xFFFFFFFF], None disables the background grab
+        :param      policy:     ring buffer policy, See detail in GxGrabPolicyList
+        :param      timeout:    get_image timeout of the grab thread, range:[0, 0xFFFFFFFF]
+        :return:    none
+        """
+        if capacity is None:
+            self.__background_grab_param = None
+        else:
+            self.__background_grab_param = (capacity, policy, timeout)
+
+    def get_background_grab_param(self):
+        """
+        :brief      Get the background grab parameters set by set_background_grab
+        :return:    (capacity, policy, timeout), None when disabled
+        """
+        return self.__background_grab_param
+
+    def start_background_grab(self, capacity=8, policy=GxGrabPolicyList.FIFO_DROP_OLDEST, timeout=1000):
+        """
+        :brief      Start a thread that grabs frames continuously into a bounded ring buffer,
+                    consume the frames with FrameGrabber.get_next/get_latest
+        :param      capacity:   ring buffer capacity, range:[1, 0xFFFFFFFF]
+        :param      policy:     ring buffer policy, See detail in GxGrabPolicyList
+        :param      timeout:    get_image timeout of the grab thread, range:[0, 0xFFFFFFFF]
+        :return:    FrameGrabber object
+        """
+        if self.__py_capture_callback != None:
+            raise InvalidCall("Can't start background grab after register capture callback")
+
+        if self.__frame_grabber is not None and self.__frame_grabber.is_running():
+            raise InvalidCall("DataStream.start_background_grab: Background grab is already running")
+
+        self.__frame_grabber = FrameGrabber(self, capacity, policy, timeout)
+        self.__frame_grabber.start()
+        return self.__frame_grabber
+
+    def stop_background_grab(self):
+        """
+        :brief      Stop the background grab thread
+        :return:    none
+        """
+        if self.__frame_grabber is not None:
+            self.__frame_grabber.stop()
+
+    def get_background_grabber(self):
+        """
+        :brief      Get the background grab object
+        :return:    FrameGrabber object, None when start_background_grab was not called
+        """
+        return self.__frame_grabber
+
+    def start_preview(self, decimation=4, max_fps=10.0, output_format=GxPixelFormatEntry.BGR8, callback=None):
+        """
+        :brief      Start a decimated live view next to the full resolution frames. Every frame delivered by
+                    get_image, dq_buf, dq_all_bufs, the last prepare_dq_buf path or the capture callback is
+                    offered to the preview, at most max_fps frames are copied and binned in the preview thread,
+                    the acquisition never waits for the preview. Get the preview with PreviewTap.get_preview
+                    or the callback.
+        :param      decimation:     binning factor per side, range:[1, 64]
+        :param      max_fps:        maximum preview frame rate, unit: frames per second
+        :param      output_format:  GxPixelFormatEntry.BGR8, RGB8 or MONO8
+        :param      callback:       function called in the preview thread with every new preview
+                                    (numpy.Array), or None
+        :return:    PreviewTap object
+        """
+        self.stop_preview()
+        preview_tap = PreviewTap(decimation, max_fps, output_format, callback)
+        preview_tap.start()
+        self.__preview_tap = preview_tap
+        if self.__dq_buf_hot_path is not None:
+            self.__dq_buf_hot_path.set_preview_tap(preview_tap)
+        return preview_tap
+
+    def stop_preview(self):
+        """
+        :brief      Stop the live view
+        :return:    none
+        """
+        preview_tap = self.__preview_tap
+        self.__preview_tap = None
+        if self.__dq_buf_hot_path is not None:
+            self.__dq_buf_hot_path.set_preview_tap(None)
+        if preview_tap is not None:
+            preview_tap.stop()
+
+    def get_preview_tap(self):
+        """
+        :brief      Get the live view object
+        :return:    PreviewTap object, None when start_preview was not called
+        """
+        return self.__preview_tap
+
+    def aframes(self, max_queue=8):
+        """
+        :brief      Asynchronous frame iterator built on the capture callback,
+                    usage: async for raw_image in data_stream.aframes(): ...
+                    frames are put into a bounded asyncio.Queue, the oldest frame is dropped while it is full
+        :param      max_queue:  queue size, range:[1, 0xFFFFFFFF]
+        :return:    AsyncFrameIterator object
+        """
+        if sys.version_info.major <= 2:
+            raise NoImplemented("DataStream.aframes: asyncio is not supported by this python version")
+
+        return AsyncFrameIterator(self, max_queue)
+
+    def register_capture_callback(self, callback_func, fast_mode=False):
         """
         :brief      Register the capture event callback function.
         :param      callback_func:  callback function
+        :param      fast_mode:      False: the callback gets a RawImage with a copy of the image data
+                                    True:  the callback gets a FrameDescriptor onto the SDK buffer, valid only
+                                           while the callback runs, call FrameDescriptor.detach() to keep it
         :return:    none
         """
+        if not isinstance(fast_mode, bool):
+            raise ParameterTypeError("DataStream.register_capture_callback: "
+                                     "Expected fast_mode type is bool, not %s" % type(fast_mode))
+
         if not isinstance(callback_func, types.FunctionType):
             raise ParameterTypeError("DataStream.register_capture_callback: "
                                      "Expected callback type is function not %s" % type(callback_func))
 
+        if self.__frame_grabber is not None and self.__frame_grabber.is_running():
+            raise InvalidCall("Can't register capture callback while background grab is running")
+
+        self.__capture_fast_mode = fast_mode
         status = gx_register_capture_callback(self.__dev_handle, self.__c_capture_callback)
         StatusProcessor.process(status, 'DataStream', 'register_capture_callback')
 
@@ -266,6 +724,17 @@ class DataStream:
         :brief      Capture event callback function with capture date.
         :return:    none
         """
+        if self.__capture_fast_mode:
+            frame = FrameDescriptor(capture_data.contents)
+            self.__frame_statistics.update(frame.frame_id, frame.timestamp, frame.status)
+            if self.__preview_tap is not None:
+                self.__preview_tap.offer(frame)
+            try:
+                self.__py_capture_callback(frame)
+            finally:
+                frame.release()
+            return
+
         frame_data = GxFrameData()
         frame_data.image_buf = capture_data.contents.image_buf
         frame_data.width = capture_data.contents.width
@@ -282,34 +751,39 @@ class DataStream:
             frame_data.offset_x = capture_data.contents.offset_x
             frame_data.offset_y = capture_data.contents.offset_y
 
+        self.__frame_statistics.update(frame_data.frame_id, frame_data.timestamp, frame_data.status)
+        if self.__preview_tap is not None:
+            self.__preview_tap.offer(frame_data)
         image = RawImage(frame_data)
         self.__py_capture_callback(image)
 
 class U3VDataStream(DataStream):
+    StreamTransferSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_STREAM_TRANSFER_SIZE)
+    StreamTransferNumberUrb = FeatureDescriptor(IntFeature, GxFeatureID.INT_STREAM_TRANSFER_NUMBER_URB)
+    StopAcquisitionMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_STOP_ACQUISITION_MODE)
+
     def __init__(self, dev_handle, stream_handle):
         self.__handle = dev_handle
         DataStream.__init__(self, self.__handle, stream_handle)
-        self.StreamTransferSize = IntFeature(self.__handle, GxFeatureID.INT_STREAM_TRANSFER_SIZE)
-        self.StreamTransferNumberUrb = IntFeature(self.__handle, GxFeatureID.INT_STREAM_TRANSFER_NUMBER_URB)
-        self.StopAcquisitionMode = EnumFeature(self.__handle, GxFeatureID.ENUM_STOP_ACQUISITION_MODE)
 
 
 class GEVDataStream(DataStream):
+    StreamResendPacketCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RESEND_PACKET_COUNT)
+    StreamRescuedPacketCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RESCUED_PACKET_COUNT)
+    StreamResendCommandCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RESEND_COMMAND_COUNT)
+    StreamUnexpectedPacketCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_UNEXPECTED_PACKET_COUNT)
+    MaxPacketCountInOneBlock = FeatureDescriptor(IntFeature, GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_BLOCK)
+    MaxPacketCountInOneCommand = FeatureDescriptor(IntFeature, GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_COMMAND)
+    ResendTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_RESEND_TIMEOUT)
+    MaxWaitPacketCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_MAX_WAIT_PACKET_COUNT)
+    ResendMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_RESEND_MODE)
+    StreamMissingBlockIDCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_MISSING_BLOCK_ID_COUNT)
+    BlockTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_BLOCK_TIMEOUT)
+    MaxNumQueueBuffer = FeatureDescriptor(IntFeature, GxFeatureID.INT_MAX_NUM_QUEUE_BUFFER)
+    PacketTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_PACKET_TIMEOUT)
+    SocketBufferSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_SOCKET_BUFFER_SIZE)
+
     def __init__(self, dev_handle, stream_handle):
         self.__handle = dev_handle
         DataStream.__init__(self, self.__handle, stream_handle)
-        self.StreamResendPacketCount = IntFeature(self.__handle, GxFeatureID.INT_RESEND_PACKET_COUNT)
-        self.StreamRescuedPacketCount = IntFeature(self.__handle, GxFeatureID.INT_RESCUED_PACKET_COUNT)
-        self.StreamResendCommandCount = IntFeature(self.__handle, GxFeatureID.INT_RESEND_COMMAND_COUNT)
-        self.StreamUnexpectedPacketCount = IntFeature(self.__handle, GxFeatureID.INT_UNEXPECTED_PACKET_COUNT)
-        self.MaxPacketCountInOneBlock = IntFeature(self.__handle, GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_BLOCK)
-        self.MaxPacketCountInOneCommand = IntFeature(self.__handle, GxFeatureID.INT_MAX_PACKET_COUNT_IN_ONE_COMMAND)
-        self.ResendTimeout = IntFeature(self.__handle, GxFeatureID.INT_RESEND_TIMEOUT)
-        self.MaxWaitPacketCount = IntFeature(self.__handle, GxFeatureID.INT_MAX_WAIT_PACKET_COUNT)
-        self.ResendMode = EnumFeature(self.__handle, GxFeatureID.ENUM_RESEND_MODE)
-        self.StreamMissingBlockIDCount = IntFeature(self.__handle, GxFeatureID.INT_MISSING_BLOCK_ID_COUNT)
-        self.BlockTimeout = IntFeature(self.__handle, GxFeatureID.INT_BLOCK_TIMEOUT)
-        self.MaxNumQueueBuffer = IntFeature(self.__handle, GxFeatureID.INT_MAX_NUM_QUEUE_BUFFER)
-        self.PacketTimeout = IntFeature(self.__handle, GxFeatureID.INT_PACKET_TIMEOUT)
-        self.SocketBufferSize = IntFeature(self.__handle, GxFeatureID.INT_SOCKET_BUFFER_SIZE)
 
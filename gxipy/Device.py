@@ -10,6 +10,7 @@ from gxipy.gxiapi import *
 from gxipy.StatusProcessor import *
 from gxipy.Feature import *
 from gxipy.FeatureControl import *
+from gxipy.FeatureCache import *
 from gxipy.ImageProc import *
 from gxipy.ImageProcessConfig import *
 from gxipy.DataStream import *
@@ -23,6 +24,439 @@ class Device:
     such as SetInt, SetFloat, etc. Can not open to the user, so that when the subsequent addition of features,
     Python interface does not upgrade, or only the definition of the control code can support new features
     """
+    # stream class created for each data stream of the device
+    data_stream_class = DataStream
+
+    # Function code function is obsolete, please use string to obtain attribute value
+    # The feature objects are created on first access, see FeatureDescriptor
+    # ---------------Device Information Section--------------------------
+    DeviceVendorName = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_VENDOR_NAME)
+    DeviceModelName = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_MODEL_NAME)
+    DeviceFirmwareVersion = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_FIRMWARE_VERSION)
+    DeviceVersion = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_VERSION)
+    DeviceSerialNumber = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_SERIAL_NUMBER)
+    FactorySettingVersion = FeatureDescriptor(StringFeature, GxFeatureID.STRING_FACTORY_SETTING_VERSION)
+    DeviceUserID = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_USER_ID)
+    DeviceLinkSelector = FeatureDescriptor(IntFeature, GxFeatureID.INT_DEVICE_LINK_SELECTOR)
+    DeviceLinkThroughputLimitMode = FeatureDescriptor(EnumFeature,
+                                                      GxFeatureID.ENUM_DEVICE_LINK_THROUGHPUT_LIMIT_MODE)
+    DeviceLinkThroughputLimit = FeatureDescriptor(IntFeature, GxFeatureID.INT_DEVICE_LINK_THROUGHPUT_LIMIT)
+    DeviceLinkCurrentThroughput = FeatureDescriptor(IntFeature, GxFeatureID.INT_DEVICE_LINK_CURRENT_THROUGHPUT)
+    DeviceReset = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_DEVICE_RESET)
+    TimestampTickFrequency = FeatureDescriptor(IntFeature, GxFeatureID.INT_TIMESTAMP_TICK_FREQUENCY)
+    TimestampLatch = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_TIMESTAMP_LATCH)
+    TimestampReset = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_TIMESTAMP_RESET)
+    TimestampLatchReset = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_TIMESTAMP_LATCH_RESET)
+    TimestampLatchValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_TIMESTAMP_LATCH_VALUE)
+    DevicePHYVersion = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_PHY_VERSION)
+    DeviceTemperatureSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DEVICE_TEMPERATURE_SELECTOR)
+    DeviceTemperature = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_DEVICE_TEMPERATURE)
+    DeviceIspFirmwareVersion = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_ISP_FIRMWARE_VERSION)
+    LowPowerMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LOWPOWER_MODE)
+    CloseCCD = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CLOSE_CCD)
+    ProductionCode = FeatureDescriptor(StringFeature, GxFeatureID.STRING_PRODUCTION_CODE)
+    DeviceOriginalName = FeatureDescriptor(StringFeature, GxFeatureID.STRING_DEVICE_ORIGINAL_NAME)
+    Revision = FeatureDescriptor(IntFeature, GxFeatureID.INT_REVISION)
+    VersionsSupported = FeatureDescriptor(IntFeature, GxFeatureID.INT_VERSIONS_SUPPORTED)
+    VersionUsed = FeatureDescriptor(IntFeature, GxFeatureID.INT_VERSION_USED)
+    TecTargetTemperature = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TEC_TARGET_TEMPERATURE)
+    FanEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_FAN_ENABLE)
+    # TecEnable has always been bound to the fan enable node (FanEnable = TecEnable = ...), kept for compatibility
+    TecEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_FAN_ENABLE)
+    TemperatureDetectionStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_TEMPERATURE_DETECTION_STATUS)
+    FanSpeed = FeatureDescriptor(IntFeature, GxFeatureID.INT_FAN_SPEED)
+    DeviceHumidity = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_DEVICE_HUMIDITY)
+    DevicePressure = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_DEVICE_PRESSURE)
+    AirChangeDetectionStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_AIR_CHANGE_DETECTION_STATUS)
+    AirTightnessDetectionStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_AIR_TIGHTNESS_DETECTION_STATUS)
+    DeviceScanType = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DEVICE_SCAN_TYPE)
+
+    # ---------------ImageFormat Section--------------------------------
+    SensorWidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_SENSOR_WIDTH)
+    SensorHeight = FeatureDescriptor(IntFeature, GxFeatureID.INT_SENSOR_HEIGHT)
+    WidthMax = FeatureDescriptor(IntFeature, GxFeatureID.INT_WIDTH_MAX)
+    HeightMax = FeatureDescriptor(IntFeature, GxFeatureID.INT_HEIGHT_MAX)
+    OffsetX = FeatureDescriptor(IntFeature, GxFeatureID.INT_OFFSET_X)
+    OffsetY = FeatureDescriptor(IntFeature, GxFeatureID.INT_OFFSET_Y)
+    Width = FeatureDescriptor(IntFeature, GxFeatureID.INT_WIDTH)
+    Height = FeatureDescriptor(IntFeature, GxFeatureID.INT_HEIGHT)
+    BinningHorizontal = FeatureDescriptor(IntFeature, GxFeatureID.INT_BINNING_HORIZONTAL)
+    BinningVertical = FeatureDescriptor(IntFeature, GxFeatureID.INT_BINNING_VERTICAL)
+    DecimationHorizontal = FeatureDescriptor(IntFeature, GxFeatureID.INT_DECIMATION_HORIZONTAL)
+    DecimationVertical = FeatureDescriptor(IntFeature, GxFeatureID.INT_DECIMATION_VERTICAL)
+    PixelSize = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_PIXEL_SIZE)
+    PixelColorFilter = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_PIXEL_COLOR_FILTER)
+    PixelFormat = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_PIXEL_FORMAT)
+    ReverseX = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_REVERSE_X)
+    ReverseY = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_REVERSE_Y)
+    TestPattern = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TEST_PATTERN)
+    TestPatternGeneratorSelector = FeatureDescriptor(EnumFeature,
+                                                     GxFeatureID.ENUM_TEST_PATTERN_GENERATOR_SELECTOR)
+    RegionSendMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_REGION_SEND_MODE)
+    RegionMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_REGION_MODE)
+    RegionSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_REGION_SELECTOR)
+    CenterWidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_CENTER_WIDTH)
+    CenterHeight = FeatureDescriptor(IntFeature, GxFeatureID.INT_CENTER_HEIGHT)
+    BinningHorizontalMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BINNING_HORIZONTAL_MODE)
+    BinningVerticalMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BINNING_VERTICAL_MODE)
+    SensorShutterMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SENSOR_SHUTTER_MODE)
+    DecimationLineNumber = FeatureDescriptor(IntFeature, GxFeatureID.INT_DECIMATION_LINENUMBER)
+    SensorDecimationHorizontal = FeatureDescriptor(IntFeature, GxFeatureID.INT_SENSOR_DECIMATION_HORIZONTAL)
+    SensorDecimationVertical = FeatureDescriptor(IntFeature, GxFeatureID.INT_SENSOR_DECIMATION_VERTICAL)
+    SensorSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SENSOR_SELECTOR)
+    CurrentSensorWidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_WIDTH)
+    CurrentSensorHeight = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_HEIGHT)
+    CurrentSensorOffsetX = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_OFFSETX)
+    CurrentSensorOffsetY = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_OFFSETY)
+    CurrentSensorWidthMax = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_WIDTHMAX)
+    CurrectSensorHeightMax = FeatureDescriptor(IntFeature, GxFeatureID.INT_CURRENT_SENSOR_HEIGHTMAX)
+    SensorBitDepth = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SENSOR_BIT_DEPTH)
+    WatermarkEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_WATERMARK_ENABLE)
+
+    # ---------------TransportLayer Section-------------------------------
+    PayloadSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_PAYLOAD_SIZE)
+    GevCurrentIPConfigurationLLA = FeatureDescriptor(BoolFeature,
+                                                     GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA)
+    GevCurrentIPConfigurationDHCP = FeatureDescriptor(BoolFeature,
+                                                      GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP)
+    GevCurrentIPConfigurationPersistentIP = FeatureDescriptor(BoolFeature,
+                                                              GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP)
+    EstimatedBandwidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_ESTIMATED_BANDWIDTH)
+    GevHeartbeatTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT)
+    GevSCPSPacketSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_PACKET_SIZE)
+    GevSCPD = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_PACKET_DELAY)
+    GevLinkSpeed = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_LINK_SPEED)
+    DeviceTapGeometry = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DEVICE_TAP_GEOMETRY)
+
+    # ---------------AcquisitionTrigger Section---------------------------
+    AcquisitionMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ACQUISITION_MODE)
+    AcquisitionStart = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_ACQUISITION_START)
+    AcquisitionStop = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_ACQUISITION_STOP)
+    TriggerMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRIGGER_MODE)
+    TriggerSoftware = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_TRIGGER_SOFTWARE)
+    TriggerActivation = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRIGGER_ACTIVATION)
+    ExposureTime = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_EXPOSURE_TIME)
+    ExposureAuto = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EXPOSURE_AUTO)
+    TriggerFilterRaisingEdge = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TRIGGER_FILTER_RAISING)
+    TriggerFilterFallingEdge = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TRIGGER_FILTER_FALLING)
+    TriggerSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRIGGER_SOURCE)
+    ExposureMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EXPOSURE_MODE)
+    TriggerSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRIGGER_SELECTOR)
+    TriggerDelay = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TRIGGER_DELAY)
+    TransferControlMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRANSFER_CONTROL_MODE)
+    TransferOperationMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRANSFER_OPERATION_MODE)
+    TransferStart = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_TRANSFER_START)
+    TransferBlockCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_TRANSFER_BLOCK_COUNT)
+    FrameBufferOverwriteActive = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_FRAMESTORE_COVER_ACTIVE)
+    AcquisitionFrameRateMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ACQUISITION_FRAME_RATE_MODE)
+    AcquisitionFrameRate = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_ACQUISITION_FRAME_RATE)
+    CurrentAcquisitionFrameRate = FeatureDescriptor(FloatFeature,
+                                                    GxFeatureID.FLOAT_CURRENT_ACQUISITION_FRAME_RATE)
+    FixedPatternNoiseCorrectMode = FeatureDescriptor(EnumFeature,
+                                                     GxFeatureID.ENUM_FIXED_PATTERN_NOISE_CORRECT_MODE)
+    AcquisitionBurstFrameCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_ACQUISITION_BURST_FRAME_COUNT)
+    AcquisitionStatusSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ACQUISITION_STATUS_SELECTOR)
+    AcquisitionStatus = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_ACQUISITION_STATUS)
+    ExposureDelay = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_EXPOSURE_DELAY)
+    ExposureOverlapTimeMax = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_EXPOSURE_OVERLAP_TIME_MAX)
+    ExposureTimeMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EXPOSURE_TIME_MODE)
+    FrameBufferCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_FRAME_BUFFER_COUNT)
+    FrameBufferFlush = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH)
+    AcquisitionBurstMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ACQUISITION_BURST_MODE)
+    OverlapMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_OVERLAP_MODE)
+    MultiSourceSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_MULTISOURCE_SELECTOR)
+    MultiSourceEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_MULTISOURCE_ENABLE)
+    TriggerCacheEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_TRIGGER_CACHE_ENABLE)
+
+    # ----------------DigitalIO Section----------------------------------
+    UserOutputSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_USER_OUTPUT_SELECTOR)
+    UserOutputValue = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_USER_OUTPUT_VALUE)
+    LineSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LINE_SELECTOR)
+    LineMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LINE_MODE)
+    LineInverter = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_LINE_INVERTER)
+    LineSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LINE_SOURCE)
+    LineStatus = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_LINE_STATUS)
+    LineStatusAll = FeatureDescriptor(IntFeature, GxFeatureID.INT_LINE_STATUS_ALL)
+    PulseWidth = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_PULSE_WIDTH)
+    LineRange = FeatureDescriptor(IntFeature, GxFeatureID.INT_LINE_RANGE)
+    LineDelay = FeatureDescriptor(IntFeature, GxFeatureID.INT_LINE_DELAY)
+    LineFilterRaisingEdge = FeatureDescriptor(IntFeature, GxFeatureID.INT_LINE_FILTER_RAISING_EDGE)
+    LineFilterFallingEdge = FeatureDescriptor(IntFeature, GxFeatureID.INT_LINE_FILTER_FALLING_EDGE)
+
+    # ----------------AnalogControls Section----------------------------
+    GainAuto = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_GAIN_AUTO)
+    GainSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_GAIN_SELECTOR)
+    BlackLevelAuto = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BLACK_LEVEL_AUTO)
+    BlackLevelSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BLACK_LEVEL_SELECTOR)
+    BalanceWhiteAuto = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BALANCE_WHITE_AUTO)
+    BalanceRatioSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_BALANCE_RATIO_SELECTOR)
+    BalanceRatio = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_BALANCE_RATIO)
+    DeadPixelCorrect = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DEAD_PIXEL_CORRECT)
+    Gain = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_GAIN)
+    BlackLevel = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_BLACK_LEVEL)
+    GammaEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_GAMMA_ENABLE)
+    GammaMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_GAMMA_MODE)
+    Gamma = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_GAMMA)
+    DigitalShift = FeatureDescriptor(IntFeature, GxFeatureID.INT_DIGITAL_SHIFT)
+    LightSourcePreset = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LIGHT_SOURCE_PRESET)
+    BlackLevelCalibStatus = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_BLACKLEVEL_CALIB_STATUS)
+    BlackLevelCalibValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_BLACKLEVEL_CALIB_VALUE)
+    PGAGain = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_PGA_GAIN)
+
+    # ---------------CustomFeature Section------------------------------
+    ExpectedGrayValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_GRAY_VALUE)
+    AAROIOffsetX = FeatureDescriptor(IntFeature, GxFeatureID.INT_AAROI_OFFSETX)
+    AAROIOffsetY = FeatureDescriptor(IntFeature, GxFeatureID.INT_AAROI_OFFSETY)
+    AAROIWidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_AAROI_WIDTH)
+    AAROIHeight = FeatureDescriptor(IntFeature, GxFeatureID.INT_AAROI_HEIGHT)
+    AutoGainMin = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_AUTO_GAIN_MIN)
+    AutoGainMax = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_AUTO_GAIN_MAX)
+    AutoExposureTimeMin = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MIN)
+    AutoExposureTimeMax = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MAX)
+    ContrastParam = FeatureDescriptor(IntFeature, GxFeatureID.INT_CONTRAST_PARAM)
+    GammaParam = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_GAMMA_PARAM)
+    ColorCorrectionParam = FeatureDescriptor(IntFeature, GxFeatureID.INT_COLOR_CORRECTION_PARAM)
+    AWBLampHouse = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_AWB_LAMP_HOUSE)
+    AWBROIOffsetX = FeatureDescriptor(IntFeature, GxFeatureID.INT_AWBROI_OFFSETX)
+    AWBROIOffsetY = FeatureDescriptor(IntFeature, GxFeatureID.INT_AWBROI_OFFSETY)
+    AWBROIWidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_AWBROI_WIDTH)
+    AWBROIHeight = FeatureDescriptor(IntFeature, GxFeatureID.INT_AWBROI_HEIGHT)
+    SharpnessMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SHARPNESS_MODE)
+    Sharpness = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_SHARPNESS)
+    DataFieldSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_USER_DATA_FIELD_SELECTOR)
+    DataFieldValue = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_USER_DATA_FIELD_VALUE)
+    FlatFieldCorrection = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_FLAT_FIELD_CORRECTION)
+    NoiseReductionMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_NOISE_REDUCTION_MODE)
+    NoiseReduction = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_NOISE_REDUCTION)
+    FFCLoad = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FFCLOAD)
+    FFCSave = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FFCSAVE)
+    StaticDefectCorrection = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_STATIC_DEFECT_CORRECTION)
+    NoiseReductionMode2D = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_2D_NOISE_REDUCTION_MODE)
+    NoiseReductionMode3D = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_3D_NOISE_REDUCTION_MODE)
+    CloseISP = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_CLOSE_ISP)
+    StaticDefectCorrectionValueAll = FeatureDescriptor(BufferFeature,
+                                                       GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_VALUE_ALL)
+    StaticDefectCorrectionFlashValue = FeatureDescriptor(BufferFeature,
+                                                         GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_FLASH_VALUE)
+    StaticDefectCorrectionFinish = FeatureDescriptor(IntFeature,
+                                                     GxFeatureID.INT_STATIC_DEFECT_CORRECTION_FINISH)
+    StaticDefectCorrectionInfo = FeatureDescriptor(BufferFeature,
+                                                   GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_INFO)
+    StripCalibrationStart = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_STRIP_CALIBRATION_START)
+    StripCalibrationStop = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_STRIP_CALIBRATION_STOP)
+    UserDataFiledValueAll = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL)
+    ShadingCorrectionMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SHADING_CORRECTION_MODE)
+    FFCGenerate = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_FFC_GENERATE)
+    FFCGenerateStatus = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_FFC_GENERATE_STATUS)
+    FFCExpectedGrayValueEnable = FeatureDescriptor(EnumFeature,
+                                                   GxFeatureID.ENUM_FFC_EXPECTED_GRAY_VALUE_ENABLE)
+    FFCExpectedGray = FeatureDescriptor(IntFeature, GxFeatureID.INT_FFC_EXPECTED_GRAY)
+    FFCCoeffinientsSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_FFC_COEFFICIENTS_SIZE)
+    FFCValueAll = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FFC_VALUE_ALL)
+    DSNUSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DSNU_SELECTOR)
+    DSNUGenerate = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_DSNU_GENERATE)
+    DSNUGenerateStatus = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_DSNU_GENERATE_STATUS)
+    DSNUSave = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_DSNU_SAVE)
+    DSNULoad = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_DSNU_LOAD)
+    PRNUSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_PRNU_SELECTOR)
+    PRNUGenerate = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_PRNU_GENERATE)
+    PRNUGenerateStatus = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_PRNU_GENERATE_STATUS)
+    PRNUSave = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_PRNU_SAVE)
+    PRNULoad = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_PRNU_LOAD)
+    DataFieldValueAll = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL)
+    StaticDefectCorrectionCalibStatus = FeatureDescriptor(IntFeature,
+                                                          GxFeatureID.INT_STATIC_DEFECT_CORRECTION_CALIB_STATUS)
+    FFCFactoryStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_FFC_FACTORY_STATUS)
+    DSNUFactoryStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_DSNU_FACTORY_STATUS)
+    PRNUFactoryStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_PRNU_FACTORY_STATUS)
+    Detect = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_DETECT)
+    FFCCoefficient = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_FFC_COEFFICIENT)
+    FFCFlashLoad = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FFCFLASH_LOAD)
+    FFCFlashSave = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FFCFLASH_SAVE)
+
+    # ---------------UserSetControl Section-------------------------------
+    UserSetSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_USER_SET_SELECTOR)
+    UserSetLoad = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_USER_SET_LOAD)
+    UserSetSave = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_USER_SET_SAVE)
+    UserSetDefault = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_USER_SET_DEFAULT)
+    DataFieldValueAllUsedStatus = FeatureDescriptor(IntFeature,
+                                                    GxFeatureID.INT_DATA_FIELD_VALUE_ALL_USED_STATUS)
+
+    # ---------------Event Section----------------------------------------
+    EventSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EVENT_SELECTOR)
+    EventNotification = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EVENT_NOTIFICATION)
+    EventExposureEnd = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_EXPOSURE_END)
+    EventExposureEndTimestamp = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_EXPOSURE_END_TIMESTAMP)
+    EventExposureEndFrameID = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_EXPOSURE_END_FRAME_ID)
+    EventBlockDiscard = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_BLOCK_DISCARD)
+    EventBlockDiscardTimestamp = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_BLOCK_DISCARD_TIMESTAMP)
+    EventOverrun = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_OVERRUN)
+    EventOverrunTimestamp = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_OVERRUN_TIMESTAMP)
+    EventFrameStartOvertrigger = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER)
+    EventFrameStartOvertriggerTimestamp = FeatureDescriptor(IntFeature,
+                                                            GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER_TIMESTAMP)
+    EventBlockNotEmpty = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY)
+    EventBlockNotEmptyTimestamp = FeatureDescriptor(IntFeature,
+                                                    GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_TIMESTAMP)
+    EventInternalError = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_INTERNAL_ERROR)
+    EventInternalErrorTimestamp = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_INTERNAL_ERROR_TIMESTAMP)
+    EventFrameBurstStartOvertrigger = FeatureDescriptor(IntFeature,
+                                                        GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER)
+    EventFrameBurstStartOvertriggerFrameID = FeatureDescriptor(IntFeature,
+                                                               GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_FRAMEID)
+    EventFrameBurstStartOvertriggerTimestamp = FeatureDescriptor(IntFeature,
+                                                                 GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_TIMESTAMP)
+    EventFrameStartWait = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_FRAMESTART_WAIT)
+    EventFrameStartWaitTimestamp = FeatureDescriptor(IntFeature,
+                                                     GxFeatureID.INT_EVENT_FRAMESTART_WAIT_TIMESTAMP)
+    EventFrameBurstStartWait = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT)
+    EventFrameBurstStartWaitTimestamp = FeatureDescriptor(IntFeature,
+                                                          GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_TIMESTAMP)
+    EventBlockDiscardFrameID = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_BLOCK_DISCARD_FRAMEID)
+    EventFrameStartOvertriggerFrameID = FeatureDescriptor(IntFeature,
+                                                          GxFeatureID.INT_EVENT_FRAMESTART_OVERTRIGGER_FRAMEID)
+    EventBlockNotEmptyFrameID = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_FRAMEID)
+    EventFrameStartWaitFrameID = FeatureDescriptor(IntFeature, GxFeatureID.INT_EVENT_FRAMESTART_WAIT_FRAMEID)
+    EventFrameBurstStartWaitFrameID = FeatureDescriptor(IntFeature,
+                                                        GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_FRAMEID)
+    EventSimpleMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_EVENT_SIMPLE_MODE)
+
+    # ---------------LUT Section------------------------------------------
+    LUTSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_LUT_SELECTOR)
+    LUTValueAll = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_LUT_VALUE_ALL)
+    LUTEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_LUT_ENABLE)
+    LUTIndex = FeatureDescriptor(IntFeature, GxFeatureID.INT_LUT_INDEX)
+    LUTValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_LUT_VALUE)
+    LUTFactoryStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_LUT_FACTORY_STATUS)
+
+    # ---------------ChunkData Section------------------------------------
+    ChunkModeActive = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_CHUNK_MODE_ACTIVE)
+    ChunkSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CHUNK_SELECTOR)
+    ChunkEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_CHUNK_ENABLE)
+
+    # ---------------Color Transformation Control-------------------------
+    ColorTransformationMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COLOR_TRANSFORMATION_MODE)
+    ColorTransformationEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_COLOR_TRANSFORMATION_ENABLE)
+    ColorTransformationValueSelector = FeatureDescriptor(EnumFeature,
+                                                         GxFeatureID.ENUM_COLOR_TRANSFORMATION_VALUE_SELECTOR)
+    ColorTransformationValue = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_COLOR_TRANSFORMATION_VALUE)
+    SaturationMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SATURATION_MODE)
+    Saturation = FeatureDescriptor(IntFeature, GxFeatureID.INT_SATURATION)
+
+    # ---------------CounterAndTimerControl Section-----------------------
+    TimerSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TIMER_SELECTOR)
+    TimerDuration = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TIMER_DURATION)
+    TimerDelay = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_TIMER_DELAY)
+    TimerTriggerSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TIMER_TRIGGER_SOURCE)
+    CounterSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COUNTER_SELECTOR)
+    CounterEventSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COUNTER_EVENT_SOURCE)
+    CounterResetSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COUNTER_RESET_SOURCE)
+    CounterResetActivation = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COUNTER_RESET_ACTIVATION)
+    CounterReset = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_COUNTER_RESET)
+    CounterTriggerSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_COUNTER_TRIGGER_SOURCE)
+    CounterDuration = FeatureDescriptor(IntFeature, GxFeatureID.INT_COUNTER_DURATION)
+    TimerTriggerActivation = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TIMER_TRIGGER_ACTIVATION)
+    CounterValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_COUNTER_VALUE)
+
+    # ---------------RemoveParameterLimitControl Section------------------
+    RemoveParameterLimit = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_REMOVE_PARAMETER_LIMIT)
+
+    # ---------------HDRControl Section------------------
+    HDRMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_HDR_MODE)
+    HDRTargetLongValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_HDR_TARGET_LONG_VALUE)
+    HDRTargetShortValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_HDR_TARGET_SHORT_VALUE)
+    HDRTargetMainValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_HDR_TARGET_MAIN_VALUE)
+
+    # ---------------MultiGrayControl Section------------------
+    MGCMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_MGC_MODE)
+    MGCSelector = FeatureDescriptor(IntFeature, GxFeatureID.INT_MGC_SELECTOR)
+    MGCExposureTime = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_MGC_EXPOSURE_TIME)
+    MGCGain = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_MGC_GAIN)
+
+    # ---------------ImageQualityControl Section------------------
+    StripedCalibrationInfo = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_STRIPED_CALIBRATION_INFO)
+    Contrast = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_CONTRAST)
+    HotPixelCorrection = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_HOTPIXEL_CORRECTION)
+
+    # ---------------GyroControl Section------------------
+    IMUData = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_IMU_DATA)
+    IMUConfigAccRange = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_ACC_RANGE)
+    IMUConfigAccOdrLowPassFilterSwitch = FeatureDescriptor(EnumFeature,
+                                                           GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_SWITCH)
+    IMUConfigAccOdr = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR)
+    IMUConfigAccOdrLowPassFilterFrequency = FeatureDescriptor(EnumFeature,
+                                                              GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_FREQUENCY)
+    IMUConfigGyroXRange = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_GYRO_XRANGE)
+    IMUConfigGyroYRange = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_GYRO_YRANGE)
+    IMUConfigGyroZRange = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_GYRO_ZRANGE)
+    IMUConfigGyroOdrLowPassFilterSwitch = FeatureDescriptor(EnumFeature,
+                                                            GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_SWITCH)
+    IMUConfigGyroOdr = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR)
+    IMUConfigGyroOdrLowPassFilterFrequency = FeatureDescriptor(EnumFeature,
+                                                               GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_FREQUENCY)
+    IMURoomTemperature = FeatureDescriptor(FloatFeature, GxFeatureID.FLOAT_IMU_ROOM_TEMPERATURE)
+    IMUTemperatureOdr = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMU_TEMPERATURE_ODR)
+
+    # ---------------FrameBufferControl Section------------------
+    FrameBufferCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_FRAME_BUFFER_COUNT)
+    FrameBufferFlush = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH)
+
+    # ---------------SerialPortControl Section------------------
+    DeviceSerialPortSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SERIALPORT_SELECTOR)
+    SerialPortSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SERIALPORT_SOURCE)
+    DeviceSerialPortBaudRate = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SERIALPORT_BAUDRATE)
+    SerialPortDataBits = FeatureDescriptor(IntFeature, GxFeatureID.INT_SERIALPORT_DATA_BITS)
+    SerialPortStopBits = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SERIALPORT_STOP_BITS)
+    SerialPortParity = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SERIALPORT_PARITY)
+    TransmitQueueMaxCharacterCount = FeatureDescriptor(IntFeature,
+                                                       GxFeatureID.INT_TRANSMIT_QUEUE_MAX_CHARACTER_COUNT)
+    TransmitQueueCurrentCharacterCount = FeatureDescriptor(IntFeature,
+                                                           GxFeatureID.INT_TRANSMIT_QUEUE_CURRENT_CHARACTER_COUNT)
+    ReceiveQueueMaxCharacterCount = FeatureDescriptor(IntFeature,
+                                                      GxFeatureID.INT_RECEIVE_QUEUE_MAX_CHARACTER_COUNT)
+    ReceiveQueueCurrentCharacterCount = FeatureDescriptor(IntFeature,
+                                                          GxFeatureID.INT_RECEIVE_QUEUE_CURRENT_CHARACTER_COUNT)
+    ReceiveFramingErrorCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
+    ReceiveParityErrorCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RECEIVE_PARITY_ERROR_COUNT)
+    ReceiveQueueClear = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_RECEIVE_QUEUE_CLEAR)
+    SerialPortData = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_SERIALPORT_DATA)
+    SerialPortDataLength = FeatureDescriptor(IntFeature, GxFeatureID.INT_SERIALPORT_DATA_LENGTH)
+    SerialPortDetectionStatus = FeatureDescriptor(IntFeature, GxFeatureID.INT_SERIAL_PORT_DETECTION_STATUS)
+
+    # ---------------CoaXPress Section------------------
+    CxpLinkConfiguration = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CXP_LINK_CONFIGURATION)
+    CxpLinkConfigurationPreferred = FeatureDescriptor(EnumFeature,
+                                                      GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_PREFERRED)
+    CxpLinkConfigurationStatus = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_STATUS)
+    Image1StreamID = FeatureDescriptor(IntFeature, GxFeatureID.INT_IMAGE1_STREAM_ID)
+    CxpConnectionSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CXP_CONNECTION_SELECTOR)
+    CxpConnectionTestMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_CXP_CONNECTION_TEST_MODE)
+    CxpConnectionTestErrorCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
+    CxpConnectionTestPacketRxCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
+    CxpConnectionTestPacketTxCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
+
+    # ---------------SequencerControl Section------------------
+    SequencerMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SEQUENCER_MODE)
+    SequencerConfigurationMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SEQUENCER_CONFIGURATION_MODE)
+    SequencerFeatureSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SEQUENCER_FEATURE_SELECTOR)
+    SequencerFeatureEnable = FeatureDescriptor(BoolFeature, GxFeatureID.BOOL_SEQUENCER_FEATURE_ENABLE)
+    SequencerSetSelector = FeatureDescriptor(IntFeature, GxFeatureID.INT_SEQUENCER_SET_SELECTOR)
+    SequencerSetCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_SEQUENCER_SET_COUNT)
+    SequencerSetActive = FeatureDescriptor(IntFeature, GxFeatureID.INT_SEQUENCER_SET_ACTIVE)
+    SequencerSetReset = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_SEQUENCER_SET_RESET)
+    SequencerPathSelector = FeatureDescriptor(IntFeature, GxFeatureID.INT_SEQUENCER_PATH_SELECTOR)
+    SequencerSetNext = FeatureDescriptor(IntFeature, GxFeatureID.INT_SEQUENCER_SET_NEXT)
+    SequencerTriggerSource = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_SEQUENCER_TRIGGER_SOURCE)
+    SequencerSetSave = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_SEQUENCER_SET_SAVE)
+    SequencerSetLoad = FeatureDescriptor(CommandFeature, GxFeatureID.COMMAND_SEQUENCER_SET_LOAD)
+
+    # ---------------EnoderControl Section------------------
+    EncoderSelector = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ENCODER_SELECTOR)
+    EncoderDirection = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ENCODER_DIRECTION)
+    EncoderValue = FeatureDescriptor(IntFeature, GxFeatureID.INT_ENCODER_VALUE)
+    EncoderSourceA = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ENCODER_SOURCEA)
+    EncoderSourceB = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ENCODER_SOURCEB)
+    EncoderMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_ENCODER_MODE)
 
     def __init__(self, handle, interface_obj):
         """
@@ -51,434 +485,6 @@ class Device:
 
         self.__color_correction_param = 0
 
-        # Function code function is obsolete, please use string to obtain attribute value
-        # ---------------Device Information Section--------------------------
-        self.DeviceVendorName = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_VENDOR_NAME)
-        self.DeviceModelName = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_MODEL_NAME)
-        self.DeviceFirmwareVersion = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_FIRMWARE_VERSION)
-        self.DeviceVersion = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_VERSION)
-        self.DeviceSerialNumber = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_SERIAL_NUMBER)
-        self.FactorySettingVersion = StringFeature(self.__dev_handle, GxFeatureID.STRING_FACTORY_SETTING_VERSION)
-        self.DeviceUserID = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_USER_ID)
-        self.DeviceLinkSelector = IntFeature(self.__dev_handle, GxFeatureID.INT_DEVICE_LINK_SELECTOR)
-        self.DeviceLinkThroughputLimitMode = EnumFeature(self.__dev_handle,
-                                                         GxFeatureID.ENUM_DEVICE_LINK_THROUGHPUT_LIMIT_MODE)
-        self.DeviceLinkThroughputLimit = IntFeature(self.__dev_handle, GxFeatureID.INT_DEVICE_LINK_THROUGHPUT_LIMIT)
-        self.DeviceLinkCurrentThroughput = IntFeature(self.__dev_handle, GxFeatureID.INT_DEVICE_LINK_CURRENT_THROUGHPUT)
-        self.DeviceReset = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_DEVICE_RESET)
-        self.TimestampTickFrequency = IntFeature(self.__dev_handle, GxFeatureID.INT_TIMESTAMP_TICK_FREQUENCY)
-        self.TimestampLatch = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_TIMESTAMP_LATCH)
-        self.TimestampReset = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_TIMESTAMP_RESET)
-        self.TimestampLatchReset = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_TIMESTAMP_LATCH_RESET)
-        self.TimestampLatchValue = IntFeature(self.__dev_handle, GxFeatureID.INT_TIMESTAMP_LATCH_VALUE)
-        self.DevicePHYVersion = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_PHY_VERSION)
-        self.DeviceTemperatureSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DEVICE_TEMPERATURE_SELECTOR)
-        self.DeviceTemperature = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_DEVICE_TEMPERATURE)
-        self.DeviceIspFirmwareVersion = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_ISP_FIRMWARE_VERSION)
-        self.LowPowerMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LOWPOWER_MODE)
-        self.CloseCCD = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CLOSE_CCD)
-        self.ProductionCode = StringFeature(self.__dev_handle, GxFeatureID.STRING_PRODUCTION_CODE)
-        self.DeviceOriginalName = StringFeature(self.__dev_handle, GxFeatureID.STRING_DEVICE_ORIGINAL_NAME)
-        self.Revision = IntFeature(self.__dev_handle, GxFeatureID.INT_REVISION)
-        self.VersionsSupported = IntFeature(self.__dev_handle, GxFeatureID.INT_VERSIONS_SUPPORTED)
-        self.VersionUsed = IntFeature(self.__dev_handle, GxFeatureID.INT_VERSION_USED)
-        self.TecEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_TEC_ENABLE)
-        self.TecTargetTemperature = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TEC_TARGET_TEMPERATURE)
-        self.FanEnable = self.TecEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_FAN_ENABLE)
-        self.TemperatureDetectionStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_TEMPERATURE_DETECTION_STATUS)
-        self.FanSpeed = IntFeature(self.__dev_handle, GxFeatureID.INT_FAN_SPEED)
-        self.DeviceHumidity = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_DEVICE_HUMIDITY)
-        self.DevicePressure = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_DEVICE_PRESSURE)
-        self.AirChangeDetectionStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_AIR_CHANGE_DETECTION_STATUS)
-        self.AirTightnessDetectionStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_AIR_TIGHTNESS_DETECTION_STATUS)
-        self.DeviceScanType = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DEVICE_SCAN_TYPE)
-
-        # ---------------ImageFormat Section--------------------------------
-        self.SensorWidth = IntFeature(self.__dev_handle, GxFeatureID.INT_SENSOR_WIDTH)
-        self.SensorHeight = IntFeature(self.__dev_handle, GxFeatureID.INT_SENSOR_HEIGHT)
-        self.WidthMax = IntFeature(self.__dev_handle, GxFeatureID.INT_WIDTH_MAX)
-        self.HeightMax = IntFeature(self.__dev_handle, GxFeatureID.INT_HEIGHT_MAX)
-        self.OffsetX = IntFeature(self.__dev_handle, GxFeatureID.INT_OFFSET_X)
-        self.OffsetY = IntFeature(self.__dev_handle, GxFeatureID.INT_OFFSET_Y)
-        self.Width = IntFeature(self.__dev_handle, GxFeatureID.INT_WIDTH)
-        self.Height = IntFeature(self.__dev_handle, GxFeatureID.INT_HEIGHT)
-        self.BinningHorizontal = IntFeature(self.__dev_handle, GxFeatureID.INT_BINNING_HORIZONTAL)
-        self.BinningVertical = IntFeature(self.__dev_handle, GxFeatureID.INT_BINNING_VERTICAL)
-        self.DecimationHorizontal = IntFeature(self.__dev_handle, GxFeatureID.INT_DECIMATION_HORIZONTAL)
-        self.DecimationVertical = IntFeature(self.__dev_handle, GxFeatureID.INT_DECIMATION_VERTICAL)
-        self.PixelSize = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_PIXEL_SIZE)
-        self.PixelColorFilter = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_PIXEL_COLOR_FILTER)
-        self.PixelFormat = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_PIXEL_FORMAT)
-        self.ReverseX = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_REVERSE_X)
-        self.ReverseY = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_REVERSE_Y)
-        self.TestPattern = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TEST_PATTERN)
-        self.TestPatternGeneratorSelector = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_TEST_PATTERN_GENERATOR_SELECTOR)
-        self.RegionSendMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_REGION_SEND_MODE)
-        self.RegionMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_REGION_MODE)
-        self.RegionSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_REGION_SELECTOR)
-        self.CenterWidth = IntFeature(self.__dev_handle, GxFeatureID.INT_CENTER_WIDTH)
-        self.CenterHeight = IntFeature(self.__dev_handle, GxFeatureID.INT_CENTER_HEIGHT)
-        self.BinningHorizontalMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BINNING_HORIZONTAL_MODE)
-        self.BinningVerticalMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BINNING_VERTICAL_MODE)
-        self.SensorShutterMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SENSOR_SHUTTER_MODE)
-        self.DecimationLineNumber = IntFeature(self.__dev_handle, GxFeatureID.INT_DECIMATION_LINENUMBER)
-        self.SensorDecimationHorizontal = IntFeature(self.__dev_handle, GxFeatureID.INT_SENSOR_DECIMATION_HORIZONTAL)
-        self.SensorDecimationVertical = IntFeature(self.__dev_handle, GxFeatureID.INT_SENSOR_DECIMATION_VERTICAL)
-        self.SensorSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SENSOR_SELECTOR)
-        self.CurrentSensorWidth = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_WIDTH)
-        self.CurrentSensorHeight = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_HEIGHT)
-        self.CurrentSensorOffsetX = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_OFFSETX)
-        self.CurrentSensorOffsetY = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_OFFSETY)
-        self.CurrentSensorWidthMax = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_WIDTHMAX)
-        self.CurrectSensorHeightMax = IntFeature(self.__dev_handle, GxFeatureID.INT_CURRENT_SENSOR_HEIGHTMAX)
-        self.SensorBitDepth = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SENSOR_BIT_DEPTH)
-        self.WatermarkEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_WATERMARK_ENABLE)
-
-        # ---------------TransportLayer Section-------------------------------
-        self.PayloadSize = IntFeature(self.__dev_handle, GxFeatureID.INT_PAYLOAD_SIZE)
-        self.GevCurrentIPConfigurationLLA = BoolFeature(self.__dev_handle,
-                                                        GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA)
-        self.GevCurrentIPConfigurationDHCP = BoolFeature(self.__dev_handle,
-                                                         GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP)
-        self.GevCurrentIPConfigurationPersistentIP = BoolFeature(self.__dev_handle,
-                                                         GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP)
-        self.EstimatedBandwidth = IntFeature(self.__dev_handle, GxFeatureID.INT_ESTIMATED_BANDWIDTH)
-        self.GevHeartbeatTimeout = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT)
-        self.GevSCPSPacketSize = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_PACKET_SIZE)
-        self.GevSCPD = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_PACKET_DELAY)
-        self.GevLinkSpeed = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_LINK_SPEED)
-        self.DeviceTapGeometry = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DEVICE_TAP_GEOMETRY)
-
-        # ---------------AcquisitionTrigger Section---------------------------
-        self.AcquisitionMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ACQUISITION_MODE)
-        self.AcquisitionStart = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_START)
-        self.AcquisitionStop = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_STOP)
-        self.TriggerMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRIGGER_MODE)
-        self.TriggerSoftware = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_TRIGGER_SOFTWARE)
-        self.TriggerActivation = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRIGGER_ACTIVATION)
-        self.ExposureTime = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_EXPOSURE_TIME)
-        self.ExposureAuto = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EXPOSURE_AUTO)
-        self.TriggerFilterRaisingEdge = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TRIGGER_FILTER_RAISING)
-        self.TriggerFilterFallingEdge = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TRIGGER_FILTER_FALLING)
-        self.TriggerSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRIGGER_SOURCE)
-        self.ExposureMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EXPOSURE_MODE)
-        self.TriggerSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRIGGER_SELECTOR)
-        self.TriggerDelay = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TRIGGER_DELAY)
-        self.TransferControlMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRANSFER_CONTROL_MODE)
-        self.TransferOperationMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRANSFER_OPERATION_MODE)
-        self.TransferStart = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_TRANSFER_START)
-        self.TransferBlockCount = IntFeature(self.__dev_handle, GxFeatureID.INT_TRANSFER_BLOCK_COUNT)
-        self.FrameBufferOverwriteActive = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_FRAMESTORE_COVER_ACTIVE)
-        self.AcquisitionFrameRateMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ACQUISITION_FRAME_RATE_MODE)
-        self.AcquisitionFrameRate = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_ACQUISITION_FRAME_RATE)
-        self.CurrentAcquisitionFrameRate = FloatFeature(self.__dev_handle,
-                                                        GxFeatureID.FLOAT_CURRENT_ACQUISITION_FRAME_RATE)
-        self.FixedPatternNoiseCorrectMode = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_FIXED_PATTERN_NOISE_CORRECT_MODE)
-        self.AcquisitionBurstFrameCount = IntFeature(self.__dev_handle, GxFeatureID.INT_ACQUISITION_BURST_FRAME_COUNT)
-        self.AcquisitionStatusSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ACQUISITION_STATUS_SELECTOR)
-        self.AcquisitionStatus = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_ACQUISITION_STATUS)
-        self.ExposureDelay = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_EXPOSURE_DELAY)
-        self.ExposureOverlapTimeMax = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_EXPOSURE_OVERLAP_TIME_MAX)
-        self.ExposureTimeMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EXPOSURE_TIME_MODE)
-        self.FrameBufferCount = IntFeature(self.__dev_handle, GxFeatureID.INT_FRAME_BUFFER_COUNT)
-        self.FrameBufferFlush = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH)
-        self.AcquisitionBurstMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ACQUISITION_BURST_MODE)
-        self.OverlapMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_OVERLAP_MODE)
-        self.MultiSourceSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_MULTISOURCE_SELECTOR)
-        self.MultiSourceEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_MULTISOURCE_ENABLE)
-        self.TriggerCacheEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_TRIGGER_CACHE_ENABLE)
-
-        # ----------------DigitalIO Section----------------------------------
-        self.UserOutputSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_USER_OUTPUT_SELECTOR)
-        self.UserOutputValue = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_USER_OUTPUT_VALUE)
-        self.LineSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LINE_SELECTOR)
-        self.LineMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LINE_MODE)
-        self.LineInverter = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_LINE_INVERTER)
-        self.LineSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LINE_SOURCE)
-        self.LineStatus = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_LINE_STATUS)
-        self.LineStatusAll = IntFeature(self.__dev_handle, GxFeatureID.INT_LINE_STATUS_ALL)
-        self.PulseWidth = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_PULSE_WIDTH)
-        self.LineRange = IntFeature(self.__dev_handle, GxFeatureID.INT_LINE_RANGE)
-        self.LineDelay = IntFeature(self.__dev_handle, GxFeatureID.INT_LINE_DELAY)
-        self.LineFilterRaisingEdge = IntFeature(self.__dev_handle, GxFeatureID.INT_LINE_FILTER_RAISING_EDGE)
-        self.LineFilterFallingEdge = IntFeature(self.__dev_handle, GxFeatureID.INT_LINE_FILTER_FALLING_EDGE)
-
-        # ----------------AnalogControls Section----------------------------
-        self.GainAuto = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_GAIN_AUTO)
-        self.GainSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_GAIN_SELECTOR)
-        self.BlackLevelAuto = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BLACK_LEVEL_AUTO)
-        self.BlackLevelSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BLACK_LEVEL_SELECTOR)
-        self.BalanceWhiteAuto = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BALANCE_WHITE_AUTO)
-        self.BalanceRatioSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_BALANCE_RATIO_SELECTOR)
-        self.BalanceRatio = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_BALANCE_RATIO)
-        self.DeadPixelCorrect = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DEAD_PIXEL_CORRECT)
-        self.Gain = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_GAIN)
-        self.BlackLevel = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_BLACK_LEVEL)
-        self.GammaEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_GAMMA_ENABLE)
-        self.GammaMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_GAMMA_MODE)
-        self.Gamma = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_GAMMA)
-        self.DigitalShift = IntFeature(self.__dev_handle, GxFeatureID.INT_DIGITAL_SHIFT)
-        self.LightSourcePreset = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LIGHT_SOURCE_PRESET)
-        self.BlackLevelCalibStatus = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_BLACKLEVEL_CALIB_STATUS)
-        self.BlackLevelCalibValue = IntFeature(self.__dev_handle, GxFeatureID.INT_BLACKLEVEL_CALIB_VALUE)
-        self.PGAGain = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_PGA_GAIN)
-
-        # ---------------CustomFeature Section------------------------------
-        self.ExpectedGrayValue = IntFeature(self.__dev_handle, GxFeatureID.INT_GRAY_VALUE)
-        self.AAROIOffsetX = IntFeature(self.__dev_handle, GxFeatureID.INT_AAROI_OFFSETX)
-        self.AAROIOffsetY = IntFeature(self.__dev_handle, GxFeatureID.INT_AAROI_OFFSETY)
-        self.AAROIWidth = IntFeature(self.__dev_handle, GxFeatureID.INT_AAROI_WIDTH)
-        self.AAROIHeight = IntFeature(self.__dev_handle, GxFeatureID.INT_AAROI_HEIGHT)
-        self.AutoGainMin = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_AUTO_GAIN_MIN)
-        self.AutoGainMax = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_AUTO_GAIN_MAX)
-        self.AutoExposureTimeMin = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MIN)
-        self.AutoExposureTimeMax = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_AUTO_EXPOSURE_TIME_MAX)
-        self.ContrastParam = IntFeature(self.__dev_handle, GxFeatureID.INT_CONTRAST_PARAM)
-        self.GammaParam = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_GAMMA_PARAM)
-        self.ColorCorrectionParam = IntFeature(self.__dev_handle, GxFeatureID.INT_COLOR_CORRECTION_PARAM)
-        self.AWBLampHouse = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_AWB_LAMP_HOUSE)
-        self.AWBROIOffsetX = IntFeature(self.__dev_handle, GxFeatureID.INT_AWBROI_OFFSETX)
-        self.AWBROIOffsetY = IntFeature(self.__dev_handle, GxFeatureID.INT_AWBROI_OFFSETY)
-        self.AWBROIWidth = IntFeature(self.__dev_handle, GxFeatureID.INT_AWBROI_WIDTH)
-        self.AWBROIHeight = IntFeature(self.__dev_handle, GxFeatureID.INT_AWBROI_HEIGHT)
-        self.SharpnessMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SHARPNESS_MODE)
-        self.Sharpness = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_SHARPNESS)
-        self.DataFieldSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_USER_DATA_FIELD_SELECTOR)
-        self.DataFieldValue = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_USER_DATA_FIELD_VALUE)
-        self.FlatFieldCorrection = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_FLAT_FIELD_CORRECTION)
-        self.NoiseReductionMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_NOISE_REDUCTION_MODE)
-        self.NoiseReduction = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_NOISE_REDUCTION)
-        self.FFCLoad = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FFCLOAD)
-        self.FFCSave = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FFCSAVE)
-        self.StaticDefectCorrection = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_STATIC_DEFECT_CORRECTION)
-        self.NoiseReductionMode2D = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_2D_NOISE_REDUCTION_MODE)
-        self.NoiseReductionMode3D = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_3D_NOISE_REDUCTION_MODE)
-        self.CloseISP = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_CLOSE_ISP)
-        self.StaticDefectCorrectionValueAll = BufferFeature(self.__dev_handle,
-                                                            GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_VALUE_ALL)
-        self.StaticDefectCorrectionFlashValue = BufferFeature(self.__dev_handle,
-                                                              GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_FLASH_VALUE)
-        self.StaticDefectCorrectionFinish = IntFeature(self.__dev_handle,
-                                                       GxFeatureID.INT_STATIC_DEFECT_CORRECTION_FINISH)
-        self.StaticDefectCorrectionInfo = BufferFeature(self.__dev_handle,
-                                                        GxFeatureID.BUFFER_STATIC_DEFECT_CORRECTION_INFO)
-        self.StripCalibrationStart = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_STRIP_CALIBRATION_START)
-        self.StripCalibrationStop = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_STRIP_CALIBRATION_STOP)
-        self.UserDataFiledValueAll = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL)
-        self.ShadingCorrectionMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SHADING_CORRECTION_MODE)
-        self.FFCGenerate = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_FFC_GENERATE)
-        self.FFCGenerateStatus = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_FFC_GENERATE_STATUS)
-        self.FFCExpectedGrayValueEnable = EnumFeature(self.__dev_handle,
-                                                      GxFeatureID.ENUM_FFC_EXPECTED_GRAY_VALUE_ENABLE)
-        self.FFCExpectedGray = IntFeature(self.__dev_handle, GxFeatureID.INT_FFC_EXPECTED_GRAY)
-        self.FFCCoeffinientsSize = IntFeature(self.__dev_handle, GxFeatureID.INT_FFC_COEFFICIENTS_SIZE)
-        self.FFCValueAll = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FFC_VALUE_ALL)
-        self.DSNUSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DSNU_SELECTOR)
-        self.DSNUGenerate = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_DSNU_GENERATE)
-        self.DSNUGenerateStatus = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_DSNU_GENERATE_STATUS)
-        self.DSNUSave = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_DSNU_SAVE)
-        self.DSNULoad = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_DSNU_LOAD)
-        self.PRNUSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_PRNU_SELECTOR)
-        self.PRNUGenerate = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_PRNU_GENERATE)
-        self.PRNUGenerateStatus = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_PRNU_GENERATE_STATUS)
-        self.PRNUSave = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_PRNU_SAVE)
-        self.PRNULoad = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_PRNU_LOAD)
-        self.DataFieldValueAll = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_USER_DATA_FILED_VALUE_ALL)
-        self.StaticDefectCorrectionCalibStatus = IntFeature(self.__dev_handle,
-                                                            GxFeatureID.INT_STATIC_DEFECT_CORRECTION_CALIB_STATUS)
-        self.FFCFactoryStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_FFC_FACTORY_STATUS)
-        self.DSNUFactoryStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_DSNU_FACTORY_STATUS)
-        self.PRNUFactoryStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_PRNU_FACTORY_STATUS)
-        self.Detect = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_DETECT)
-        self.FFCCoefficient = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_FFC_COEFFICIENT)
-        self.FFCFlashLoad = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FFCFLASH_LOAD)
-        self.FFCFlashSave = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FFCFLASH_SAVE)
-
-        # ---------------UserSetControl Section-------------------------------
-        self.UserSetSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_USER_SET_SELECTOR)
-        self.UserSetLoad = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_USER_SET_LOAD)
-        self.UserSetSave = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_USER_SET_SAVE)
-        self.UserSetDefault = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_USER_SET_DEFAULT)
-        self.DataFieldValueAllUsedStatus = IntFeature(self.__dev_handle,
-                                                      GxFeatureID.INT_DATA_FIELD_VALUE_ALL_USED_STATUS)
-
-        # ---------------Event Section----------------------------------------
-        self.EventSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EVENT_SELECTOR)
-        self.EventNotification = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EVENT_NOTIFICATION)
-        self.EventExposureEnd = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_EXPOSURE_END)
-        self.EventExposureEndTimestamp = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_EXPOSURE_END_TIMESTAMP)
-        self.EventExposureEndFrameID = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_EXPOSURE_END_FRAME_ID)
-        self.EventBlockDiscard = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_BLOCK_DISCARD)
-        self.EventBlockDiscardTimestamp = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_BLOCK_DISCARD_TIMESTAMP)
-        self.EventOverrun = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_OVERRUN)
-        self.EventOverrunTimestamp = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_OVERRUN_TIMESTAMP)
-        self.EventFrameStartOvertrigger = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER)
-        self.EventFrameStartOvertriggerTimestamp = IntFeature(self.__dev_handle,
-                                                              GxFeatureID.INT_EVENT_FRAME_START_OVER_TRIGGER_TIMESTAMP)
-        self.EventBlockNotEmpty = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY)
-        self.EventBlockNotEmptyTimestamp = IntFeature(self.__dev_handle,
-                                                      GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_TIMESTAMP)
-        self.EventInternalError = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_INTERNAL_ERROR)
-        self.EventInternalErrorTimestamp = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_INTERNAL_ERROR_TIMESTAMP)
-        self.EventFrameBurstStartOvertrigger = IntFeature(self.__dev_handle,
-                                                          GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER)
-        self.EventFrameBurstStartOvertriggerFrameID = IntFeature(self.__dev_handle,
-                                                                 GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_FRAMEID)
-        self.EventFrameBurstStartOvertriggerTimestamp = IntFeature(self.__dev_handle,
-                                                                   GxFeatureID.INT_EVENT_FRAMEBURSTSTART_OVERTRIGGER_TIMESTAMP)
-        self.EventFrameStartWait = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_FRAMESTART_WAIT)
-        self.EventFrameStartWaitTimestamp = IntFeature(self.__dev_handle,
-                                                       GxFeatureID.INT_EVENT_FRAMESTART_WAIT_TIMESTAMP)
-        self.EventFrameBurstStartWait = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT)
-        self.EventFrameBurstStartWaitTimestamp = IntFeature(self.__dev_handle,
-                                                            GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_TIMESTAMP)
-        self.EventBlockDiscardFrameID = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_BLOCK_DISCARD_FRAMEID)
-        self.EventFrameStartOvertriggerFrameID = IntFeature(self.__dev_handle,
-                                                            GxFeatureID.INT_EVENT_FRAMESTART_OVERTRIGGER_FRAMEID)
-        self.EventBlockNotEmptyFrameID = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_BLOCK_NOT_EMPTY_FRAMEID)
-        self.EventFrameStartWaitFrameID = IntFeature(self.__dev_handle, GxFeatureID.INT_EVENT_FRAMESTART_WAIT_FRAMEID)
-        self.EventFrameBurstStartWaitFrameID = IntFeature(self.__dev_handle,
-                                                          GxFeatureID.INT_EVENT_FRAMEBURSTSTART_WAIT_FRAMEID)
-        self.EventSimpleMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_EVENT_SIMPLE_MODE)
-
-        # ---------------LUT Section------------------------------------------
-        self.LUTSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_LUT_SELECTOR)
-        self.LUTValueAll = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_LUT_VALUE_ALL)
-        self.LUTEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_LUT_ENABLE)
-        self.LUTIndex = IntFeature(self.__dev_handle, GxFeatureID.INT_LUT_INDEX)
-        self.LUTValue = IntFeature(self.__dev_handle, GxFeatureID.INT_LUT_VALUE)
-        self.LUTFactoryStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_LUT_FACTORY_STATUS)
-
-        # ---------------ChunkData Section------------------------------------
-        self.ChunkModeActive = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_CHUNK_MODE_ACTIVE)
-        self.ChunkSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CHUNK_SELECTOR)
-        self.ChunkEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_CHUNK_ENABLE)
-
-        # ---------------Color Transformation Control-------------------------
-        self.ColorTransformationMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COLOR_TRANSFORMATION_MODE)
-        self.ColorTransformationEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_COLOR_TRANSFORMATION_ENABLE)
-        self.ColorTransformationValueSelector = EnumFeature(self.__dev_handle,
-                                                            GxFeatureID.ENUM_COLOR_TRANSFORMATION_VALUE_SELECTOR)
-        self.ColorTransformationValue = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_COLOR_TRANSFORMATION_VALUE)
-        self.SaturationMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SATURATION_MODE)
-        self.Saturation = IntFeature(self.__dev_handle, GxFeatureID.INT_SATURATION)
-
-        # ---------------CounterAndTimerControl Section-----------------------
-        self.TimerSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TIMER_SELECTOR)
-        self.TimerDuration = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TIMER_DURATION)
-        self.TimerDelay = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_TIMER_DELAY)
-        self.TimerTriggerSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TIMER_TRIGGER_SOURCE)
-        self.CounterSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COUNTER_SELECTOR)
-        self.CounterEventSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COUNTER_EVENT_SOURCE)
-        self.CounterResetSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COUNTER_RESET_SOURCE)
-        self.CounterResetActivation = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COUNTER_RESET_ACTIVATION)
-        self.CounterReset = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_COUNTER_RESET)
-        self.CounterTriggerSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_COUNTER_TRIGGER_SOURCE)
-        self.CounterDuration = IntFeature(self.__dev_handle, GxFeatureID.INT_COUNTER_DURATION)
-        self.TimerTriggerActivation = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TIMER_TRIGGER_ACTIVATION)
-        self.CounterValue = IntFeature(self.__dev_handle, GxFeatureID.INT_COUNTER_VALUE)
-
-        # ---------------RemoveParameterLimitControl Section------------------
-        self.RemoveParameterLimit = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_REMOVE_PARAMETER_LIMIT)
-
-        # ---------------HDRControl Section------------------
-        self.HDRMode = EnumFeature(self.__dev_handle,GxFeatureID.ENUM_HDR_MODE)
-        self.HDRTargetLongValue = IntFeature(self.__dev_handle, GxFeatureID.INT_HDR_TARGET_LONG_VALUE)
-        self.HDRTargetShortValue = IntFeature(self.__dev_handle, GxFeatureID.INT_HDR_TARGET_SHORT_VALUE)
-        self.HDRTargetMainValue = IntFeature(self.__dev_handle, GxFeatureID.INT_HDR_TARGET_MAIN_VALUE)
-
-        # ---------------MultiGrayControl Section------------------
-        self.MGCMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_MGC_MODE)
-        self.MGCSelector = IntFeature(self.__dev_handle, GxFeatureID.INT_MGC_SELECTOR)
-        self.MGCExposureTime = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_MGC_EXPOSURE_TIME)
-        self.MGCGain = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_MGC_GAIN)
-
-        # ---------------ImageQualityControl Section------------------
-        self.StripedCalibrationInfo = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_STRIPED_CALIBRATION_INFO)
-        self.Contrast = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_CONTRAST)
-        self.HotPixelCorrection = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_HOTPIXEL_CORRECTION)
-
-        # ---------------GyroControl Section------------------
-        self.IMUData = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_IMU_DATA)
-        self.IMUConfigAccRange = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_ACC_RANGE)
-        self.IMUConfigAccOdrLowPassFilterSwitch = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_SWITCH)
-        self.IMUConfigAccOdr = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR)
-        self.IMUConfigAccOdrLowPassFilterFrequency = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_IMU_CONFIG_ACC_ODR_LOW_PASS_FILTER_FREQUENCY)
-        self.IMUConfigGyroXRange = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_GYRO_XRANGE)
-        self.IMUConfigGyroYRange = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_GYRO_YRANGE)
-        self.IMUConfigGyroZRange = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_GYRO_ZRANGE)
-        self.IMUConfigGyroOdrLowPassFilterSwitch = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_SWITCH)
-        self.IMUConfigGyroOdr = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR)
-        self.IMUConfigGyroOdrLowPassFilterFrequency = EnumFeature(self.__dev_handle,
-                                                        GxFeatureID.ENUM_IMU_CONFIG_GYRO_ODR_LOW_PASS_FILTER_FREQUENCY)
-        self.IMURoomTemperature = FloatFeature(self.__dev_handle, GxFeatureID.FLOAT_IMU_ROOM_TEMPERATURE)
-        self.IMUTemperatureOdr = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMU_TEMPERATURE_ODR)
-
-        # ---------------FrameBufferControl Section------------------
-        self.FrameBufferCount = IntFeature(self.__dev_handle, GxFeatureID.INT_FRAME_BUFFER_COUNT)
-        self.FrameBufferFlush = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_FRAME_BUFFER_FLUSH)
-
-        # ---------------SerialPortControl Section------------------
-        self.DeviceSerialPortSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SERIALPORT_SELECTOR)
-        self.SerialPortSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SERIALPORT_SOURCE)
-        self.DeviceSerialPortBaudRate = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SERIALPORT_BAUDRATE)
-        self.SerialPortDataBits = IntFeature(self.__dev_handle, GxFeatureID.INT_SERIALPORT_DATA_BITS)
-        self.SerialPortStopBits = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SERIALPORT_STOP_BITS)
-        self.SerialPortParity = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SERIALPORT_PARITY)
-        self.TransmitQueueMaxCharacterCount = IntFeature(self.__dev_handle,
-                                                         GxFeatureID.INT_TRANSMIT_QUEUE_MAX_CHARACTER_COUNT)
-        self.TransmitQueueCurrentCharacterCount = IntFeature(self.__dev_handle,
-                                                             GxFeatureID.INT_TRANSMIT_QUEUE_CURRENT_CHARACTER_COUNT)
-        self.ReceiveQueueMaxCharacterCount = IntFeature(self.__dev_handle,
-                                                        GxFeatureID.INT_RECEIVE_QUEUE_MAX_CHARACTER_COUNT)
-        self.ReceiveQueueCurrentCharacterCount = IntFeature(self.__dev_handle,
-                                                            GxFeatureID.INT_RECEIVE_QUEUE_CURRENT_CHARACTER_COUNT)
-        self.ReceiveFramingErrorCount = IntFeature(self.__dev_handle, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
-        self.ReceiveParityErrorCount = IntFeature(self.__dev_handle, GxFeatureID.INT_RECEIVE_PARITY_ERROR_COUNT)
-        self.ReceiveQueueClear = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_RECEIVE_QUEUE_CLEAR)
-        self.SerialPortData = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_SERIALPORT_DATA)
-        self.SerialPortDataLength = IntFeature(self.__dev_handle, GxFeatureID.INT_SERIALPORT_DATA_LENGTH)
-        self.SerialPortDetectionStatus = IntFeature(self.__dev_handle, GxFeatureID.INT_SERIAL_PORT_DETECTION_STATUS)
-
-        # ---------------CoaXPress Section------------------
-        self.CxpLinkConfiguration = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CXP_LINK_CONFIGURATION)
-        self.CxpLinkConfigurationPreferred = EnumFeature(self.__dev_handle,
-                                                         GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_PREFERRED)
-        self.CxpLinkConfigurationStatus = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CXP_LINK_CONFIGURATION_STATUS)
-        self.Image1StreamID = IntFeature(self.__dev_handle, GxFeatureID.INT_IMAGE1_STREAM_ID)
-        self.CxpConnectionSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CXP_CONNECTION_SELECTOR)
-        self.CxpConnectionTestMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_CXP_CONNECTION_TEST_MODE)
-        self.CxpConnectionTestErrorCount = IntFeature(self.__dev_handle, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
-        self.CxpConnectionTestPacketRxCount = IntFeature(self.__dev_handle, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
-        self.CxpConnectionTestPacketTxCount = IntFeature(self.__dev_handle, GxFeatureID.INT_RECEIVE_FRAMING_ERROR_COUNT)
-
-        # ---------------SequencerControl Section------------------
-        self.SequencerMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SEQUENCER_MODE)
-        self.SequencerConfigurationMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SEQUENCER_CONFIGURATION_MODE)
-        self.SequencerFeatureSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SEQUENCER_FEATURE_SELECTOR)
-        self.SequencerFeatureEnable = BoolFeature(self.__dev_handle, GxFeatureID.BOOL_SEQUENCER_FEATURE_ENABLE)
-        self.SequencerSetSelector = IntFeature(self.__dev_handle, GxFeatureID.INT_SEQUENCER_SET_SELECTOR)
-        self.SequencerSetCount = IntFeature(self.__dev_handle, GxFeatureID.INT_SEQUENCER_SET_COUNT)
-        self.SequencerSetActive = IntFeature(self.__dev_handle, GxFeatureID.INT_SEQUENCER_SET_ACTIVE)
-        self.SequencerSetReset = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_SEQUENCER_SET_RESET)
-        self.SequencerPathSelector = IntFeature(self.__dev_handle, GxFeatureID.INT_SEQUENCER_PATH_SELECTOR)
-        self.SequencerSetNext = IntFeature(self.__dev_handle, GxFeatureID.INT_SEQUENCER_SET_NEXT)
-        self.SequencerTriggerSource = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_SEQUENCER_TRIGGER_SOURCE)
-        self.SequencerSetSave = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_SEQUENCER_SET_SAVE)
-        self.SequencerSetLoad = CommandFeature(self.__dev_handle, GxFeatureID.COMMAND_SEQUENCER_SET_LOAD)
-
-        # ---------------EnoderControl Section------------------
-        self.EncoderSelector = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ENCODER_SELECTOR)
-        self.EncoderDirection = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ENCODER_DIRECTION)
-        self.EncoderValue = IntFeature(self.__dev_handle, GxFeatureID.INT_ENCODER_VALUE)
-        self.EncoderSourceA = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ENCODER_SOURCEA)
-        self.EncoderSourceB = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ENCODER_SOURCEB)
-        self.EncoderMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_ENCODER_MODE)
         self.__get_stream_handle()
 
     def __get_stream_handle(self):
@@ -493,7 +499,7 @@ class Device:
             status, stream_handle = gx_get_data_stream_handle_from_device(self.__dev_handle, index + 1)
             StatusProcessor.process(status, 'Device', '__get_stream_handle')
 
-            self.data_stream.append(DataStream( self.__dev_handle, stream_handle))
+            self.data_stream.append(self.data_stream_class(self.__dev_handle, stream_handle))
 
     def get_stream_channel_num(self):
         """
@@ -510,6 +516,13 @@ class Device:
         """
         return  self.__interface_obj
 
+    def get_feature_handle(self):
+        """
+        :brief      Get the handle the feature attributes are created with
+        :return:    Device handle, None after close_device
+        """
+        return self.__dev_handle
+
 
     def close_device(self):
         """
@@ -518,6 +531,7 @@ class Device:
         """
         status = gx_close_device(self.__dev_handle)
         StatusProcessor.process(status, 'Device', 'close_device')
+        FeatureCache.enable(self.__dev_handle, False)
         self.__dev_handle = None
         self.__py_offline_callback = None
         self.__offline_callback_handle = None
@@ -687,10 +701,14 @@ class Device:
                     Interface is obsolete.
         :return:    none
         """
+        self.data_stream[0].apply_buffer_tuning()
         payload_size = self.data_stream[0].get_payload_size()
         self.data_stream[0].set_payload_size(payload_size)
+        self.data_stream[0].allocate_buffer_pool()
         status = gx_send_command(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_START)
         StatusProcessor.process(status, 'Device', 'stream_on')
+        # nodes locked during the acquisition change their access mode
+        FeatureCache.changed(self.__dev_handle)
         self.data_stream[0].set_acquisition_flag(True)
 
     def stream_off(self,stream_index = 0):
@@ -701,7 +719,122 @@ class Device:
         """
         status = gx_send_command(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_STOP)
         StatusProcessor.process(status, 'Device', 'stream_off')
+        FeatureCache.changed(self.__dev_handle)
         self.data_stream[0].set_acquisition_flag(False)
+        self.data_stream[0].release_buffer_pool()
+
+    def __get_stream_list(self, stream_indices, func_name):
+        """
+        :brief      Get the stream objects of the stream indices
+        :param      stream_indices: stream index list, start from 1, None means all streams
+        :param      func_name:      calling function name
+        :return:    stream object list
+        """
+        if stream_indices is None:
+            return list(self.data_stream)
+
+        if not isinstance(stream_indices, (list, tuple)):
+            raise ParameterTypeError("Device.%s: "
+                                     "Expected stream_indices type is list, not %s" % (func_name, type(stream_indices)))
+
+        stream_list = []
+        for stream_index in stream_indices:
+            if not isinstance(stream_index, INT_TYPE):
+                raise ParameterTypeError("Device.%s: "
+                                         "Expected stream_index type is int, not %s" % (func_name, type(stream_index)))
+
+            if stream_index < 1 or stream_index > len(self.data_stream):
+                raise NotFoundDevice("Device.%s: invalid stream index %d, range:[1, %d]"
+                                     % (func_name, stream_index, len(self.data_stream)))
+
+            stream_list.append(self.data_stream[stream_index - 1])
+
+        return stream_list
+
+    def start_streams(self, stream_indices=None):
+        """
+        :brief      Start acquisition on the data streams. Each stream applies its own settings: the payload size,
+                    the buffer pool (DataStream.set_buffer_pool) and the background grab
+                    (DataStream.set_background_grab). Set the acquisition buffer number of each stream with
+                    DataStream.set_acquisition_buffer_number before calling this function.
+                    The SDK dequeues and flushes the frames of all data streams through the device handle, so
+                    one background grabber runs per device: it is started on the first stream that asks for
+                    one, see get_background_grabber.
+        :param      stream_indices: stream index list, start from 1, None means all streams
+        :return:    started stream object list
+        """
+        stream_list = self.__get_stream_list(stream_indices, 'start_streams')
+        acquisition_running = any(stream.acquisition_flag for stream in self.data_stream)
+
+        for stream in stream_list:
+            if stream.acquisition_flag:
+                continue
+            stream.apply_buffer_tuning()
+            stream.set_payload_size(stream.get_payload_size())
+            stream.allocate_buffer_pool()
+
+        # the acquisition is started once per device, later streams join the running acquisition
+        if not acquisition_running:
+            if hasattr(dll, 'GXStreamOn'):
+                status = gx_stream_on(self.__dev_handle)
+            else:
+                status = gx_send_command(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_START)
+            StatusProcessor.process(status, 'Device', 'start_streams')
+            # nodes locked during the acquisition change their access mode
+            FeatureCache.changed(self.__dev_handle)
+
+        for stream in stream_list:
+            if stream.acquisition_flag:
+                continue
+            stream.set_acquisition_flag(True)
+            background_grab_param = stream.get_background_grab_param()
+            if background_grab_param is not None and self.get_background_grabber() is None:
+                stream.start_background_grab(*background_grab_param)
+
+        return stream_list
+
+    def get_background_grabber(self):
+        """
+        :brief      Get the running background grabber of the device, it receives the frames of all data streams
+        :return:    FrameGrabber object, None when no background grab is running
+        """
+        for stream in self.data_stream:
+            grabber = stream.get_background_grabber()
+            if grabber is not None and grabber.is_running():
+                return grabber
+        return None
+
+    def stop_streams(self, stream_indices=None, drain=True):
+        """
+        :brief      Stop acquisition on the data streams, the acquisition of the device stops with the last stream.
+                    The background grabber of the device stops with the stream it runs on.
+        :param      stream_indices: stream index list, start from 1, None means all streams
+        :param      drain:          True: flush the frames still queued in the SDK when the acquisition of the
+                                    device stops, the queue is shared by all data streams and is not flushed
+                                    while other streams keep running
+        :return:    none
+        """
+        stream_list = self.__get_stream_list(stream_indices, 'stop_streams')
+
+        for stream in stream_list:
+            stream.stop_background_grab()
+
+        stopping = any(stream.acquisition_flag for stream in stream_list)
+        if stopping and all(stream.acquisition_flag is False or stream in stream_list for stream in self.data_stream):
+            if hasattr(dll, 'GXStreamOff'):
+                status = gx_stream_off(self.__dev_handle)
+            else:
+                status = gx_send_command(self.__dev_handle, GxFeatureID.COMMAND_ACQUISITION_STOP)
+            StatusProcessor.process(status, 'Device', 'stop_streams')
+            FeatureCache.changed(self.__dev_handle)
+
+            # one flush empties the queue of the device
+            if drain:
+                stream_list[0].flush_queue()
+
+        for stream in stream_list:
+            stream.set_acquisition_flag(False)
+            stream.release_buffer_pool()
 
     def export_config_file(self, file_path):
         """
@@ -736,6 +869,7 @@ class Device:
 
         status = gx_import_config_file(self.__dev_handle, file_path, verify)
         StatusProcessor.process(status, 'Device', 'import_config_file')
+        FeatureCache.changed(self.__dev_handle)
 
     def register_device_feature_callback(self, callback_func, feature_id, args):
         """
@@ -816,6 +950,7 @@ class Device:
         :brief      Device feature event callback function with an unused c_void_p.
         :return:    none
         """
+        FeatureCache.changed(self.__dev_handle)
         self.__py_feature_callback(c_feature_id, c_user_param)
 
     def __on_device_feature_callback_char(self, c_feature_name, c_user_param):
@@ -823,6 +958,7 @@ class Device:
         :brief      Device feature event callback function with an unused c_void_p.
         :return:    none
         """
+        FeatureCache.changed(self.__dev_handle, string_decoding(c_feature_name))
         self.__py_feature_callback_char(c_feature_name, c_user_param)
 
     def read_remote_device_port(self, address, buff, size):
@@ -860,6 +996,7 @@ class Device:
 
         status, r_size = gx_write_remote_device_port(self.__dev_handle, address, buf, size)
         StatusProcessor.process(status, 'Device', 'write_remote_device_port')
+        FeatureCache.changed(self.__dev_handle)
 
     def read_remote_device_port_stacked(self, entries, size):
         """
@@ -893,6 +1030,7 @@ class Device:
 
         status = gx_set_write_remote_device_port_stacked(self.__dev_handle, entries, size)
         StatusProcessor.process(status, 'Device', 'set_write_remote_device_port_stacked')
+        FeatureCache.changed(self.__dev_handle)
 
     def create_image_process_config(self):
         """
@@ -932,22 +1070,25 @@ class Device:
 
 
 class GEVDevice(Device):
+    data_stream_class = GEVDataStream
+
+    GevCurrentIPConfigurationLLA = FeatureDescriptor(BoolFeature,
+                                                     GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA)
+    GevCurrentIPConfigurationDHCP = FeatureDescriptor(BoolFeature,
+                                                      GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP)
+    GevCurrentIPConfigurationPersistentIP = FeatureDescriptor(BoolFeature,
+                                                              GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP)
+    EstimatedBandwidth = FeatureDescriptor(IntFeature, GxFeatureID.INT_ESTIMATED_BANDWIDTH)
+    GevHeartbeatTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT)
+    GevSCPSPacketSize = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_PACKET_SIZE)
+    GevSCPD = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_PACKET_DELAY)
+    GevLinkSpeed = FeatureDescriptor(IntFeature, GxFeatureID.INT_GEV_LINK_SPEED)
+    DeviceCommandTimeout = FeatureDescriptor(IntFeature, GxFeatureID.INT_COMMAND_TIMEOUT)
+    DeviceCommandRetryCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_COMMAND_RETRY_COUNT)
+
     def __init__(self, handle, interface_obj):
         self.__dev_handle = handle
         Device.__init__(self, self.__dev_handle, interface_obj)
-        self.GevCurrentIPConfigurationLLA = BoolFeature(self.__dev_handle,
-                                                        GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_LLA)
-        self.GevCurrentIPConfigurationDHCP = BoolFeature(self.__dev_handle,
-                                                         GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_DHCP)
-        self.GevCurrentIPConfigurationPersistentIP = BoolFeature(self.__dev_handle,
-                                                                 GxFeatureID.BOOL_GEV_CURRENT_IP_CONFIGURATION_PERSISTENT_IP)
-        self.EstimatedBandwidth = IntFeature(self.__dev_handle, GxFeatureID.INT_ESTIMATED_BANDWIDTH)
-        self.GevHeartbeatTimeout = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_HEARTBEAT_TIMEOUT)
-        self.GevSCPSPacketSize = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_PACKET_SIZE)
-        self.GevSCPD = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_PACKET_DELAY)
-        self.GevLinkSpeed = IntFeature(self.__dev_handle, GxFeatureID.INT_GEV_LINK_SPEED)
-        self.DeviceCommandTimeout = IntFeature(self.__dev_handle, GxFeatureID.INT_COMMAND_TIMEOUT)
-        self.DeviceCommandRetryCount = IntFeature(self.__dev_handle, GxFeatureID.INT_COMMAND_RETRY_COUNT)
 
 class U3VDevice(Device):
     """
@@ -965,22 +1106,23 @@ class U2Device(Device):
     The U2Device class inherits from the Device class
     """
 
+    AcquisitionSpeedLevel = FeatureDescriptor(IntFeature, GxFeatureID.INT_ACQUISITION_SPEED_LEVEL)
+    AcquisitionFrameCount = FeatureDescriptor(IntFeature, GxFeatureID.INT_ACQUISITION_FRAME_COUNT)
+    TriggerSwitch = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_TRIGGER_SWITCH)
+    UserOutputMode = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_USER_OUTPUT_MODE)
+    StrobeSwitch = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_STROBE_SWITCH)
+    ADCLevel = FeatureDescriptor(IntFeature, GxFeatureID.INT_ADC_LEVEL)
+    HBlanking = FeatureDescriptor(IntFeature, GxFeatureID.INT_H_BLANKING)
+    VBlanking = FeatureDescriptor(IntFeature, GxFeatureID.INT_V_BLANKING)
+    UserPassword = FeatureDescriptor(StringFeature, GxFeatureID.STRING_USER_PASSWORD)
+    VerifyPassword = FeatureDescriptor(StringFeature, GxFeatureID.STRING_VERIFY_PASSWORD)
+    UserData = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_USER_DATA)
+    AALightEnvironment = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_AA_LIGHT_ENVIRONMENT)
+    FrameInformation = FeatureDescriptor(BufferFeature, GxFeatureID.BUFFER_FRAME_INFORMATION)
+    ImageGrayRaiseSwitch = FeatureDescriptor(EnumFeature, GxFeatureID.ENUM_IMAGE_GRAY_RAISE_SWITCH)
+
     def __init__(self, handle, interface_obj):
         self.__dev_handle = handle
         Device.__init__(self, self.__dev_handle, interface_obj)
-        self.AcquisitionSpeedLevel = IntFeature(self.__dev_handle, GxFeatureID.INT_ACQUISITION_SPEED_LEVEL)
-        self.AcquisitionFrameCount = IntFeature(self.__dev_handle, GxFeatureID.INT_ACQUISITION_FRAME_COUNT)
-        self.TriggerSwitch = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_TRIGGER_SWITCH)
-        self.UserOutputMode = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_USER_OUTPUT_MODE)
-        self.StrobeSwitch = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_STROBE_SWITCH)
-        self.ADCLevel = IntFeature(self.__dev_handle, GxFeatureID.INT_ADC_LEVEL)
-        self.HBlanking = IntFeature(self.__dev_handle, GxFeatureID.INT_H_BLANKING)
-        self.VBlanking = IntFeature(self.__dev_handle, GxFeatureID.INT_V_BLANKING)
-        self.UserPassword = StringFeature(self.__dev_handle, GxFeatureID.STRING_USER_PASSWORD)
-        self.VerifyPassword = StringFeature(self.__dev_handle, GxFeatureID.STRING_VERIFY_PASSWORD)
-        self.UserData = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_USER_DATA)
-        self.AALightEnvironment = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_AA_LIGHT_ENVIRONMENT)
-        self.FrameInformation = BufferFeature(self.__dev_handle, GxFeatureID.BUFFER_FRAME_INFORMATION)
-        self.ImageGrayRaiseSwitch = EnumFeature(self.__dev_handle, GxFeatureID.ENUM_IMAGE_GRAY_RAISE_SWITCH)
 
 
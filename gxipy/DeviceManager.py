@@ -641,12 +641,13 @@ class DeviceManager(object):
         status = gx_gige_ip_configuration(mac_address, ipconfig_flag, ip_address, subnet_mask, default_gateway, user_id)
         StatusProcessor.process(status, 'DeviceManager', 'gige_ip_configuration')
 
-    def create_image_format_convert(self):
+    def create_image_format_convert(self, backend=DxConvertBackend.AUTO):
         """
         :brief      create new convert pointer
+        :param      backend:    conversion backend, See detail in DxConvertBackend
         :return:    GxImageFormatConvert
         """
-        image_format_convert = ImageFormatConvert()
+        image_format_convert = ImageFormatConvert(backend)
         return image_format_convert
 
     def create_flat_field_correction(self):
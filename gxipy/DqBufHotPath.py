@@ -0,0 +1,116 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxwrapper import *
+from gxipy.gxidef import *
+from gxipy.Exception import *
+from gxipy.StatusProcessor import *
+import ctypes
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+
+class DqBufHotPath:
+    """
+    :brief      Prepared dq_buf/q_buf path for high frame rates. The SDK functions, the device handle,
+                the timeout and the output pointer are bound once, dq_buf returns the GxFrameBuffer of the SDK
+                without creating GxFrameData/RawImage objects or copying the image data.
+                Use DataStream.prepare_dq_buf to create it, do not mix it with DataStream.dq_buf.
+    """
+    def __init__(self, dev_handle, timeout, frame_statistics=None, preview_tap=None):
+        """
+        :brief      Constructor for instance initialization
+        :param      dev_handle:         Device handle
+        :param      timeout:            Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :param      frame_statistics:   FrameStatistics object the dequeued frames are accounted in, or None
+        :param      preview_tap:        PreviewTap object the dequeued frames are offered to, or None
+        """
+        if not hasattr(dll, "GXDQBuf") or not hasattr(dll, "GXQBuf"):
+            raise NoImplemented("DqBufHotPath: GXDQBuf/GXQBuf is not supported by the library")
+
+        self.__dq_buf_func = dll.GXDQBuf
+        self.__q_buf_func = dll.GXQBuf
+        self.__handle_c = c_void_p(dev_handle)
+        self.__timeout_c = c_uint(timeout)
+        self.__ptr_frame_buffer = ctypes.POINTER(GxFrameBuffer)()
+        self.__byref_frame_buffer = ctypes.byref(self.__ptr_frame_buffer)
+        self.__frame_statistics = frame_statistics
+        self.__preview_tap = preview_tap
+
+    def set_timeout(self, timeout):
+        """
+        :brief      Set the acquisition timeout
+        :param      timeout:    Acquisition timeout, range:[0, 0xFFFFFFFF]
+        :return:    none
+        """
+        if not isinstance(timeout, INT_TYPE):
+            raise ParameterTypeError("DqBufHotPath.set_timeout: "
+                                     "Expected timeout type is int, not %s" % type(timeout))
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            raise OutOfRange("DqBufHotPath.set_timeout: timeout out of bounds, minimum=0, maximum=%s"
+                             % hex(UNSIGNED_INT_MAX).__str__())
+
+        self.__timeout_c.value = timeout
+
+    def set_preview_tap(self, preview_tap):
+        """
+        :brief      Set the live view the dequeued frames are offered to, called by DataStream.start_preview
+                    and DataStream.stop_preview
+        :param      preview_tap:    PreviewTap object, or None
+        :return:    none
+        """
+        self.__preview_tap = preview_tap
+
+    def dq_buf(self):
+        """
+        :brief      Dequeue a frame buffer, give it back with q_buf
+        :return:    GxFrameBuffer of the SDK, None on timeout
+        """
+        status = self.__dq_buf_func(self.__handle_c, self.__byref_frame_buffer, self.__timeout_c)
+        if status == GxStatusList.SUCCESS:
+            frame_buffer = self.__ptr_frame_buffer.contents
+            if self.__frame_statistics is not None:
+                self.__frame_statistics.update(frame_buffer.frame_id, frame_buffer.timestamp, frame_buffer.status)
+            if self.__preview_tap is not None:
+                self.__preview_tap.offer(frame_buffer)
+            return frame_buffer
+        elif status == GxStatusList.TIMEOUT:
+            return None
+        else:
+            StatusProcessor.process(status, 'DqBufHotPath', 'dq_buf')
+            return None
+
+    def q_buf(self, frame_buffer):
+        """
+        :brief      Give a frame buffer back to the SDK, frame_buffer and its numpy views are invalid afterwards
+        :param      frame_buffer:   GxFrameBuffer returned by dq_buf
+        :return:    none
+        """
+        status = self.__q_buf_func(self.__handle_c, ctypes.byref(frame_buffer))
+        if status != GxStatusList.SUCCESS:
+            StatusProcessor.process(status, 'DqBufHotPath', 'q_buf')
+
+    @staticmethod
+    def get_numpy_array(frame_buffer):
+        """
+        :brief      Return a numpy view onto the frame buffer image data without copying,
+                    only valid until q_buf
+        :param      frame_buffer:   GxFrameBuffer returned by dq_buf
+        :return:    numpy.Array objects, 8bit and 16bit formats: height * width, other formats: the raw bytes
+        """
+        image_array = (ctypes.c_ubyte * frame_buffer.image_size).from_address(frame_buffer.image_buf)
+        pixel_bit = frame_buffer.pixel_format & PIXEL_BIT_MASK
+        if pixel_bit == GX_PIXEL_8BIT:
+            return numpy.frombuffer(image_array, dtype=numpy.ubyte, count=frame_buffer.width * frame_buffer.height). \
+                reshape(frame_buffer.height, frame_buffer.width)
+        elif pixel_bit == GX_PIXEL_16BIT:
+            return numpy.frombuffer(image_array, dtype=numpy.uint16, count=frame_buffer.width * frame_buffer.height). \
+                reshape(frame_buffer.height, frame_buffer.width)
+        else:
+            return numpy.frombuffer(image_array, dtype=numpy.ubyte, count=frame_buffer.image_size)
@@ -7,6 +7,7 @@
 from gxipy.gxiapi import *
 from gxipy.ImageProc import *
 from gxipy.StatusProcessor import *
+from gxipy.FeatureCache import *
 
 if sys.version_info.major > 2:
     INT_TYPE = int
@@ -40,13 +41,7 @@ class Feature:
         brief:  Determining whether the feature is implemented
         return: is_implemented
         """
-        status, is_implemented = gx_is_implemented(self.__handle, self.__feature)
-        if status == GxStatusList.SUCCESS:
-            return is_implemented
-        elif status == GxStatusList.INVALID_PARAMETER:
-            return False
-        else:
-            StatusProcessor.process(status, 'Feature', 'is_implemented')
+        return FeatureCache.lookup(self.__handle, self.feature_name, 'implemented', self.__get_implemented)
 
     def is_readable(self):
         """
@@ -57,9 +52,7 @@ class Feature:
         if not implemented:
             return False
 
-        status, is_readable = gx_is_readable(self.__handle, self.__feature)
-        StatusProcessor.process(status, 'Feature', 'is_readable')
-        return is_readable
+        return FeatureCache.lookup(self.__handle, self.feature_name, 'readable', self.__get_readable)
 
     def is_writable(self):
         """
@@ -70,6 +63,35 @@ class Feature:
         if not implemented:
             return False
 
+        return FeatureCache.lookup(self.__handle, self.feature_name, 'writable', self.__get_writable)
+
+    def __get_implemented(self):
+        """
+        brief:  Read from the device whether the feature is implemented
+        return: is_implemented
+        """
+        status, is_implemented = gx_is_implemented(self.__handle, self.__feature)
+        if status == GxStatusList.SUCCESS:
+            return is_implemented
+        elif status == GxStatusList.INVALID_PARAMETER:
+            return False
+        else:
+            StatusProcessor.process(status, 'Feature', 'is_implemented')
+
+    def __get_readable(self):
+        """
+        brief:  Read from the device whether the feature is readable
+        return: is_readable
+        """
+        status, is_readable = gx_is_readable(self.__handle, self.__feature)
+        StatusProcessor.process(status, 'Feature', 'is_readable')
+        return is_readable
+
+    def __get_writable(self):
+        """
+        brief:  Read from the device whether the feature is writable
+        return: is_writable
+        """
         status, is_writable = gx_is_writable(self.__handle, self.__feature)
         StatusProcessor.process(status, 'Feature', 'is_writable')
         return is_writable
@@ -108,6 +130,13 @@ class IntFeature(Feature):
             #print("%s.get_range is not support" % self.feature_name)
             raise NoImplemented("%s.get_range is not support" % self.feature_name)
 
+        return dict(FeatureCache.lookup(self.__handle, self.feature_name, 'range', self.__get_range))
+
+    def __get_range(self):
+        """
+        :brief      Read the integer range from the device
+        :return:    integer range dictionary
+        """
         status, int_range = gx_get_int_range(self.__handle, self.__feature)
         StatusProcessor.process(status, 'IntFeature', 'get_range')
         return self.__range_dict(int_range)
@@ -136,6 +165,9 @@ class IntFeature(Feature):
             raise ParameterTypeError("IntFeature.set: "
                                      "Expected int_value type is int, not %s" % type(int_value))
 
+        if FeatureCache.unchanged(self.__handle, self.feature_name, int_value):
+            return
+
         writeable = self.is_writable()
         if not writeable:
             #print("%s.set: is not writeable" % self.feature_name)
@@ -154,6 +186,7 @@ class IntFeature(Feature):
 
         status = gx_set_int(self.__handle, self.__feature, int_value)
         StatusProcessor.process(status, 'IntFeature', 'set')
+        FeatureCache.written(self.__handle, self.feature_name, True, int_value)
 
 
 class FloatFeature(Feature):
@@ -191,6 +224,13 @@ class FloatFeature(Feature):
             #print("%s.get_range is not support" % self.feature_name)
             raise NoImplemented("%s.get_range is not support" % self.feature_name)
 
+        return dict(FeatureCache.lookup(self.__handle, self.feature_name, 'range', self.__get_range))
+
+    def __get_range(self):
+        """
+        :brief      Read the float range from the device
+        :return:    float range dictionary
+        """
         status, float_range = gx_get_float_range(self.__handle, self.__feature)
         StatusProcessor.process(status, 'FloatFeature', 'get_range')
         return self.__range_dict(float_range)
@@ -219,6 +259,9 @@ class FloatFeature(Feature):
             raise ParameterTypeError("FloatFeature.set: "
                                      "Expected float_value type is float, not %s" % type(float_value))
 
+        if FeatureCache.unchanged(self.__handle, self.feature_name, float_value):
+            return
+
         writeable = self.is_writable()
         if not writeable:
             #print("%s.set: is not writeable" % self.feature_name)
@@ -235,6 +278,7 @@ class FloatFeature(Feature):
 
         status = gx_set_float(self.__handle, self.__feature, float_value)
         StatusProcessor.process(status, 'FloatFeature', 'set')
+        FeatureCache.written(self.__handle, self.feature_name, True, float_value)
 
 
 class EnumFeature(Feature):
@@ -257,6 +301,13 @@ class EnumFeature(Feature):
             #print("%s.get_range: is not support" % self.feature_name)
             raise NoImplemented("%s.get_range: is not support" % self.feature_name)
 
+        return dict(FeatureCache.lookup(self.__handle, self.feature_name, 'enum_dict', self.__get_range))
+
+    def __get_range(self):
+        """
+        :brief      Read the Enum entries from the device
+        :return:    enum_dict:    enum range dictionary
+        """
         status, enum_num = gx_get_enum_entry_nums(self.__handle, self.__feature)
         StatusProcessor.process(status, 'EnumFeature', 'get_range')
 
@@ -297,6 +348,9 @@ class EnumFeature(Feature):
             raise ParameterTypeError("EnumFeature.set: "
                                      "Expected enum_value type is int, not %s" % type(enum_value))
 
+        if FeatureCache.unchanged(self.__handle, self.feature_name, enum_value):
+            return
+
         writeable = self.is_writable()
         if not writeable:
             #print("%s.set: is not writeable" % self.feature_name)
@@ -313,6 +367,7 @@ class EnumFeature(Feature):
 
         status = gx_set_enum(self.__handle, self.__feature, enum_value)
         StatusProcessor.process(status, 'EnumFeature', 'set')
+        FeatureCache.written(self.__handle, self.feature_name, False, enum_value)
 
 
 class BoolFeature(Feature):
@@ -349,6 +404,9 @@ class BoolFeature(Feature):
             raise ParameterTypeError("BoolFeature.set: "
                                      "Expected bool_value type is bool, not %s" % type(bool_value))
 
+        if FeatureCache.unchanged(self.__handle, self.feature_name, bool_value):
+            return
+
         writeable = self.is_writable()
         if not writeable:
             #print("%s.set: is not writeable" % self.feature_name)
@@ -356,6 +414,7 @@ class BoolFeature(Feature):
 
         status = gx_set_bool(self.__handle, self.__feature, bool_value)
         StatusProcessor.process(status, 'BoolFeature', 'set')
+        FeatureCache.written(self.__handle, self.feature_name, False, bool_value)
 
 
 class StringFeature(Feature):
@@ -378,6 +437,13 @@ class StringFeature(Feature):
             #print("%s.get_string_max_length is not support" % self.feature_name)
             raise NoImplemented("%s.get_string_max_length is not support" % self.feature_name)
 
+        return FeatureCache.lookup(self.__handle, self.feature_name, 'max_length', self.__get_string_max_length)
+
+    def __get_string_max_length(self):
+        """
+        :brief      Read the maximum string length from the device
+        :return:    length:     the maximum length that string can set
+        """
         status, length = gx_get_string_max_length(self.__handle, self.__feature)
         StatusProcessor.process(status, 'StringFeature', 'get_string_max_length')
         return length
@@ -406,6 +472,9 @@ class StringFeature(Feature):
             raise ParameterTypeError("StringFeature.set: "
                                      "Expected input_string type is str, not %s" % type(input_string))
 
+        if FeatureCache.unchanged(self.__handle, self.feature_name, input_string):
+            return
+
         writeable = self.is_writable()
         if not writeable:
             #print("%s.set: is not writeable" % self.feature_name)
@@ -421,6 +490,7 @@ class StringFeature(Feature):
 
         status = gx_set_string(self.__handle, self.__feature, input_string)
         StatusProcessor.process(status, 'StringFeature', 'set')
+        FeatureCache.written(self.__handle, self.feature_name, True, input_string)
 
 
 class BufferFeature(Feature):
@@ -488,6 +558,7 @@ class BufferFeature(Feature):
         status = gx_set_buffer(self.__handle, self.__feature,
                                buf.get_ctype_array(), buf.get_length())
         StatusProcessor.process(status, 'BuffFeature', 'set_buffer')
+        FeatureCache.written(self.__handle, self.feature_name, False)
 
 
 class CommandFeature(Feature):
@@ -512,4 +583,34 @@ class CommandFeature(Feature):
 
         status = gx_send_command(self.__handle, self.__feature)
         StatusProcessor.process(status, 'CommandFeature', 'send_command')
+        FeatureCache.written(self.__handle, self.feature_name, False)
+
+
+
+class FeatureDescriptor:
+    """
+    :brief      Feature attribute of Device and DataStream, the feature object is created on first access and
+                kept in the instance, so the feature name is only asked from the device for the features that
+                are used. The owner class provides the handle with get_feature_handle().
+    """
+    def __init__(self, feature_class, feature):
+        """
+        :param      feature_class:  IntFeature, FloatFeature, EnumFeature, BoolFeature, StringFeature,
+                                    BufferFeature or CommandFeature
+        :param      feature:        The feature code ID
+        """
+        self.__feature_class = feature_class
+        self.__feature = feature
+        self.__attribute_name = None
+
+    def __set_name__(self, owner, name):
+        self.__attribute_name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
 
+        # the instance attribute hides this descriptor from now on
+        feature = self.__feature_class(instance.get_feature_handle(), self.__feature)
+        instance.__dict__[self.__attribute_name] = feature
+        return feature
@@ -0,0 +1,215 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import threading
+import sys
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+_GEOMETRY_FEATURES = ('Width', 'Height', 'OffsetX', 'OffsetY', 'WidthMax', 'HeightMax',
+                      'AcquisitionFrameRate', 'PayloadSize')
+
+# writes of an integer, float or string node change the ranges or access modes of the listed nodes,
+# writes of enum, bool and register nodes and commands invalidate all nodes of the handle
+FEATURE_DEPENDENCIES = {
+    'Width': ('OffsetX', 'AcquisitionFrameRate', 'PayloadSize'),
+    'Height': ('OffsetY', 'AcquisitionFrameRate', 'PayloadSize'),
+    'OffsetX': ('Width',),
+    'OffsetY': ('Height',),
+    'BinningHorizontal': _GEOMETRY_FEATURES,
+    'BinningVertical': _GEOMETRY_FEATURES,
+    'DecimationHorizontal': _GEOMETRY_FEATURES,
+    'DecimationVertical': _GEOMETRY_FEATURES,
+    'ExposureTime': ('AcquisitionFrameRate',),
+    'AcquisitionFrameRate': ('ExposureTime',),
+    'GevSCPSPacketSize': ('AcquisitionFrameRate', 'GevSCPD'),
+    'DeviceLinkThroughputLimit': ('AcquisitionFrameRate',),
+}
+
+# commands that do not change the metadata of any node
+FEATURE_CACHE_VALUE_COMMANDS = ('TriggerSoftware', 'TimestampLatch', 'TimestampReset', 'TimestampLatchReset')
+
+
+class FeatureCache:
+    """
+    :brief      Cache of the feature node metadata of one device handle: implemented, access mode, range,
+                enum entries and length limits. The values of the nodes are never cached.
+                The cache is shared by all feature objects of the handle (FeatureControl, Feature_s and the
+                Device feature attributes) and is off until FeatureCache.enable(handle) is called.
+                Entries are dropped when a write changes dependent nodes (see FEATURE_DEPENDENCIES), when a
+                feature callback of the node fires, when the acquisition starts or stops and by invalidate.
+                With skip_equal the last written value of a node is kept as shadow copy and a write of the
+                same value is skipped, the shadow copies are dropped together with the metadata.
+    """
+    __caches = {}
+    __caches_lock = threading.Lock()
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__entries = {}
+        self.__generation = 0
+        self.__skip_equal = False
+
+    def set_skip_equal(self, skip_equal):
+        """
+        :brief      Skip writes of the value that was written last
+        :param      skip_equal:     True: keep shadow copies of the written values and skip equal writes
+        :return:    none
+        """
+        with self.__lock:
+            self.__skip_equal = skip_equal
+            if not skip_equal:
+                for key in [key for key in self.__entries if key[1] == 'shadow']:
+                    del self.__entries[key]
+
+    def is_skip_equal(self):
+        """
+        :brief      Whether writes of the value that was written last are skipped
+        :return:    True/False
+        """
+        return self.__skip_equal
+
+    def is_equal(self, feature_name, value):
+        """
+        :brief      Whether a value equals the shadow copy of the last written value of a node
+        :param      feature_name:   feature node name
+        :param      value:          value to be written
+        :return:    True: the write can be skipped
+        """
+        if not self.__skip_equal:
+            return False
+
+        with self.__lock:
+            key = (feature_name, 'shadow')
+            if key not in self.__entries:
+                return False
+            shadow = self.__entries[key]
+        # 1 and True or an enum value and its symbolic name are written anyway
+        return type(shadow) is type(value) and shadow == value
+
+    def get(self, feature_name, kind, getter):
+        """
+        :brief      Get a cached metadata value, the getter is called on a miss
+        :param      feature_name:   feature node name
+        :param      kind:           metadata kind, e.g. 'access_mode' or 'range', the Feature and Feature_s
+                                    objects of a handle share the entries, so a kind names one value format
+        :param      getter:         function reading the metadata from the device
+        :return:    metadata value
+        """
+        key = (feature_name, kind)
+        with self.__lock:
+            if key in self.__entries:
+                return self.__entries[key]
+            generation = self.__generation
+
+        value = getter()
+        with self.__lock:
+            # a value read while the cache was invalidated may already be outdated
+            if generation == self.__generation:
+                self.__entries[key] = value
+        return value
+
+    def invalidate(self, feature_name=None):
+        """
+        :brief      Drop cached metadata
+        :param      feature_name:   feature node name, None: all nodes
+        :return:    none
+        """
+        with self.__lock:
+            self.__generation += 1
+            if feature_name is None:
+                self.__entries.clear()
+            else:
+                for key in [key for key in self.__entries if key[0] == feature_name]:
+                    del self.__entries[key]
+
+    def notify_write(self, feature_name, value_only, value=None):
+        """
+        :brief      Drop the metadata a write may have changed and keep the shadow copy of the value
+        :param      feature_name:   written feature node name
+        :param      value_only:     True: integer, float or string node, only the dependent nodes in
+                                    FEATURE_DEPENDENCIES are dropped
+                                    False: enum, bool or register node or command, all nodes are dropped
+                                    unless it is one of FEATURE_CACHE_VALUE_COMMANDS
+        :param      value:          written value, None for commands and registers
+        :return:    none
+        """
+        if value_only:
+            for dependent_name in FEATURE_DEPENDENCIES.get(feature_name, ()):
+                self.invalidate(dependent_name)
+        elif feature_name not in FEATURE_CACHE_VALUE_COMMANDS:
+            self.invalidate()
+
+        if value is not None and self.__skip_equal:
+            with self.__lock:
+                self.__entries[(feature_name, 'shadow')] = value
+
+    @staticmethod
+    def enable(handle, enable=True):
+        """
+        :brief      Switch the metadata cache of a handle on or off
+        :param      handle:     device, local device or data stream handle
+        :param      enable:     True: cache the metadata, False: drop the cache
+        :return:    none
+        """
+        with FeatureCache.__caches_lock:
+            if not enable:
+                FeatureCache.__caches.pop(handle, None)
+            elif handle not in FeatureCache.__caches:
+                FeatureCache.__caches[handle] = FeatureCache()
+
+    @staticmethod
+    def get_cache(handle):
+        """
+        :brief      Get the metadata cache of a handle
+        :param      handle:     device, local device or data stream handle
+        :return:    FeatureCache object, None when the cache of the handle is off
+        """
+        return FeatureCache.__caches.get(handle)
+
+    @staticmethod
+    def lookup(handle, feature_name, kind, getter):
+        """
+        :brief      Get metadata through the cache of the handle, the getter is called directly
+                    when the cache is off
+        :return:    metadata value
+        """
+        cache = FeatureCache.__caches.get(handle)
+        if cache is None:
+            return getter()
+        return cache.get(feature_name, kind, getter)
+
+    @staticmethod
+    def unchanged(handle, feature_name, value):
+        """
+        :brief      Whether a write can be skipped because the value equals the last written value,
+                    see is_equal
+        :return:    True/False
+        """
+        cache = FeatureCache.__caches.get(handle)
+        return cache is not None and cache.is_equal(feature_name, value)
+
+    @staticmethod
+    def written(handle, feature_name, value_only, value=None):
+        """
+        :brief      Tell the cache of the handle that a node was written, see notify_write
+        :return:    none
+        """
+        cache = FeatureCache.__caches.get(handle)
+        if cache is not None:
+            cache.notify_write(feature_name, value_only, value)
+
+    @staticmethod
+    def changed(handle, feature_name=None):
+        """
+        :brief      Tell the cache of the handle that nodes changed on the device side
+        :param      feature_name:   changed feature node name, None: all nodes
+        :return:    none
+        """
+        cache = FeatureCache.__caches.get(handle)
+        if cache is not None:
+            cache.invalidate(feature_name)
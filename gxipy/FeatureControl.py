@@ -7,9 +7,45 @@ from gxipy.gxwrapper import *
 from gxipy.dxwrapper import *
 from gxipy.gxidef import *
 from gxipy.Feature_s import *
+from gxipy.FeatureCache import *
 from gxipy.StatusProcessor import *
+import ctypes
 import types
 
+# write order of FeatureControl.apply: UserSetSelector and UserSetLoad first because loading a user set
+# overwrites the other nodes, then the selectors and the nodes that reset or restrict other nodes,
+# the remaining nodes keep the order of the settings
+_FEATURE_WRITE_RANKS = {
+    'UserSetSelector': 0,
+    'UserSetLoad': 1,
+    'PixelFormat': 3,
+    'BinningHorizontal': 3,
+    'BinningVertical': 3,
+    'DecimationHorizontal': 3,
+    'DecimationVertical': 3,
+    'OffsetX': 5,
+    'OffsetY': 5,
+}
+
+
+def _get_write_rank(feature_name, value):
+    """
+    :brief      Get the write order rank of a node, see FeatureControl.apply
+    :param      feature_name:   feature node name
+    :param      value:          value to be written, None for commands
+    :return:    rank, 0: written first, 6: written last
+    """
+    if feature_name in _FEATURE_WRITE_RANKS:
+        return _FEATURE_WRITE_RANKS[feature_name]
+    if feature_name.endswith('Selector'):
+        return 2
+    if value is None:
+        return 6
+    if feature_name.endswith('Mode') or feature_name.endswith('Auto'):
+        return 3
+    return 4
+
+
 class FeatureControl:
     def __init__(self,handle):
         """
@@ -24,6 +60,10 @@ class FeatureControl:
         self.__c_feature_callback_char = FEATURE_CALL_CHAR(self.__on_feature_callback_char)
         self.__py_feature_callback_char = None
 
+        # the node types found by apply and snapshot, the type of a node never changes
+        self.__feature_types = {}
+        self.__remote_features = None
+
     def is_implemented(self,feature_name):
         """
         :brief      Get feature node is implemented
@@ -34,8 +74,7 @@ class FeatureControl:
             raise ParameterTypeError("FeatureControl.is_implemented: "
                                      "Expected feature_name type is int, not %s" % type(feature_name))
 
-        status, node_access = gx_get_node_access_mode( self.__handle ,feature_name)
-        StatusProcessor.process(status, 'FeatureControl', 'is_implemented')
+        node_access = self.__get_node_access_mode(feature_name, 'is_implemented')
         if ((node_access == GxNodeAccessMode.MODE_NI) or (node_access == GxNodeAccessMode.MODE_UNDEF)):
             return  False
         else:
@@ -50,8 +89,7 @@ class FeatureControl:
             raise ParameterTypeError("FeatureControl.get_int_feature: "
                                      "Expected feature_name type is str, not %s" % type(feature_name))
 
-        status, node_access = gx_get_node_access_mode( self.__handle ,feature_name)
-        StatusProcessor.process(status, 'FeatureControl', 'is_readable')
+        node_access = self.__get_node_access_mode(feature_name, 'is_readable')
         if ((node_access == GxNodeAccessMode.MODE_RO) or (node_access == GxNodeAccessMode.MODE_RW)):
             return True
         else:
@@ -66,13 +104,90 @@ class FeatureControl:
             raise ParameterTypeError("FeatureControl.get_int_feature: "
                                      "Expected feature_name type is str, not %s" % type(feature_name))
 
-        status, node_access = gx_get_node_access_mode( self.__handle ,feature_name)
-        StatusProcessor.process(status, 'FeatureControl', 'is_readable')
+        node_access = self.__get_node_access_mode(feature_name, 'is_writable')
         if ((node_access == GxNodeAccessMode.MODE_WO) or (node_access == GxNodeAccessMode.MODE_RW)):
             return True
         else:
             return False
 
+    def enable_metadata_cache(self, enable=True):
+        """
+        :brief      Cache the access mode, range and enum entries of the feature nodes, shared by all feature
+                    objects of the handle. The cached metadata of a node is dropped when a write changes
+                    dependent nodes (FEATURE_DEPENDENCIES), when a feature callback of the node fires and
+                    when the acquisition starts or stops. Call invalidate_metadata after device-side changes
+                    the SDK does not report.
+        :param      enable:     True: cache the metadata, False: drop the cache and read every time
+        :return:    none
+        """
+        if not isinstance(enable, bool):
+            raise ParameterTypeError("FeatureControl.enable_metadata_cache: "
+                                     "Expected enable type is bool, not %s" % type(enable))
+
+        FeatureCache.enable(self.__handle, enable)
+
+    def is_metadata_cache_enabled(self):
+        """
+        :brief      Whether the feature node metadata of the handle is cached
+        :return:    True/False
+        """
+        return FeatureCache.get_cache(self.__handle) is not None
+
+    def enable_write_suppression(self, enable=True):
+        """
+        :brief      Skip writes of a value that equals the last written value of the node. The shadow copies
+                    of the written values live in the metadata cache (switched on by this function) and are
+                    dropped with it: by UserSetLoad and other commands, enum and bool writes, writes of
+                    dependent nodes, feature callbacks and invalidate_metadata.
+        :param      enable:     True: skip equal writes, False: write every value
+        :return:    none
+        """
+        if not isinstance(enable, bool):
+            raise ParameterTypeError("FeatureControl.enable_write_suppression: "
+                                     "Expected enable type is bool, not %s" % type(enable))
+
+        if enable:
+            FeatureCache.enable(self.__handle, True)
+
+        cache = FeatureCache.get_cache(self.__handle)
+        if cache is not None:
+            cache.set_skip_equal(enable)
+
+    def is_write_suppression_enabled(self):
+        """
+        :brief      Whether writes of the last written value are skipped
+        :return:    True/False
+        """
+        cache = FeatureCache.get_cache(self.__handle)
+        return cache is not None and cache.is_skip_equal()
+
+    def invalidate_metadata(self, feature_name=None):
+        """
+        :brief      Drop the cached metadata and the shadow value of a feature node, e.g. after a device-side
+                    change the SDK does not report
+        :param      feature_name:   Feature node name, None: all nodes
+        :return:    none
+        """
+        if feature_name is not None and not isinstance(feature_name, str):
+            raise ParameterTypeError("FeatureControl.invalidate_metadata: "
+                                     "Expected feature_name type is str, not %s" % type(feature_name))
+
+        FeatureCache.changed(self.__handle, feature_name)
+
+    def __get_node_access_mode(self, feature_name, func_name):
+        """
+        :brief      Get the access mode of a feature node through the metadata cache
+        :param      feature_name:   Feature node name
+        :param      func_name:      calling function name
+        :return:    GxNodeAccessMode
+        """
+        def read_node_access_mode():
+            status, node_access = gx_get_node_access_mode(self.__handle, feature_name)
+            StatusProcessor.process(status, 'FeatureControl', func_name)
+            return node_access
+
+        return FeatureCache.lookup(self.__handle, feature_name, 'access_mode', read_node_access_mode)
+
     def get_int_feature(self, feature_name):
         """
         :brief      Get int type feature object
@@ -209,6 +324,7 @@ class FeatureControl:
         """
         status = gx_feature_load(self.__handle, file_path, verify)
         StatusProcessor.process(status, 'FeatureControl', 'feature_load')
+        FeatureCache.changed(self.__handle)
 
     def read_port(self, address, size):
         """
@@ -242,6 +358,7 @@ class FeatureControl:
 
         status = gx_writer_port( self.__handle, address, buff, size)
         StatusProcessor.process(status, 'FeatureControl', 'write_port')
+        FeatureCache.changed(self.__handle)
 
     def read_port_stacked(self, entries, size):
         """
@@ -275,9 +392,313 @@ class FeatureControl:
 
         status = gx_set_write_remote_device_port_stacked(self.__handle, entries, size)
         StatusProcessor.process(status, 'Device', 'set_write_remote_device_port_stacked')
+        FeatureCache.changed(self.__handle)
 
         return status
 
+    def apply(self, settings):
+        """
+        :brief      Write many feature nodes in one call
+                    The writes are ordered by dependency: UserSetSelector and UserSetLoad first, then the other
+                    selectors, the nodes ending with Mode or Auto, binning, decimation and PixelFormat, then the
+                    other nodes in the order of settings, OffsetX and OffsetY and at last the commands. A value is checked against the
+                    range in the metadata cache (see enable_metadata_cache) before it is written, a write that
+                    fails is tried once more after the other writes because another node may have changed
+                    its range (e.g. Width and OffsetX).
+        :param      settings:   dict, feature node name: value
+                                    bool: bool node
+                                    int: int, float or enum node (enum value)
+                                    float: float node
+                                    str: enum node (symbolic) or string node
+                                    None: command node, the command is sent
+                                register address (int): 4 byte value (int), all registers are written in one
+                                write_port_stacked call after the feature nodes
+        :return:    dict, feature node name or register address: exception of every failed write,
+                    empty when all writes succeeded
+        """
+        if not isinstance(settings, dict):
+            raise ParameterTypeError("FeatureControl.apply: "
+                                     "Expected settings type is dict, not %s" % type(settings))
+
+        failures = {}
+        writes = []
+        registers = []
+        for feature_name, value in settings.items():
+            if isinstance(feature_name, INT_TYPE):
+                if not isinstance(value, INT_TYPE) or value < 0 or value > 0xFFFFFFFF:
+                    failures[feature_name] = InvalidParameter("FeatureControl.apply: register 0x%x only support "
+                                                              "a 4 byte int value" % feature_name)
+                else:
+                    registers.append((feature_name, value))
+            elif not isinstance(feature_name, str):
+                failures[feature_name] = ParameterTypeError("FeatureControl.apply: Expected feature_name type "
+                                                            "is str or int, not %s" % type(feature_name))
+            else:
+                writes.append((_get_write_rank(feature_name, value), len(writes), feature_name, value))
+        writes.sort()
+
+        retries = []
+        for rank, index, feature_name, value in writes:
+            try:
+                self.__apply_feature(feature_name, value)
+            except ParameterTypeError as error:
+                failures[feature_name] = error
+            except Exception:
+                retries.append((feature_name, value))
+
+        for feature_name, value in retries:
+            try:
+                self.__apply_feature(feature_name, value)
+            except Exception as error:
+                failures[feature_name] = error
+
+        if registers:
+            entries = (GxRegisterStackEntry * len(registers))()
+            values = (ctypes.c_uint32 * len(registers))()
+            for index, (address, value) in enumerate(registers):
+                values[index] = value
+                entries[index].address = address
+                entries[index].buffer = ctypes.addressof(values) + index * ctypes.sizeof(ctypes.c_uint32)
+                entries[index].size = ctypes.sizeof(ctypes.c_uint32)
+            try:
+                self.write_port_stacked(entries, len(registers))
+            except Exception as error:
+                for address, value in registers:
+                    failures[address] = error
+
+        return failures
+
+    def __get_feature_type(self, feature_name, value):
+        """
+        :brief      Get the node type a value is written to, the device is asked once per node when the value
+                    type fits more than one node type
+        :param      feature_name:   feature node name
+        :param      value:          value to be written
+        :return:    GxFeatureType
+        """
+        if value is None:
+            return GxFeatureType.COMMAND
+        if isinstance(value, bool):
+            return GxFeatureType.BOOL
+        if isinstance(value, float):
+            return GxFeatureType.FLOAT
+        if not isinstance(value, (INT_TYPE, str)):
+            raise ParameterTypeError("FeatureControl.apply: "
+                                     "Expected value type is bool, int, float, str or None, not %s" % type(value))
+
+        key = (feature_name, isinstance(value, str))
+        if key not in self.__feature_types:
+            if isinstance(value, str):
+                status, feature_info = gx_get_enum_feature(self.__handle, feature_name)
+                feature_type = GxFeatureType.ENUM if status == GxStatusList.SUCCESS else GxFeatureType.STRING
+            elif gx_get_int_feature(self.__handle, feature_name)[0] == GxStatusList.SUCCESS:
+                feature_type = GxFeatureType.INT
+            elif gx_get_float_feature(self.__handle, feature_name)[0] == GxStatusList.SUCCESS:
+                feature_type = GxFeatureType.FLOAT
+            else:
+                feature_type = GxFeatureType.ENUM
+            self.__feature_types[key] = feature_type
+        return self.__feature_types[key]
+
+    def __check_range(self, feature_name, feature_type, value):
+        """
+        :brief      Check a value against the cached range of a node, only when the metadata cache is on
+        :return:    none
+        """
+        if FeatureCache.get_cache(self.__handle) is None:
+            return
+
+        if feature_type in (GxFeatureType.INT, GxFeatureType.FLOAT):
+            def read_limits():
+                if feature_type == GxFeatureType.INT:
+                    status, feature_info = gx_get_int_feature(self.__handle, feature_name)
+                else:
+                    status, feature_info = gx_get_float_feature(self.__handle, feature_name)
+                StatusProcessor.process(status, 'FeatureControl', 'apply')
+                return feature_info.min, feature_info.max, feature_info.inc
+
+            minimum, maximum, inc = FeatureCache.lookup(self.__handle, feature_name, 'limits', read_limits)
+            if value < minimum or value > maximum:
+                raise OutOfRange("FeatureControl.apply: %s out of bounds, minimum=%s, maximum=%s"
+                                 % (feature_name, minimum, maximum))
+            if feature_type == GxFeatureType.INT and inc > 1 and (value - minimum) % inc != 0:
+                raise InvalidParameter("FeatureControl.apply: %s must be minimum + n * %d"
+                                       % (feature_name, inc))
+        elif feature_type == GxFeatureType.ENUM:
+            key = 'symbolic' if isinstance(value, str) else 'value'
+            if value not in [entry[key] for entry in EnumFeature_s(self.__handle, feature_name).get_range()]:
+                raise InvalidParameter("FeatureControl.apply: %s is not an entry of %s" % (value, feature_name))
+        elif feature_type == GxFeatureType.STRING:
+            max_length = StringFeature_s(self.__handle, feature_name).get_string_max_length()
+            if len(value) > max_length:
+                raise OutOfRange("FeatureControl.apply: %s string exceeds the maximum length %d"
+                                 % (feature_name, max_length))
+
+    def __apply_feature(self, feature_name, value):
+        """
+        :brief      Write one node of apply
+        :return:    none
+        """
+        if not self.is_implemented(feature_name):
+            raise InvalidParameter("FeatureControl.apply: The feature '%s' is not implemented" % feature_name)
+
+        feature_type = self.__get_feature_type(feature_name, value)
+        if feature_type == GxFeatureType.COMMAND:
+            CommandFeature_s(self.__handle, feature_name).send_command()
+            return
+
+        if feature_type == GxFeatureType.FLOAT:
+            value = float(value)
+        self.__check_range(feature_name, feature_type, value)
+
+        if feature_type == GxFeatureType.INT:
+            IntFeature_s(self.__handle, feature_name).set(value)
+        elif feature_type == GxFeatureType.FLOAT:
+            FloatFeature_s(self.__handle, feature_name).set(value)
+        elif feature_type == GxFeatureType.ENUM:
+            EnumFeature_s(self.__handle, feature_name).set(value)
+        elif feature_type == GxFeatureType.BOOL:
+            BoolFeature_s(self.__handle, feature_name).set(value)
+        else:
+            StringFeature_s(self.__handle, feature_name).set(value)
+
+    def snapshot(self, feature_names=None, registers=()):
+        """
+        :brief      Read the values of the readable feature nodes into a dict, the in-memory counterpart of
+                    feature_save, see restore
+        :param      feature_names:  list of feature node names, None: all remote device nodes of GxFeatureID
+                                    (no buffer and command nodes), nodes that are not implemented or not
+                                    readable are left out
+        :param      registers:      list of register addresses, read in one read_port_stacked call
+                                    (4 byte registers only)
+        :return:    dict, feature node name: value (bool, int, float, str, enum nodes: symbolic str),
+                    register address: int value
+        """
+        if feature_names is None:
+            features = self.__get_remote_features()
+        elif isinstance(feature_names, (list, tuple)):
+            features = [(feature_name, None) for feature_name in feature_names]
+        else:
+            raise ParameterTypeError("FeatureControl.snapshot: "
+                                     "Expected feature_names type is list or tuple, not %s" % type(feature_names))
+
+        values = {}
+        for feature_name, feature_type in features:
+            try:
+                if not self.is_readable(feature_name):
+                    continue
+                values[feature_name] = self.__read_feature(feature_name, feature_type)
+            except Exception:
+                # e.g. a node of another device type or a node that is not available in the current state
+                continue
+
+        if registers:
+            entries = (GxRegisterStackEntry * len(registers))()
+            buffers = (ctypes.c_uint32 * len(registers))()
+            for index, address in enumerate(registers):
+                entries[index].address = address
+                entries[index].buffer = ctypes.addressof(buffers) + index * ctypes.sizeof(ctypes.c_uint32)
+                entries[index].size = ctypes.sizeof(ctypes.c_uint32)
+            self.read_port_stacked(entries, len(registers))
+            for index, address in enumerate(registers):
+                values[address] = buffers[index]
+
+        return values
+
+    def restore(self, snapshot, only_diff=True):
+        """
+        :brief      Write a snapshot back with apply
+                    Nodes that are not writable are skipped, unless an earlier write of the snapshot makes
+                    them writable (e.g. ExposureTime after ExposureAuto). A snapshot holds one state of the
+                    selector nodes only, the nodes behind the other selector values are not restored.
+        :param      snapshot:   dict of snapshot
+        :param      only_diff:  True: read the nodes of the snapshot and write the nodes that differ only
+                                False: write all nodes of the snapshot
+        :return:    dict, feature node name or register address: exception of every failed write,
+                    empty when all writes succeeded
+        """
+        if not isinstance(snapshot, dict):
+            raise ParameterTypeError("FeatureControl.restore: "
+                                     "Expected snapshot type is dict, not %s" % type(snapshot))
+
+        current = {}
+        if only_diff:
+            current = self.snapshot([key for key in snapshot if isinstance(key, str)],
+                                    [key for key in snapshot if isinstance(key, INT_TYPE)])
+
+        settings = {}
+        postponed = {}
+        for key, value in snapshot.items():
+            if key in current and type(current[key]) is type(value) and current[key] == value:
+                continue
+            if isinstance(key, str) and not self.is_writable(key):
+                postponed[key] = value
+            else:
+                settings[key] = value
+
+        failures = self.apply(settings)
+        if postponed:
+            failures.update(self.apply(dict((feature_name, value) for feature_name, value in postponed.items()
+                                            if self.is_writable(feature_name))))
+        return failures
+
+    def __get_remote_features(self):
+        """
+        :brief      Get the names and types of the remote device nodes of GxFeatureID, the names are asked once
+        :return:    list of (feature node name, GxFeatureType)
+        """
+        if self.__remote_features is None:
+            remote_features = []
+            for attribute, feature_id in vars(GxFeatureID).items():
+                if not attribute.isupper() or not isinstance(feature_id, INT_TYPE):
+                    continue
+                # the bits 24-27 are the layer of the feature, 0: remote device
+                feature_type = feature_id & 0xF0000000
+                if feature_id & 0x0F000000 or feature_type in (GxFeatureType.BUFFER, GxFeatureType.COMMAND):
+                    continue
+                status, feature_name = gx_get_feature_name(self.__handle, feature_id)
+                if status == GxStatusList.SUCCESS and feature_name:
+                    remote_features.append((feature_name, feature_type))
+            self.__remote_features = remote_features
+        return self.__remote_features
+
+    def __read_feature(self, feature_name, feature_type):
+        """
+        :brief      Read one node of snapshot, an unknown node type is found by trying the types one by one
+        :param      feature_name:   feature node name
+        :param      feature_type:   GxFeatureType, None: unknown
+        :return:    value
+        """
+        if feature_type is None:
+            for key in ((feature_name, True), (feature_name, False)):
+                if key in self.__feature_types:
+                    return self.__read_feature(feature_name, self.__feature_types[key])
+
+            for feature_type in (GxFeatureType.ENUM, GxFeatureType.INT, GxFeatureType.FLOAT,
+                                 GxFeatureType.BOOL, GxFeatureType.STRING):
+                try:
+                    return self.__read_feature(feature_name, feature_type)
+                except Exception:
+                    continue
+            raise InvalidParameter("FeatureControl.snapshot: The type of feature '%s' is unknown" % feature_name)
+
+        if feature_type == GxFeatureType.INT:
+            value = IntFeature_s(self.__handle, feature_name).get()
+        elif feature_type == GxFeatureType.FLOAT:
+            value = FloatFeature_s(self.__handle, feature_name).get()
+        elif feature_type == GxFeatureType.ENUM:
+            value = EnumFeature_s(self.__handle, feature_name).get()[1]
+        elif feature_type == GxFeatureType.BOOL:
+            value = BoolFeature_s(self.__handle, feature_name).get()
+        else:
+            value = StringFeature_s(self.__handle, feature_name).get()
+
+        # apply finds the node type without asking the device
+        if feature_type != GxFeatureType.BOOL:
+            key = (feature_name, feature_type in (GxFeatureType.ENUM, GxFeatureType.STRING))
+            self.__feature_types[key] = feature_type
+        return value
+
     def get_feature_name_space(self, feature_name):
         """
         :brief      Obtain whether the node is a protocol standard node.
@@ -387,7 +808,7 @@ class FeatureControl:
                                      "Expected feature id is in GxEventSectionEntry not %s" % feature_name)
 
         status, feature_callback_handle = gx_register_feature_call_back_by_string \
-            (self._handle, self.__c_feature_callback_char, feature_name, args)
+            (self.__handle, self.__c_feature_callback_char, feature_name, args)
         StatusProcessor.process(status, 'FeatureControl', 'register_feature_callback_by_string')
 
         # callback will not recorded when register callback failed.
@@ -403,7 +824,7 @@ class FeatureControl:
             raise ParameterTypeError("FeatureControl.unregister_feature_callback: "
                                      "Expected feature id is in GxEventSectionEntry not %s" % feature_id)
 
-        status = gx_unregister_feature_callback(self._handle, feature_id, feature_callback_handle)
+        status = gx_unregister_feature_callback(self.__handle, feature_id, feature_callback_handle)
         StatusProcessor.process(status, 'FeatureControl', 'unregister_feature_callback')
 
         self.__py_feature_callback = None
@@ -417,7 +838,7 @@ class FeatureControl:
             raise ParameterTypeError("FeatureControl.unregister_feature_callback_by_string: "
                                      "Expected feature id is in GxEventSectionEntry not %s" % feature_name)
 
-        status = gx_unregister_feature_call_back_by_string(self._handle, feature_name, feature_callback_handle)
+        status = gx_unregister_feature_call_back_by_string(self.__handle, feature_name, feature_callback_handle)
         StatusProcessor.process(status, 'FeatureControl', 'unregister_feature_callback_by_string')
 
         self.__py_feature_callback_char = None
@@ -427,6 +848,7 @@ class FeatureControl:
         :brief      feature event callback function with an unused c_void_p.
         :return:    none
         """
+        FeatureCache.changed(self.__handle)
         self.__py_feature_callback(c_feature_id, c_user_param)
 
     def __on_feature_callback_char(self, c_feature_name, c_user_param):
@@ -434,4 +856,5 @@ class FeatureControl:
         :brief      feature event callback function with an unused c_void_p.
         :return:    none
         """
+        FeatureCache.changed(self.__handle, string_decoding(c_feature_name))
         self.__py_feature_callback_char(c_feature_name, c_user_param)
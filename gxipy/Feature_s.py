@@ -8,6 +8,7 @@ from gxipy.dxwrapper import *
 from gxipy.gxiapi import *
 from gxipy.StatusProcessor import *
 from gxipy.Buffer import *
+from gxipy.FeatureCache import *
 import types
 
 if sys.version_info.major > 2:
@@ -82,8 +83,12 @@ class IntFeature_s(Feature_s):
             raise ParameterTypeError("IntFeature_s.set: "
                                      "Expected int_value type is int, not %s" % type(int_value))
 
+        if FeatureCache.unchanged(self.__handle, self.__feature_name, int_value):
+            return
+
         status = gx_set_int_feature_value(self.__handle, self.__feature_name, int_value)
         StatusProcessor.process(status, 'IntFeature_s', 'set')
+        FeatureCache.written(self.__handle, self.__feature_name, True, int_value)
 
 class EnumFeature_s(Feature_s):
     def __init__(self, handle, feature_name):
@@ -110,6 +115,14 @@ class EnumFeature_s(Feature_s):
         :brief      Getting range of Enum feature
         :return:    enum_dict:    enum range dictionary
         """
+        return [dict(entry) for entry in
+                FeatureCache.lookup(self.__handle, self.__feature_name, 'enum_entries', self.__get_range)]
+
+    def __get_range(self):
+        """
+        :brief      Read the range of Enum feature from the device
+        :return:    enum_dict:    enum range dictionary
+        """
         status, enum_feature_info = gx_get_enum_feature( self.__handle, self.__feature_name)
         StatusProcessor.process(status, 'FeatureControl', 'gx_get_enum_feature')
 
@@ -130,6 +143,15 @@ class EnumFeature_s(Feature_s):
         :brief      Getting range of Enum feature (include display name)
         :return:    enum_dict:    enum range dictionary
         """
+        return [dict(entry) for entry in
+                FeatureCache.lookup(self.__handle, self.__feature_name, 'range_display_name',
+                                    self.__get_range_display_name)]
+
+    def __get_range_display_name(self):
+        """
+        :brief      Read the range of Enum feature (include display name) from the device
+        :return:    enum_dict:    enum range dictionary
+        """
         status, enum_feature_info = gx_get_enum_detail_feature( self.__handle, self.__feature_name)
         StatusProcessor.process(status, 'FeatureControl', 'get_range_display_name')
 
@@ -152,6 +174,9 @@ class EnumFeature_s(Feature_s):
         :param      enum_value
         :return:    None
         """
+        if FeatureCache.unchanged(self.__handle, self.__feature_name, enum_value):
+            return
+
         if isinstance(enum_value, int):
             status = gx_set_enum_feature_value(self.__handle, self.__feature_name, enum_value)
             StatusProcessor.process(status, 'EnumFeature_s', 'set')
@@ -161,6 +186,7 @@ class EnumFeature_s(Feature_s):
         else:
             raise ParameterTypeError("EnumFeature_s.set: "
                                      "Expected enum_value type is int or string, not %s" % type(enum_value))
+        FeatureCache.written(self.__handle, self.__feature_name, False, enum_value)
 
 class FloatFeature_s(Feature_s):
     def __init__(self, handle, feature_name):
@@ -218,8 +244,12 @@ class FloatFeature_s(Feature_s):
             raise ParameterTypeError("FloatFeature_s.set: "
                                      "Expected float_value type is float, not %s" % type(float_value))
 
+        if FeatureCache.unchanged(self.__handle, self.__feature_name, float_value):
+            return
+
         status = gx_set_float_feature_value(self.__handle, self.__feature_name, float_value)
         StatusProcessor.process(status, 'FloatFeature_s', 'set')
+        FeatureCache.written(self.__handle, self.__feature_name, True, float_value)
 
 class BoolFeature_s(Feature_s):
     def __init__(self, handle, feature_name):
@@ -251,8 +281,12 @@ class BoolFeature_s(Feature_s):
             raise ParameterTypeError("BoolFeature_s.set: "
                                      "Expected bool_value type is bool, not %s" % type(bool_value))
 
+        if FeatureCache.unchanged(self.__handle, self.__feature_name, bool_value):
+            return
+
         status = gx_set_bool_feature_value( self.__handle, self.__feature_name, bool_value)
         StatusProcessor.process(status, 'BoolFeature_s', 'set')
+        FeatureCache.written(self.__handle, self.__feature_name, False, bool_value)
 
 class StringFeature_s(Feature_s):
     def __init__(self, handle, feature_name):
@@ -270,6 +304,13 @@ class StringFeature_s(Feature_s):
         :brief      String max length
         :return:    Max length
         """
+        return FeatureCache.lookup(self.__handle, self.__feature_name, 'string_max_length', self.__get_string_max_length)
+
+    def __get_string_max_length(self):
+        """
+        :brief      Read the string max length from the device
+        :return:    Max length
+        """
         status, string_value = gx_get_string_feature( self.__handle, self.__feature_name)
         StatusProcessor.process(status, 'StringFeature_s', 'get_string_max_length')
         return  string_value.max_length
@@ -293,8 +334,12 @@ class StringFeature_s(Feature_s):
             raise ParameterTypeError("StringFeature_s.set: "
                                      "Expected input_string type is string, not %s" % type(input_string))
 
+        if FeatureCache.unchanged(self.__handle, self.__feature_name, input_string):
+            return
+
         status = gx_set_string_feature_value( self.__handle, self.__feature_name, input_string)
         StatusProcessor.process(status, 'StringFeature_s', 'set')
+        FeatureCache.written(self.__handle, self.__feature_name, True, input_string)
 
 class CommandFeature_s(Feature_s):
     def __init__(self, handle, feature_name):
@@ -314,6 +359,7 @@ class CommandFeature_s(Feature_s):
         """
         status = gx_feature_send_command(self.__handle, self.__feature_name)
         StatusProcessor.process(status, 'CommandFeature_s', 'send_command')
+        FeatureCache.written(self.__handle, self.__feature_name, False)
 
 
 class RegisterFeature_s(Feature_s):
@@ -332,6 +378,13 @@ class RegisterFeature_s(Feature_s):
         :brief      Getting buffer length
         :return:    length:     buffer length
         """
+        return FeatureCache.lookup(self.__handle, self.__feature_name, 'register_length', self.__get_register_length)
+
+    def __get_register_length(self):
+        """
+        :brief      Read the buffer length from the device
+        :return:    length:     buffer length
+        """
         status, register_feature_length = gx_get_register_feature_length(self.__handle, self.__feature_name)
         StatusProcessor.process(status, 'RegisterFeature_s', 'get_register_length')
         return register_feature_length
@@ -364,4 +417,5 @@ class RegisterFeature_s(Feature_s):
 
         status = gx_set_register_feature_value(self.__handle, self.__feature_name,buf.get_ctype_array(), buf.get_length())
         StatusProcessor.process(status, 'RegisterFeature_s', 'set_buffer')
+        FeatureCache.written(self.__handle, self.__feature_name, False)
 
@@ -0,0 +1,135 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxwrapper import *
+from gxipy.gxidef import *
+from gxipy.Exception import *
+from gxipy.ImageProc import *
+import ctypes
+
+
+class FrameDescriptor:
+    """
+    :brief      Lightweight frame descriptor passed to a fast mode capture callback.
+                The image data is the SDK buffer of the callback and is only valid while the callback runs,
+                call detach() to keep the frame, e.g. to hand it to a worker queue.
+    """
+    __slots__ = ('status', 'image_buf', 'width', 'height', 'pixel_format', 'image_size',
+                 'frame_id', 'timestamp', 'offset_x', 'offset_y', '__data', '__valid')
+
+    def __init__(self, capture_param):
+        """
+        :brief      Constructor for instance initialization
+        :param      capture_param:  GxFrameCallbackParam
+        """
+        self.status = capture_param.status
+        self.image_buf = capture_param.image_buf
+        self.width = capture_param.width
+        self.height = capture_param.height
+        self.pixel_format = capture_param.pixel_format
+        self.image_size = capture_param.image_size
+        self.frame_id = capture_param.frame_id
+        self.timestamp = capture_param.timestamp
+        if sys.platform == 'linux2' or sys.platform == 'linux':
+            self.offset_x = capture_param.offset_x
+            self.offset_y = capture_param.offset_y
+        else:
+            self.offset_x = 0
+            self.offset_y = 0
+        self.__data = None
+        self.__valid = True
+
+    def is_valid(self):
+        """
+        :brief      Whether the image data can still be accessed
+        :return:    True/False
+        """
+        return self.__valid
+
+    def is_detached(self):
+        """
+        :brief      Whether the image data has been copied out of the SDK buffer
+        :return:    True/False
+        """
+        return self.__data is not None
+
+    def release(self):
+        """
+        :brief      Invalidate the image data when the callback returns, a detached frame is not affected
+        :return:    none
+        """
+        if self.__data is None:
+            self.__valid = False
+            self.image_buf = None
+
+    def detach(self):
+        """
+        :brief      Copy the image data out of the SDK buffer so the frame stays valid after the callback
+        :return:    self
+        """
+        self.__check_valid("detach")
+        if self.__data is None:
+            self.__data = (ctypes.c_ubyte * self.image_size)()
+            ctypes.memmove(self.__data, self.image_buf, self.image_size)
+            self.image_buf = ctypes.addressof(self.__data)
+        return self
+
+    def get_numpy_array(self):
+        """
+        :brief      Return a numpy view onto the image data without copying,
+                    for an undetached frame the view must not be used after the callback returns,
+                    the view of a detached frame keeps the copied data alive
+        :return:    numpy.Array objects, 8bit and 16bit formats: height * width,
+                    RGB8/BGR8: height * width * 3, other formats: the raw bytes
+        """
+        self.__check_valid("get_numpy_array")
+        if self.__data is not None:
+            image_array = self.__data
+        else:
+            image_array = (ctypes.c_ubyte * self.image_size).from_address(self.image_buf)
+        image_size = self.width * self.height
+
+        if self.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
+            return numpy.frombuffer(image_array, dtype=numpy.ubyte, count=image_size). \
+                reshape(self.height, self.width)
+        elif self.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_16BIT:
+            return numpy.frombuffer(image_array, dtype=numpy.uint16, count=image_size). \
+                reshape(self.height, self.width)
+        elif self.pixel_format in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8):
+            return numpy.frombuffer(image_array, dtype=numpy.ubyte, count=image_size * 3). \
+                reshape(self.height, self.width, 3)
+        else:
+            return numpy.frombuffer(image_array, dtype=numpy.ubyte, count=self.image_size)
+
+    def to_raw_image(self):
+        """
+        :brief      Create a RawImage object with a copy of the image data
+        :return:    RawImage object
+        """
+        self.__check_valid("to_raw_image")
+        frame_data = GxFrameData()
+        frame_data.status = self.status
+        frame_data.image_buf = self.image_buf
+        frame_data.width = self.width
+        frame_data.height = self.height
+        frame_data.pixel_format = self.pixel_format
+        frame_data.image_size = self.image_size
+        frame_data.frame_id = self.frame_id
+        frame_data.timestamp = self.timestamp
+        if sys.platform == 'linux2' or sys.platform == 'linux':
+            frame_data.offset_x = self.offset_x
+            frame_data.offset_y = self.offset_y
+
+        return RawImage(frame_data)
+
+    def __check_valid(self, func_name):
+        """
+        :brief      Check the image data is still accessible
+        :param      func_name:  calling function name
+        :return:    none
+        """
+        if self.__valid is False:
+            raise InvalidCall("FrameDescriptor.%s: The capture callback has returned, "
+                              "call detach() inside the callback to keep the frame" % func_name)
@@ -0,0 +1,222 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+from gxipy.gxidef import *
+from gxipy.Exception import *
+import collections
+import threading
+import time
+import sys
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+# interval the grab thread waits while acquisition is stopped, unit: second
+GRAB_IDLE_INTERVAL = 0.01
+
+
+class FrameGrabber:
+    def __init__(self, data_stream, capacity, policy, timeout):
+        """
+        :brief      Constructor for instance initialization,
+                    use DataStream.start_background_grab to create a grabber
+        :param      data_stream:    DataStream object the frames are grabbed from
+        :param      capacity:       ring buffer capacity, range:[1, 0xFFFFFFFF]
+        :param      policy:         ring buffer policy, See detail in GxGrabPolicyList
+        :param      timeout:        get_image timeout of the grab thread, range:[0, 0xFFFFFFFF]
+        """
+        if not isinstance(capacity, INT_TYPE):
+            raise ParameterTypeError("FrameGrabber.__init__: "
+                                     "Expected capacity type is int, not %s" % type(capacity))
+
+        if not isinstance(policy, INT_TYPE):
+            raise ParameterTypeError("FrameGrabber.__init__: "
+                                     "Expected policy type is int, not %s" % type(policy))
+
+        if not isinstance(timeout, INT_TYPE):
+            raise ParameterTypeError("FrameGrabber.__init__: "
+                                     "Expected timeout type is int, not %s" % type(timeout))
+
+        if (capacity < 1) or (capacity > UNSIGNED_INT_MAX):
+            raise OutOfRange("FrameGrabber.__init__: capacity out of bounds, minimum=1, maximum=%s"
+                             % hex(UNSIGNED_INT_MAX).__str__())
+
+        if policy not in (GxGrabPolicyList.LATEST_ONLY, GxGrabPolicyList.FIFO_BLOCK,
+                          GxGrabPolicyList.FIFO_DROP_OLDEST):
+            raise InvalidParameter("FrameGrabber.__init__: policy out of bounds, See detail in GxGrabPolicyList")
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            raise OutOfRange("FrameGrabber.__init__: timeout out of bounds, minimum=0, maximum=%s"
+                             % hex(UNSIGNED_INT_MAX).__str__())
+
+        self.__data_stream = data_stream
+        self.__capacity = 1 if policy == GxGrabPolicyList.LATEST_ONLY else capacity
+        self.__policy = policy
+        self.__timeout = timeout
+        self.__ring = collections.deque()
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__running = False
+        self.__error = None
+        self.__grabbed_count = 0
+        self.__delivered_count = 0
+        self.__dropped_count = 0
+        self.__overrun_count = 0
+
+    def start(self):
+        """
+        :brief      Start the grab thread
+        :return:    none
+        """
+        with self.__condition:
+            if self.__running:
+                return
+            self.__running = True
+            self.__error = None
+
+        self.__thread = threading.Thread(target=self.__grab_loop, name="FrameGrabber")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        :brief      Stop the grab thread, frames already in the ring stay available for get_next/get_latest
+        :return:    none
+        """
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+    def is_running(self):
+        """
+        :brief      Whether the grab thread is running
+        :return:    True/False
+        """
+        return self.__running
+
+    def get_next(self, timeout=1000):
+        """
+        :brief      Get the oldest frame in the ring, waits when the ring is empty
+        :param      timeout:    wait timeout, unit: ms, range:[0, 0xFFFFFFFF]
+        :return:    RawImage object, None when no frame arrived within timeout
+        """
+        if not isinstance(timeout, INT_TYPE):
+            raise ParameterTypeError("FrameGrabber.get_next: "
+                                     "Expected timeout type is int, not %s" % type(timeout))
+
+        if (timeout < 0) or (timeout > UNSIGNED_INT_MAX):
+            print("FrameGrabber.get_next: "
+                  "timeout out of bounds, minimum=0, maximum=%s"
+                  % hex(UNSIGNED_INT_MAX).__str__())
+            return None
+
+        deadline = time.monotonic() + timeout / 1000.0
+        with self.__condition:
+            while len(self.__ring) == 0:
+                self.__raise_error()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.__running:
+                    return None
+                self.__condition.wait(remaining)
+
+            image = self.__ring.popleft()
+            self.__delivered_count += 1
+            self.__condition.notify_all()
+            return image
+
+    def get_latest(self):
+        """
+        :brief      Get the newest frame in the ring without waiting, older frames are dropped
+        :return:    RawImage object, None when the ring is empty
+        """
+        with self.__condition:
+            if len(self.__ring) == 0:
+                self.__raise_error()
+                return None
+
+            image = self.__ring.pop()
+            self.__dropped_count += len(self.__ring)
+            self.__ring.clear()
+            self.__delivered_count += 1
+            self.__condition.notify_all()
+            return image
+
+    def get_statistics(self):
+        """
+        :brief      Get the grab counters
+        :return:    dict: grabbed_count:    frames grabbed from the data stream
+                          delivered_count:  frames handed out by get_next/get_latest
+                          dropped_count:    frames discarded by the ring policy
+                          overrun_count:    frames that arrived while the ring was full
+                          queued_count:     frames waiting in the ring
+        """
+        with self.__condition:
+            return {
+                'grabbed_count': self.__grabbed_count,
+                'delivered_count': self.__delivered_count,
+                'dropped_count': self.__dropped_count,
+                'overrun_count': self.__overrun_count,
+                'queued_count': len(self.__ring),
+            }
+
+    def __raise_error(self):
+        """
+        :brief      Raise the exception that stopped the grab thread, must hold the condition
+        :return:    none
+        """
+        if self.__error is not None:
+            error = self.__error
+            self.__error = None
+            raise error
+
+    def __push(self, image):
+        """
+        :brief      Put a frame into the ring according to the policy
+        :param      image:  RawImage object
+        :return:    none
+        """
+        with self.__condition:
+            self.__grabbed_count += 1
+            if len(self.__ring) >= self.__capacity:
+                self.__overrun_count += 1
+                if self.__policy == GxGrabPolicyList.FIFO_BLOCK:
+                    while len(self.__ring) >= self.__capacity and self.__running:
+                        self.__condition.wait()
+                    if not self.__running:
+                        self.__dropped_count += 1
+                        return
+                else:
+                    self.__ring.popleft()
+                    self.__dropped_count += 1
+
+            self.__ring.append(image)
+            self.__condition.notify_all()
+
+    def __grab_loop(self):
+        """
+        :brief      Grab thread, dequeues frames from the data stream until stop is called
+        :return:    none
+        """
+        try:
+            while self.__running:
+                if self.__data_stream.acquisition_flag is False:
+                    time.sleep(GRAB_IDLE_INTERVAL)
+                    continue
+
+                image = self.__data_stream.get_image(self.__timeout)
+                if image is None:
+                    continue
+
+                self.__push(image)
+        except Exception as error:
+            with self.__condition:
+                self.__error = error
+                self.__running = False
+                self.__condition.notify_all()
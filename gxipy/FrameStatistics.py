@@ -0,0 +1,137 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxidef import *
+import threading
+
+# number of most recent timestamp intervals kept for the percentiles
+FRAME_STATISTICS_WINDOW = 4096
+
+# a frame id at most this much lower than the previous one is a frame out of order, a larger backward jump
+# is a restart of the frame id counter (stream restart, device reset, 16 bit block id wrap of GEV devices)
+FRAME_ID_REORDER_WINDOW = 64
+
+
+class FrameStatistics:
+    def __init__(self, window=FRAME_STATISTICS_WINDOW, reorder_window=FRAME_ID_REORDER_WINDOW):
+        """
+        :brief      Constructor for instance initialization
+        :param      window:         number of most recent timestamp intervals kept for the percentiles
+        :param      reorder_window: largest backward frame id step counted as out of order, larger steps
+                                    are counted as frame id resets
+        """
+        self.__lock = threading.Lock()
+        self.__window = window
+        self.__reorder_window = reorder_window
+        self.__intervals = numpy.zeros(window, dtype=numpy.int64)
+        self.reset()
+
+    def reset(self):
+        """
+        :brief      Clear all counters
+        :return:    none
+        """
+        with self.__lock:
+            self.__frame_count = 0
+            self.__incomplete_count = 0
+            self.__gap_count = 0
+            self.__missing_count = 0
+            self.__duplicate_count = 0
+            self.__out_of_order_count = 0
+            self.__reset_count = 0
+            self.__last_frame_id = None
+            self.__last_timestamp = None
+            self.__interval_index = 0
+            self.__interval_num = 0
+
+    def restart_sequence(self):
+        """
+        :brief      Forget the last frame id and timestamp, the frame id sequence restarts when
+                    the acquisition starts
+        :return:    none
+        """
+        with self.__lock:
+            self.__last_frame_id = None
+            self.__last_timestamp = None
+
+    def update(self, frame_id, timestamp, status):
+        """
+        :brief      Account one delivered frame
+        :param      frame_id:   frame id
+        :param      timestamp:  frame timestamp
+        :param      status:     frame status, See detail in GxFrameStatusList
+        :return:    none
+        """
+        with self.__lock:
+            self.__frame_count += 1
+            if status != GxFrameStatusList.SUCCESS:
+                self.__incomplete_count += 1
+
+            last_frame_id = self.__last_frame_id
+            if last_frame_id is not None:
+                if frame_id == last_frame_id:
+                    self.__duplicate_count += 1
+                    return
+                elif frame_id < last_frame_id - self.__reorder_window:
+                    # the frame id counter restarted, continue the sequence from this frame
+                    self.__reset_count += 1
+                elif frame_id < last_frame_id:
+                    self.__out_of_order_count += 1
+                    return
+                elif frame_id > last_frame_id + 1:
+                    self.__gap_count += 1
+                    self.__missing_count += frame_id - last_frame_id - 1
+            self.__last_frame_id = frame_id
+
+            if self.__last_timestamp is not None and timestamp > self.__last_timestamp:
+                self.__intervals[self.__interval_index] = timestamp - self.__last_timestamp
+                self.__interval_index = (self.__interval_index + 1) % self.__window
+                if self.__interval_num < self.__window:
+                    self.__interval_num += 1
+            self.__last_timestamp = timestamp
+
+    def snapshot(self):
+        """
+        :brief      Get the counters and the timestamp interval percentiles
+        :return:    dict: frame_count:          delivered frames
+                          incomplete_count:     frames with a status other than GxFrameStatusList.SUCCESS
+                          gap_count:            frame id gaps
+                          missing_count:        frame ids missing in the gaps
+                          duplicate_count:      frames with the same frame id as the previous frame
+                          out_of_order_count:   frames with a frame id slightly lower than the previous frame
+                          reset_count:          frame id counter restarts, a frame id much lower than the
+                                                previous frame
+                          last_frame_id:        frame id of the last frame
+                          interval:             timestamp interval of the last frames in timestamp ticks,
+                                                dict with p50, p90, p99, min, max, mean and jitter (standard
+                                                deviation), None before two frames arrived
+        """
+        with self.__lock:
+            statistics = {
+                'frame_count': self.__frame_count,
+                'incomplete_count': self.__incomplete_count,
+                'gap_count': self.__gap_count,
+                'missing_count': self.__missing_count,
+                'duplicate_count': self.__duplicate_count,
+                'out_of_order_count': self.__out_of_order_count,
+                'reset_count': self.__reset_count,
+                'last_frame_id': self.__last_frame_id,
+                'interval': None,
+            }
+            intervals = self.__intervals[:self.__interval_num].copy()
+
+        if len(intervals) > 0:
+            p50, p90, p99 = numpy.percentile(intervals, (50, 90, 99))
+            statistics['interval'] = {
+                'p50': float(p50),
+                'p90': float(p90),
+                'p99': float(p99),
+                'min': int(intervals.min()),
+                'max': int(intervals.max()),
+                'mean': float(intervals.mean()),
+                'jitter': float(intervals.std()),
+            }
+
+        return statistics
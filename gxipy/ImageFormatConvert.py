@@ -9,25 +9,65 @@ from gxipy.dxwrapper import *
 from gxipy.gxiapi import *
 from gxipy.gxidef import *
 from gxipy.ImageProc import *
+from gxipy.ImageProc import _convert_handle_pool
+from gxipy.NumpyFormatConvert import *
+from gxipy.ImageRoi import *
 import types
+import threading
+import os
 
 if sys.version_info.major > 2:
     INT_TYPE = int
+    from concurrent.futures import ThreadPoolExecutor
 else:
     INT_TYPE = (int, long)
 
+# the dx_image_format_convert functions are only defined when DxImageProc is loaded
+DX_IMAGE_FORMAT_CONVERT_AVAILABLE = 'dx_image_format_convert_create' in globals()
+
+# parallel conversion: band borders are a multiple of CONVERT_BAND_ALIGN rows so every band starts
+# with the same Bayer phase and at a whole packed pixel group, every band is converted with
+# CONVERT_BAND_OVERLAP extra rows above and below so the interpolation at the band borders sees
+# the same neighbours as in a full frame conversion
+CONVERT_BAND_ALIGN = 4
+CONVERT_BAND_OVERLAP = 4
+CONVERT_BAND_MIN_ROWS = 64
+
+# formats that are not stored row by row and can not be converted in bands
+_PLANAR_PIXEL_FORMATS = (GxPixelFormatEntry.RGB8_PLANAR, GxPixelFormatEntry.RGB10_PLANAR,
+                         GxPixelFormatEntry.RGB12_PLANAR, GxPixelFormatEntry.RGB16_PLANAR,
+                         GxPixelFormatEntry.YUV420_8_PLANAR, GxPixelFormatEntry.COORD3D_ABC32F_PLANAR)
+
 class ImageFormatConvert:
-    def __init__(self):
+    def __init__(self, backend=DxConvertBackend.AUTO):
+        """
+        :brief      Constructor for instance initialization
+        :param      backend:    conversion backend, See detail in DxConvertBackend
+        """
         self.alpha_value = 255
         self.image_pixel_format_des = GxPixelFormatEntry.UNDEFINED
         self.interpolation_type = DxBayerConvertType.NEIGHBOUR
         self.image_convert_handle = None
         self.valid_bits = DxValidBit.BIT0_7
+        self.backend = DxConvertBackend.AUTO
+        # buffer size per (pixel_format, width, height, dest_format, valid_bits), cleared when a setting changes
+        self.__buffer_size_cache = {}
+        self.__thread_num = 1
+        self.__executor = None
+        self.__band_buffers = {}
+        self.__roi_buffers = {}
+        # the band and region buffers are reused by every call, one parallel conversion runs at a time
+        self.__buffer_lock = threading.Lock()
+        self.set_backend(backend)
 
     def __new__(cls, *args, **kw):
-        return object.__new__(cls, *args)
+        return object.__new__(cls)
 
     def __del__(self):
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
         if self.image_convert_handle is not None:
             status = dx_image_format_convert_destroy(self.image_convert_handle)
             if status != DxStatus.OK:
@@ -35,6 +75,77 @@ class ImageFormatConvert:
                     "dx_image_format_convert_destroy failure, Error code:%s" % hex(status).__str__())
             self.image_convert_handle = None
 
+    def set_backend(self, backend):
+        """
+        :brief      Select the conversion backend, the settings are kept when the backend changes
+        :param      backend:    DxConvertBackend.SDK:   DxImageProc library
+                                DxConvertBackend.NUMPY: numpy, supports Bayer 8/10/12/14/16bit,
+                                                        Mono8/10/12/14/16, their packed formats
+                                                        and RGB8/BGR8 input and
+                                                        RGB8/BGR8/Mono8 output, see NumpyFormatConvert
+                                DxConvertBackend.AUTO:  DxImageProc library when it is available, otherwise numpy
+        :return:    none
+        """
+        if not isinstance(backend, INT_TYPE):
+            raise ParameterTypeError("backend param must be int in DxConvertBackend.")
+
+        if backend not in (DxConvertBackend.SDK, DxConvertBackend.NUMPY, DxConvertBackend.AUTO):
+            raise InvalidParameter("backend param must be DxConvertBackend's element.")
+
+        if backend == DxConvertBackend.SDK and not DX_IMAGE_FORMAT_CONVERT_AVAILABLE:
+            raise NoImplemented("ImageFormatConvert.set_backend: DxImageProc library is not available")
+
+        if backend != self.backend:
+            self.backend = backend
+            self.__invalidate_cache()
+
+    def get_backend(self):
+        """
+        :brief      Get the selected conversion backend
+        :return:    backend, See detail in DxConvertBackend
+        """
+        return self.backend
+
+    def set_thread_num(self, thread_num):
+        """
+        :brief      Convert frames in row bands on a thread pool, the bands are written into the output
+                    buffer of convert/convert_ex. The DxImageProc library releases the GIL while it converts,
+                    every band uses its own converter handle. Planar formats are always converted at once.
+                    The bands reuse buffers of this converter, so calls from several threads wait for each
+                    other, use one converter per thread to convert frames concurrently.
+        :param      thread_num:     number of threads, 1: no parallel conversion (default),
+                                    0: one thread per CPU core
+        :return:    none
+        """
+        if not isinstance(thread_num, INT_TYPE):
+            raise ParameterTypeError("thread_num param must be int type.")
+
+        if thread_num < 0:
+            raise InvalidParameter("thread_num param must be greater than or equal to 0.")
+
+        if thread_num == 0:
+            thread_num = os.cpu_count() or 1
+
+        if thread_num > 1 and sys.version_info.major <= 2:
+            raise NoImplemented("ImageFormatConvert.set_thread_num: parallel conversion needs python 3")
+
+        if thread_num == self.__thread_num:
+            return
+
+        with self.__buffer_lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+            self.__band_buffers.clear()
+            self.__thread_num = thread_num
+
+    def get_thread_num(self):
+        """
+        :brief      Get the number of conversion threads
+        :return:    number of threads, 1: no parallel conversion
+        """
+        return self.__thread_num
+
     def set_dest_format(self, dest_pixel_format):
         """
         :brief      set desired pixel format
@@ -43,17 +154,25 @@ class ImageFormatConvert:
         if not (isinstance(dest_pixel_format, INT_TYPE)):
             raise ParameterTypeError("dest_pixel_format must to be GxPixelFormatEntry's element.")
 
-        self.__check_handle()
-        status = dx_image_format_convert_set_output_pixel_format(self.image_convert_handle, dest_pixel_format)
-        if status != DxStatus.OK:
-            raise UnexpectedError("dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(status).__str__())
+        if dest_pixel_format == self.image_pixel_format_des and self.__is_configured():
+            return
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+            status = dx_image_format_convert_set_output_pixel_format(self.image_convert_handle, dest_pixel_format)
+            if status != DxStatus.OK:
+                raise UnexpectedError("dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(status).__str__())
         self.image_pixel_format_des = dest_pixel_format
+        self.__invalidate_cache()
 
     def get_dest_format(self):
         """
         :brief     get desired pixel format
         :param:    dest_pixel_format(desired pixel format)
         """
+        if not self.__is_sdk_backend():
+            return self.image_pixel_format_des
+
         self.__check_handle()
         status, pixel_format = dx_image_format_convert_get_output_pixel_format(self.image_convert_handle)
         if status != DxStatus.OK:
@@ -69,11 +188,16 @@ class ImageFormatConvert:
         if not isinstance(cvt_type, INT_TYPE):
             raise ParameterTypeError("cc_type param must be int in DxRGBChannelOrder")
 
-        self.__check_handle()
-        status = dx_image_format_convert_set_interpolation_type(self.image_convert_handle, cvt_type)
-        if status != DxStatus.OK:
-            raise UnexpectedError("dx_image_format_convert_set_interpolation_type failure, Error code:%s" % hex(status).__str__())
+        if cvt_type == self.interpolation_type and self.__is_configured():
+            return
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+            status = dx_image_format_convert_set_interpolation_type(self.image_convert_handle, cvt_type)
+            if status != DxStatus.OK:
+                raise UnexpectedError("dx_image_format_convert_set_interpolation_type failure, Error code:%s" % hex(status).__str__())
         self.interpolation_type = cvt_type
+        self.__invalidate_cache()
 
     def get_interpolation_type(self):
         """
@@ -90,15 +214,20 @@ class ImageFormatConvert:
         if not isinstance(alpha_value, INT_TYPE):
             raise ParameterTypeError("alpha_value param must be int type.")
 
-        self.__check_handle()
         if alpha_value < 0 or alpha_value > 255:
             raise InvalidParameter("DX_PARAMETER_OUT_OF_BOUND")
 
-        status = dx_image_format_convert_set_alpha_value(self.image_convert_handle, alpha_value)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
+        if alpha_value == self.alpha_value and self.__is_configured():
+            return
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+            status = dx_image_format_convert_set_alpha_value(self.image_convert_handle, alpha_value)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
 
         self.alpha_value = alpha_value
+        self.__invalidate_cache()
 
     def get_alpha_value(self):
         """
@@ -116,12 +245,17 @@ class ImageFormatConvert:
         if not isinstance(valid_bits, INT_TYPE):
             raise ParameterTypeError("valid_bits param must be int in DxValidBit element.")
 
-        self.__check_handle()
-        status = dx_image_format_convert_set_valid_bits(self.image_convert_handle, valid_bits)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
+        if valid_bits == self.valid_bits and self.__is_configured():
+            return
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+            status = dx_image_format_convert_set_valid_bits(self.image_convert_handle, valid_bits)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
 
         self.valid_bits = valid_bits
+        self.__invalidate_cache()
 
     def get_valid_bits(self):
         """
@@ -146,12 +280,7 @@ class ImageFormatConvert:
         if not (isinstance(pixel_format, INT_TYPE)):
             raise ParameterTypeError("pixel_format must to be GxPixelFormatEntry's element.")
 
-        self.__check_handle()
-        status, buffer_size_c = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle, pixel_format, width, height)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(status).__str__())
-
-        return buffer_size_c
+        return self.__get_buffer_size(pixel_format, width, height)
 
     def get_buffer_size_for_conversion(self, raw_image):
         """
@@ -164,13 +293,7 @@ class ImageFormatConvert:
         if not isinstance(raw_image, RawImage):
             raise ParameterTypeError("raw_image param must be RawImage type")
 
-        self.__check_handle()
-        status, buffer_size_c = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle, self.image_pixel_format_des,
-                                                                                       raw_image.get_width(), raw_image.get_height())
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(status).__str__())
-
-        return buffer_size_c
+        return self.__get_buffer_size(self.image_pixel_format_des, raw_image.get_width(), raw_image.get_height())
 
     def convert_ex(self, input_address, input_width, input_height, src_fixel_format, output_address, output_length, flip):
         """
@@ -257,8 +380,18 @@ class ImageFormatConvert:
         if not (isinstance(flip, bool)):
             raise ParameterTypeError("flip must to be  bool type.")
 
+        if self.__is_band_convertible(src_fixel_format, input_width, input_height):
+            self.__parallel_convert(input_address, input_width, input_height, src_fixel_format,
+                                    output_address, output_length, flip)
+            return
+
+        if not self.__is_sdk_backend():
+            self.__numpy_convert(input_address, input_width, input_height, src_fixel_format,
+                                 output_address, output_length, flip)
+            return
+
         self.__check_handle()
-        input_length = self.get_buffer_size_for_conversion_ex(input_width, input_height, src_fixel_format)
+        input_length = self.__get_buffer_size(src_fixel_format, input_width, input_height)
 
         status = dx_image_format_convert(self.image_convert_handle, input_address, input_length, output_address, output_length, src_fixel_format, input_width,
                                 input_height, flip)
@@ -340,17 +473,321 @@ class ImageFormatConvert:
         if not (isinstance(flip, bool)):
             raise ParameterTypeError("flip must to be  bool type.")
 
+        if self.__is_band_convertible(raw_image.get_pixel_format(), raw_image.get_width(), raw_image.get_height()):
+            self.__parallel_convert(raw_image.frame_data.image_buf, raw_image.get_width(), raw_image.get_height(),
+                                    raw_image.get_pixel_format(), output_address, output_length, flip)
+            return
+
+        if not self.__is_sdk_backend():
+            self.__numpy_convert(raw_image.frame_data.image_buf, raw_image.get_width(), raw_image.get_height(),
+                                 raw_image.get_pixel_format(), output_address, output_length, flip)
+            return
+
         self.__check_handle()
-        input_length = self.get_buffer_size_for_conversion_ex(raw_image.get_width(), raw_image.get_height(), raw_image.get_pixel_format())
+        input_length = self.__get_buffer_size(raw_image.get_pixel_format(), raw_image.get_width(), raw_image.get_height())
 
         status = dx_image_format_convert(self.image_convert_handle, raw_image.frame_data.image_buf, input_length, output_address,
                                          output_length, raw_image.get_pixel_format(), raw_image.get_width(), raw_image.get_height(), flip)
         if status != DxStatus.OK:
             raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
 
+    def convert_roi_ex(self, input_address, input_width, input_height, src_fixel_format, rois,
+                       offset_x=0, offset_y=0):
+        """
+        :brief  Convert only regions of interest of an image into compact images. Each region is widened to
+                the Bayer cell and whole packed pixel groups plus ROI_MARGIN pixels, converted on its own and
+                the region of interest is copied out, the result equals the same pixels of a full frame
+                conversion. The regions are converted in parallel when set_thread_num is greater than 1.
+        :param  input_address       [in]     Image in
+        :param  input_width         [in]     Image width
+        :param  input_height        [in]     Image height
+        :param  src_fixel_format    [in]     Input Image Pixel Type
+        :param  rois                [in]     list of (x, y, width, height) in sensor coordinates
+        :param  offset_x            [in]     x offset of the image on the sensor
+        :param  offset_y            [in]     y offset of the image on the sensor
+
+        :return list of numpy.Array objects in the output pixel format, one per region of interest,
+                height * width * channels (height * width for one channel)
+        """
+        if input_address is None:
+            raise ParameterTypeError("input_address is NULL pointer.")
+
+        if not isinstance(input_width, INT_TYPE):
+            raise ParameterTypeError("input_width param must be int type.")
+
+        if not isinstance(input_height, INT_TYPE):
+            raise ParameterTypeError("input_height param must be int type.")
+
+        if not (isinstance(src_fixel_format, INT_TYPE)):
+            raise ParameterTypeError("src_fixel_format must to be GxPixelFormatEntry's element.")
+
+        if not isinstance(rois, (list, tuple)):
+            raise ParameterTypeError("rois param must be a list of (x, y, width, height).")
+
+        if not isinstance(offset_x, INT_TYPE) or not isinstance(offset_y, INT_TYPE):
+            raise ParameterTypeError("offset_x and offset_y param must be int type.")
+
+        if self.image_pixel_format_des in _PLANAR_PIXEL_FORMATS \
+                or ((self.image_pixel_format_des & PIXEL_BIT_MASK) >> 16) % 8 != 0:
+            raise NoImplemented("ImageFormatConvert.convert_roi_ex: output pixel format %s is not support"
+                                % hex(self.image_pixel_format_des).__str__())
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+
+        with self.__buffer_lock:
+            if self.__thread_num > 1 and len(rois) > 1:
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(max_workers=self.__thread_num)
+                futures = [self.__executor.submit(self.__convert_roi, index, roi, input_address, input_width,
+                                                  input_height, src_fixel_format, offset_x, offset_y)
+                           for index, roi in enumerate(rois)]
+                return [future.result() for future in futures]
+
+            return [self.__convert_roi(index, roi, input_address, input_width, input_height, src_fixel_format,
+                                       offset_x, offset_y)
+                    for index, roi in enumerate(rois)]
+
+    def convert_roi(self, raw_image, rois):
+        """
+        :brief  Convert only regions of interest of a RawImage into compact images, see convert_roi_ex.
+                The frame offset (frame_data.offset_x/offset_y) is used where present.
+        :param  raw_image   [in]     Image in
+        :param  rois        [in]     list of (x, y, width, height) in sensor coordinates
+
+        :return list of numpy.Array objects in the output pixel format, one per region of interest
+        """
+        if not isinstance(raw_image, RawImage):
+            raise ParameterTypeError("raw_image param must be RawImage type")
+
+        if raw_image.frame_data.image_buf is None:
+            raise ParameterTypeError("raw_image.frame_data.image_buf is NULL pointer")
+
+        offset_x, offset_y = ImageRoi.get_offset(raw_image)
+        return self.convert_roi_ex(raw_image.frame_data.image_buf, raw_image.get_width(), raw_image.get_height(),
+                                   raw_image.get_pixel_format(), rois, offset_x, offset_y)
+
+    def __is_configured(self):
+        """
+        :brief  Whether the stored settings are in effect, the handle gets all settings when it is created
+        :return True/False
+        """
+        return self.image_convert_handle is not None or not self.__is_sdk_backend()
+
+    def __invalidate_cache(self):
+        """
+        :brief  Forget the memoized buffer sizes after a setting changed
+        :return NONE
+        """
+        self.__buffer_size_cache.clear()
+
+    def __get_buffer_size(self, pixel_format, width, height):
+        """
+        :brief  Calculating Buffer size for conversion, memoized per
+                (pixel_format, width, height, dest_format, valid_bits)
+        :return image buffer size
+        """
+        key = (pixel_format, width, height, self.image_pixel_format_des, self.valid_bits)
+        buffer_size = self.__buffer_size_cache.get(key)
+        if buffer_size is not None:
+            return buffer_size
+
+        if self.__is_sdk_backend():
+            self.__check_handle()
+            status, buffer_size = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle, pixel_format, width, height)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(status).__str__())
+        else:
+            buffer_size = NumpyFormatConvert.get_buffer_size(pixel_format, width, height)
+
+        self.__buffer_size_cache[key] = buffer_size
+        return buffer_size
+
+    def __is_sdk_backend(self):
+        """
+        :brief  Whether the conversion runs in the DxImageProc library
+        :return True/False
+        """
+        if self.backend == DxConvertBackend.AUTO:
+            return DX_IMAGE_FORMAT_CONVERT_AVAILABLE
+
+        return self.backend == DxConvertBackend.SDK
+
+    def __numpy_convert(self, input_address, input_width, input_height, src_pixel_format,
+                        output_address, output_length, flip):
+        """
+        :brief  Image Format Convert Process with NumpyFormatConvert
+        :return NONE
+        """
+        if not NumpyFormatConvert.is_supported(src_pixel_format, self.image_pixel_format_des):
+            raise NoImplemented("ImageFormatConvert: numpy backend does not support the conversion %s -> %s"
+                                % (hex(src_pixel_format).__str__(), hex(self.image_pixel_format_des).__str__()))
+
+        output_size = NumpyFormatConvert.get_buffer_size(self.image_pixel_format_des, input_width, input_height)
+        if output_length < output_size:
+            raise InvalidParameter("output_length is smaller than the buffer size for conversion %d" % output_size)
+
+        src_image = NumpyFormatConvert.get_numpy_array(input_address, src_pixel_format, input_width, input_height)
+        if NumpyFormatConvert.is_packed(src_pixel_format):
+            src_image = NumpyFormatConvert.unpack(src_image, src_pixel_format, input_width, input_height)
+        output_image = NumpyFormatConvert.get_numpy_array(output_address, self.image_pixel_format_des,
+                                                          input_width, input_height)
+        NumpyFormatConvert.convert(src_image, src_pixel_format, self.image_pixel_format_des,
+                                   self.valid_bits, flip, output_image)
+
+    def __is_band_convertible(self, src_pixel_format, width, height):
+        """
+        :brief  Whether the conversion runs in parallel row bands
+        :return True/False
+        """
+        if self.__thread_num <= 1 or height < 2 * CONVERT_BAND_MIN_ROWS:
+            return False
+
+        if src_pixel_format in _PLANAR_PIXEL_FORMATS or self.image_pixel_format_des in _PLANAR_PIXEL_FORMATS:
+            return False
+
+        src_pixel_bit = (src_pixel_format & PIXEL_BIT_MASK) >> 16
+        dest_pixel_bit = (self.image_pixel_format_des & PIXEL_BIT_MASK) >> 16
+        if src_pixel_bit == 0 or dest_pixel_bit == 0:
+            return False
+
+        # every output row and every band of input rows has to start at a byte boundary
+        return (width * dest_pixel_bit) % 8 == 0 and (width * src_pixel_bit * CONVERT_BAND_ALIGN) % 8 == 0
+
+    def __get_bands(self, height):
+        """
+        :brief  Split the rows into at most thread_num bands
+        :return list of (start row, end row)
+        """
+        band_num = max(1, min(self.__thread_num, height // CONVERT_BAND_MIN_ROWS))
+        band_rows = -(-height // band_num)
+        band_rows += -band_rows % CONVERT_BAND_ALIGN
+        return [(start, min(height, start + band_rows)) for start in range(0, height, band_rows)]
+
+    def __get_band_buffer(self, index, buffer_size):
+        """
+        :brief  Get the reusable output buffer of a band
+        :return numpy uint8 array
+        """
+        band_buffer = self.__band_buffers.get(index)
+        if band_buffer is None or band_buffer.size != buffer_size:
+            band_buffer = numpy.empty(buffer_size, dtype=numpy.uint8)
+            self.__band_buffers[index] = band_buffer
+        return band_buffer
+
+    def __parallel_convert(self, input_address, input_width, input_height, src_pixel_format,
+                           output_address, output_length, flip):
+        """
+        :brief  Image Format Convert Process in row bands on the thread pool
+        :return NONE
+        """
+        dest_pixel_format = self.image_pixel_format_des
+        if self.__is_sdk_backend():
+            self.__check_handle()
+        elif not NumpyFormatConvert.is_supported(src_pixel_format, dest_pixel_format):
+            raise NoImplemented("ImageFormatConvert: numpy backend does not support the conversion %s -> %s"
+                                % (hex(src_pixel_format).__str__(), hex(dest_pixel_format).__str__()))
+
+        output_row_size = NumpyFormatConvert.get_buffer_size(dest_pixel_format, input_width, 1)
+        if output_length < output_row_size * input_height:
+            raise InvalidParameter("output_length is smaller than the buffer size for conversion %d"
+                                   % (output_row_size * input_height))
+
+        output_array = (c_ubyte * (output_row_size * input_height)).from_address(output_address)
+        output_image = numpy.frombuffer(output_array, dtype=numpy.uint8).reshape(input_height, output_row_size)
+
+        with self.__buffer_lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.__thread_num)
+
+            futures = [self.__executor.submit(self.__convert_band, index, band, input_address, input_width,
+                                              input_height, src_pixel_format, output_image, output_row_size, flip)
+                       for index, band in enumerate(self.__get_bands(input_height))]
+            for future in futures:
+                future.result()
+
+    def __convert_band(self, index, band, input_address, input_width, input_height, src_pixel_format,
+                       output_image, output_row_size, flip):
+        """
+        :brief  Convert one band with its overlap rows and copy the band rows into the output image
+        :return NONE
+        """
+        start, end = band
+        band_start = max(0, start - CONVERT_BAND_OVERLAP)
+        band_end = min(input_height, end + CONVERT_BAND_OVERLAP)
+        band_height = band_end - band_start
+        band_address = input_address + NumpyFormatConvert.get_buffer_size(src_pixel_format, input_width, band_start)
+        band_buffer = self.__get_band_buffer(index, output_row_size * band_height)
+
+        self.__convert_block(band_address, input_width, band_height, src_pixel_format, band_buffer)
+
+        rows = band_buffer.reshape(band_height, output_row_size)[start - band_start:end - band_start]
+        if flip:
+            output_image[input_height - end:input_height - start] = rows[::-1]
+        else:
+            output_image[start:end] = rows
+
+    def __convert_block(self, input_address, input_width, input_height, src_pixel_format, output_buffer):
+        """
+        :brief  Convert a contiguous block of rows into output_buffer with a pooled handle or with numpy,
+                safe to call from several threads
+        :return NONE
+        """
+        if self.__is_sdk_backend():
+            config = (self.image_pixel_format_des, self.valid_bits, self.alpha_value, self.interpolation_type)
+            handle = _convert_handle_pool.acquire(config)
+            try:
+                input_length = self.__get_buffer_size(src_pixel_format, input_width, input_height)
+                status = dx_image_format_convert(handle, input_address, input_length, output_buffer.ctypes.data,
+                                                 output_buffer.size, src_pixel_format, input_width, input_height,
+                                                 False)
+                if status != DxStatus.OK:
+                    raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+            finally:
+                _convert_handle_pool.release(config, handle)
+        else:
+            self.__numpy_convert(input_address, input_width, input_height, src_pixel_format,
+                                 output_buffer.ctypes.data, output_buffer.size, False)
+
+    def __get_roi_buffer(self, key, buffer_size):
+        """
+        :brief  Get a reusable buffer of a region of interest, it is only reallocated when it is too small
+        :return numpy uint8 array
+        """
+        roi_buffer = self.__roi_buffers.get(key)
+        if roi_buffer is None or roi_buffer.size < buffer_size:
+            roi_buffer = numpy.empty(buffer_size, dtype=numpy.uint8)
+            self.__roi_buffers[key] = roi_buffer
+        return roi_buffer
+
+    def __convert_roi(self, index, roi, input_address, input_width, input_height, src_pixel_format,
+                      offset_x, offset_y):
+        """
+        :brief  Convert the aligned region around one region of interest and copy the region of interest out
+        :return numpy.Array objects of the region of interest
+        """
+        dest_pixel_format = self.image_pixel_format_des
+        region, core = ImageRoi.get_region(roi, src_pixel_format, input_width, input_height,
+                                           offset_x, offset_y, ROI_MARGIN)
+        region_width = region[2] - region[0]
+        region_height = region[3] - region[1]
+
+        input_size = NumpyFormatConvert.get_buffer_size(src_pixel_format, region_width, region_height)
+        input_buffer = ImageRoi.crop(input_address, src_pixel_format, input_width, input_height, region,
+                                     self.__get_roi_buffer(('input', index), input_size))
+        output_size = NumpyFormatConvert.get_buffer_size(dest_pixel_format, region_width, region_height)
+        output_buffer = self.__get_roi_buffer(('output', index), output_size)[:output_size]
+
+        self.__convert_block(input_buffer.ctypes.data, region_width, region_height, src_pixel_format, output_buffer)
+
+        core_x, core_y, core_width, core_height = core
+        output_image = ImageRoi.get_numpy_array(output_buffer, dest_pixel_format, region_width, region_height)
+        return output_image[core_y:core_y + core_height, core_x:core_x + core_width].copy()
+
     def __check_handle(self):
         """
-        :brief  The transformation handle is initialized the first time it is called
+        :brief  The transformation handle is initialized the first time it is called,
+                the settings made before are applied to the new handle
         :return NONE
         """
         if self.image_convert_handle is None:
@@ -359,6 +796,23 @@ class ImageFormatConvert:
                 raise UnexpectedError("dx_image_format_convert_create failure, Error code:%s" % hex(status).__str__())
             self.image_convert_handle = handle
 
+            if self.image_pixel_format_des != GxPixelFormatEntry.UNDEFINED:
+                status = dx_image_format_convert_set_output_pixel_format(handle, self.image_pixel_format_des)
+                if status != DxStatus.OK:
+                    raise UnexpectedError("dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_interpolation_type(handle, self.interpolation_type)
+            if status != DxStatus.OK:
+                raise UnexpectedError("dx_image_format_convert_set_interpolation_type failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_alpha_value(handle, self.alpha_value)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_valid_bits(handle, self.valid_bits)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_valid_bits failure, Error code:%s" % hex(status).__str__())
+
 
 
 
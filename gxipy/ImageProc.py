@@ -11,15 +11,30 @@ from gxipy.FeatureControl import *
 from gxipy.gxiapi import *
 from gxipy.StatusProcessor import *
 from gxipy.Buffer import *
+from gxipy.NumpyFormatConvert import *
+from gxipy.NumpyFormatConvert import _RGB48_FORMATS
+from gxipy.ImageRoi import *
+import threading
 import types
 
 COLOR_TRANSFORM_MATRIX_SIZE = 9  # 3*3
 
+# maximum number of idle converter handles kept per configuration
+CONVERT_HANDLE_POOL_MAX_IDLE = 4
+
 if sys.version_info.major > 2:
     INT_TYPE = int
 else:
     INT_TYPE = (int, long)
 
+# valid values of the RawImage.convert parameters
+_CONVERT_TYPE_DICT = dict((name, getattr(DxBayerConvertType, name))
+                          for name in dir(DxBayerConvertType) if not name.startswith('__'))
+_CONVERT_TYPE_SET = frozenset(_CONVERT_TYPE_DICT.values())
+_VALID_BITS_DICT = dict((name, getattr(DxValidBit, name))
+                        for name in dir(DxValidBit) if not name.startswith('__'))
+_VALID_BITS_SET = frozenset(_VALID_BITS_DICT.values())
+
 class RGBImage:
     def __init__(self, frame_data):
         self.frame_data = frame_data
@@ -165,17 +180,72 @@ class RGBImage:
         return self.frame_data.image_size
 
 class RawImage:
-    def __init__(self, frame_data):
+    def __init__(self, frame_data, zero_copy=False, image_buffer=None):
+        """
+        :brief      Constructor for instance initialization
+        :param      frame_data:     GxFrameData
+        :param      zero_copy:      True:  map the image data onto frame_data.image_buf without copying,
+                                           the image is only valid until the buffer is given back to the SDK
+                                    False: copy the image data
+        :param      image_buffer:   Preallocated ctypes buffer used as image storage when frame_data.image_buf
+                                    is None, a new buffer is allocated when it is None
+        """
         self.frame_data = frame_data
+        self.__zero_copy = False
+        self.__valid = True
 
         if self.frame_data.image_buf is not None:
-            self.__image_array = string_at(self.frame_data.image_buf, self.frame_data.image_size)
+            if zero_copy is True:
+                self.__image_array = (c_ubyte * self.frame_data.image_size).from_address(self.frame_data.image_buf)
+                self.__zero_copy = True
+            else:
+                self.__image_array = string_at(self.frame_data.image_buf, self.frame_data.image_size)
+        elif image_buffer is not None:
+            self.__image_array = image_buffer
+            self.frame_data.image_buf = addressof(self.__image_array)
         else:
             self.__image_array = (c_ubyte * self.frame_data.image_size)()
             self.frame_data.image_buf = addressof(self.__image_array)
 
         self.user_param = None
 
+    def __check_valid(self, func_name):
+        """
+        :brief      Check the image data is still accessible
+        :param      func_name:  calling function name
+        :return:    none
+        """
+        if self.__valid is False:
+            raise InvalidCall("RawImage.%s: The zero-copy image buffer has been given back to the SDK by "
+                              "DataStream.q_buf, copy the data before q_buf to keep it" % func_name)
+
+    def is_zero_copy(self):
+        """
+        :brief      Whether the image data is a view onto the SDK frame buffer
+        :return:    True/False
+        """
+        return self.__zero_copy
+
+    def is_valid(self):
+        """
+        :brief      Whether the image data can still be accessed
+        :return:    True/False
+        """
+        return self.__valid
+
+    def release(self):
+        """
+        :brief      Invalidate a zero-copy image, called by DataStream.q_buf when the frame buffer
+                    is given back to the SDK. A copied image is not affected.
+        :return:    none
+        """
+        if self.__zero_copy is False:
+            return
+
+        self.__valid = False
+        self.__image_array = None
+        self.frame_data.image_buf = None
+
     def __pixel_format_raw16_to_raw8(self, pixel_format):
         """
         :brief      convert raw16 to raw8, the pixel format need convert to 8bit bayer format
@@ -263,56 +333,34 @@ class RawImage:
             print("ImageProc.__convert_to_special_pixelformat: not support")
             return None
 
-        status, handle = dx_image_format_convert_create()
-        if status != DxStatus.OK:
-            raise UnexpectedError("dx_image_format_convert_create failure, Error code:%s" % hex(status).__str__())
-
-        status = dx_image_format_convert_set_output_pixel_format(handle, pixelformat)
-        if status != DxStatus.OK:
-            raise UnexpectedError(
-                "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(status).__str__())
-
-        status = dx_image_format_convert_set_valid_bits(handle, valid_bits)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_set_valid_bits failure, Error code:%s" % hex(status).__str__())
-
-        status = dx_image_format_convert_set_alpha_value(handle, channel_order)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
-
-        status = dx_image_format_convert_set_interpolation_type(handle, convert_type)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_set_interpolation_type failure, Error code:%s" % hex(status).__str__())
-
-        status, buffer_size_c = dx_image_format_convert_get_buffer_size_for_conversion(handle, pixelformat,
-                                                                                       self.frame_data.width, self.frame_data.height)
-        if status != DxStatus.OK:
-            raise UnexpectedError("dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(status).__str__())
-
-        image = None
-        frame_data = GxFrameData()
-        frame_data.status = self.frame_data.status
-        frame_data.width = self.frame_data.width
-        frame_data.height = self.frame_data.height
-        frame_data.pixel_format = pixelformat
-        frame_data.image_size = buffer_size_c
-        frame_data.frame_id = self.frame_data.frame_id
-        frame_data.timestamp = self.frame_data.timestamp
-        frame_data.image_buf = None
-
-        if pixelformat == GxPixelFormatEntry.RGB8:
-            image = RGBImage(frame_data)
-        else:
-            image = RawImage(frame_data)
-
-        status = dx_image_format_convert(handle, self.frame_data.image_buf, self.frame_data.image_size, image.frame_data.image_buf,
-                                         image.frame_data.image_size, self.frame_data.pixel_format, self.frame_data.width, self.frame_data.height, flip)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+        config = (pixelformat, valid_bits, channel_order, convert_type)
+        handle = _convert_handle_pool.acquire(config)
+        try:
+            buffer_size_c = _convert_handle_pool.get_buffer_size(handle, pixelformat,
+                                                                 self.frame_data.width, self.frame_data.height)
+
+            image = None
+            frame_data = GxFrameData()
+            frame_data.status = self.frame_data.status
+            frame_data.width = self.frame_data.width
+            frame_data.height = self.frame_data.height
+            frame_data.pixel_format = pixelformat
+            frame_data.image_size = buffer_size_c
+            frame_data.frame_id = self.frame_data.frame_id
+            frame_data.timestamp = self.frame_data.timestamp
+            frame_data.image_buf = None
+
+            if pixelformat == GxPixelFormatEntry.RGB8:
+                image = RGBImage(frame_data)
+            else:
+                image = RawImage(frame_data)
 
-        status = dx_image_format_convert_destroy(handle)
-        if status != DxStatus.OK:
-            raise UnexpectedError("image_format_convert_destroy failure, Error code:%s" % hex(status).__str__())
+            status = dx_image_format_convert(handle, self.frame_data.image_buf, self.frame_data.image_size, image.frame_data.image_buf,
+                                             image.frame_data.image_size, self.frame_data.pixel_format, self.frame_data.width, self.frame_data.height, flip)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+        finally:
+            _convert_handle_pool.release(config, handle)
 
         return image
 
@@ -487,6 +535,7 @@ class RawImage:
         :param      channel_order:  RGB channel order of output image
         :return:    return image object according to mode parameter
         """
+        self.__check_valid("convert")
         if self.frame_data.status != GxFrameStatusList.SUCCESS:
             print("RawImage.convert: This is a incomplete image")
             return None
@@ -511,16 +560,12 @@ class RawImage:
             raise ParameterTypeError("RawImage.convert: "
                                      "Expected mode type is str, not %s" % type(mode))
 
-        convert_type_dict = dict((name, getattr(DxBayerConvertType, name))
-                                 for name in dir(DxBayerConvertType) if not name.startswith('__'))
-        if convert_type not in convert_type_dict.values():
-            print("RawImage.convert: convert_type out of bounds, %s" % convert_type_dict.__str__())
+        if convert_type not in _CONVERT_TYPE_SET:
+            print("RawImage.convert: convert_type out of bounds, %s" % _CONVERT_TYPE_DICT.__str__())
             return None
 
-        valid_bits_dict = dict((name, getattr(DxValidBit, name))
-                               for name in dir(DxValidBit) if not name.startswith('__'))
-        if valid_bits not in valid_bits_dict.values():
-            print("RawImage.convert: valid_bits out of bounds, %s" % valid_bits_dict.__str__())
+        if valid_bits not in _VALID_BITS_SET:
+            print("RawImage.convert: valid_bits out of bounds, %s" % _VALID_BITS_DICT.__str__())
             return None
 
         pixel_bit_depth = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
@@ -596,6 +641,7 @@ class RawImage:
                     This function should be used in each frame.
         :return:    None
         """
+        self.__check_valid("defective_pixel_correct")
         pixel_bit_depth = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
         status = dx_auto_raw_defective_pixel_correct(self.frame_data.image_buf, self.frame_data.width,
                                                      self.frame_data.height, pixel_bit_depth)
@@ -608,6 +654,7 @@ class RawImage:
         :brief      To rotate the 8-bit image clockwise by 90 degrees
         :return     RAWImage object
         """
+        self.__check_valid("raw8_rotate_90_cw")
         if self.frame_data.pixel_format & PIXEL_BIT_MASK != GX_PIXEL_8BIT:
             raise InvalidParameter("RawImage.raw8_rotate_90_cw only support 8bit image")
 
@@ -639,6 +686,7 @@ class RawImage:
         :brief      To rotate the 8-bit image clockwise by -90 degrees
         :return     RAWImage object
         """
+        self.__check_valid("raw8_rotate_90_ccw")
         if self.frame_data.pixel_format & PIXEL_BIT_MASK != GX_PIXEL_8BIT:
             raise InvalidParameter("RawImage.raw8_rotate_90_ccw only support 8bit image")
 
@@ -671,6 +719,7 @@ class RawImage:
         :param      factor:    factor, range(-150 ~ 150)
         :return:    None
         """
+        self.__check_valid("brightness")
         if not isinstance(factor, INT_TYPE):
             raise ParameterTypeError("RawImage.brightness: "
                                      "Expected factor type is int, not %s" % type(factor))
@@ -689,6 +738,7 @@ class RawImage:
         :param      factor:    factor, range(-50 ~ 100)
         :return:    None
         """
+        self.__check_valid("contrast")
         if not isinstance(factor, INT_TYPE):
             raise ParameterTypeError("RawImage.contrast: "
                                      "Expected factor type is int, not %s" % type(factor))
@@ -707,6 +757,7 @@ class RawImage:
         :param      mirror_mode:    mirror mode [reference DxImageMirrorMode]
         :return     RAWImage object
         """
+        self.__check_valid("mirror")
         if not isinstance(mirror_mode, INT_TYPE):
             raise ParameterTypeError("RawImage.mirror: "
                                      "Expected mirror_mode type is int, not %s" % type(mirror_mode))
@@ -816,6 +867,7 @@ class RawImage:
         :param  target_value:       correction target Value
         :return ffc_coefficients:   flat field correction coefficients Buffer
         """
+        self.__check_valid("get_ffc_coefficients")
         if dark_img is not None:
             _InterUtility.check_type(dark_img, RawImage, "dark_img", "Utility", "get_ffc_coefficients")
 
@@ -860,6 +912,7 @@ class RawImage:
         :param      ffc_coefficients:   Flat field correction coefficients
         :return:    None
         """
+        self.__check_valid("flat_field_correction")
         actual_bits = _InterUtility.get_bit_depth(self.frame_data.pixel_format)
         if actual_bits not in (GxPixelSizeEntry.BPP8, GxPixelSizeEntry.BPP10, GxPixelSizeEntry.BPP12):
             raise InvalidParameter("Utility.get_ffc_coefficients only support raw8, raw10, raw12")
@@ -869,11 +922,19 @@ class RawImage:
         if status != DxStatus.OK:
             raise UnexpectedError("Utility.flat_field_correction failure, Error code:%s" % hex(status).__str__())
 
-    def get_numpy_array(self):
+    def get_numpy_array(self, out=None):
         """
-        :brief      Return data as a numpy.Array type with dimension Image.height * Image.width
+        :brief      Return data as a numpy.Array type with dimension Image.height * Image.width,
+                    Image.height * Image.width * 3 for the RGB/BGR formats. 10/12/14/16bit formats are
+                    uint16 with the data in the low bits (see get_bit_depth), GVSP (*_PACKED) and
+                    PFNC (*_P) packed formats are unpacked to uint16.
+                    For a zero copy image (see is_zero_copy) the array maps the SDK frame buffer and is read
+                    only, it is not checked after DataStream.q_buf: copy it before the buffer is queued again
+        :param      out:    uint16 numpy array of Image.height * Image.width the unpacked image is
+                            written into, only used for packed formats, it is allocated when None
         :return:    numpy.Array objects
         """
+        self.__check_valid("get_numpy_array")
         if self.frame_data.status != GxFrameStatusList.SUCCESS:
             print("RawImage.get_numpy_array: This is a incomplete image")
             return None
@@ -893,16 +954,70 @@ class RawImage:
         elif self.frame_data.pixel_format == GxPixelFormatEntry.BGR8:
             image_np = numpy.frombuffer(self.__image_array, dtype=numpy.ubyte, count=image_size * 3). \
             reshape(self.frame_data.height, self.frame_data.width, 3)
+        elif self.frame_data.pixel_format in _RGB48_FORMATS:
+            image_np = numpy.frombuffer(self.__image_array, dtype=numpy.uint16, count=image_size * 3). \
+                reshape(self.frame_data.height, self.frame_data.width, 3)
+        elif NumpyFormatConvert.is_packed(self.frame_data.pixel_format):
+            image_np = NumpyFormatConvert.unpack(self.__image_array, self.frame_data.pixel_format,
+                                                 self.frame_data.width, self.frame_data.height, out)
         else:
             raise NoImplemented("Unsupported pixel format %s, Call convert first." % hex(self.frame_data.pixel_format).__str__())
 
+        # the SDK refills a zero copy buffer after q_buf, the unpacked formats are already copied
+        if self.__zero_copy and not NumpyFormatConvert.is_packed(self.frame_data.pixel_format):
+            image_np.flags.writeable = False
+
         return image_np
 
+    def get_bit_depth(self):
+        """
+        :brief      Get the number of valid bits per channel of the image data
+        :return:    valid bits, e.g. 12 for MONO12, BAYER_RG12_P and RGB12, -1 for other formats
+        """
+        return NumpyFormatConvert.get_bit_depth(self.frame_data.pixel_format)
+
+    def get_roi(self, x, y, width, height):
+        """
+        :brief      Copy a region of the image into a new RawImage of the same pixel format, so convert and
+                    the image processing only work on the region. The region is widened to the Bayer cell and
+                    whole packed pixel groups, the frame offset (frame_data.offset_x/offset_y) is used where
+                    present and set for the new image.
+        :param      x:          region x in sensor coordinates
+        :param      y:          region y in sensor coordinates
+        :param      width:      region width
+        :param      height:     region height
+        :return:    RawImage of the aligned region
+        """
+        self.__check_valid("get_roi")
+        offset_x, offset_y = ImageRoi.get_offset(self)
+        region, core = ImageRoi.get_region((x, y, width, height), self.frame_data.pixel_format,
+                                           self.frame_data.width, self.frame_data.height, offset_x, offset_y)
+        region_data = ImageRoi.crop(self.frame_data.image_buf, self.frame_data.pixel_format,
+                                    self.frame_data.width, self.frame_data.height, region)
+
+        frame_data = GxFrameData()
+        frame_data.status = self.frame_data.status
+        frame_data.width = region[2] - region[0]
+        frame_data.height = region[3] - region[1]
+        frame_data.pixel_format = self.frame_data.pixel_format
+        frame_data.image_size = region_data.size
+        frame_data.frame_id = self.frame_data.frame_id
+        frame_data.timestamp = self.frame_data.timestamp
+        if hasattr(frame_data, "offset_x"):
+            frame_data.offset_x = offset_x + region[0]
+            frame_data.offset_y = offset_y + region[1]
+        frame_data.image_buf = None
+
+        image = RawImage(frame_data)
+        memmove(frame_data.image_buf, region_data.ctypes.data, region_data.size)
+        return image
+
     def get_data(self):
         """
         :brief      get Raw data
         :return:    raw data[string]
         """
+        self.__check_valid("get_data")
         image_str = string_at(self.__image_array, self.frame_data.image_size)
         return image_str
 
@@ -911,6 +1026,7 @@ class RawImage:
         :brief      get Raw data
         :return:    raw data[string]
         """
+        self.__check_valid("get_chunkdata")
         if self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_8BIT:
             imagedata_size = self.frame_data.width * self.frame_data.height
         elif self.frame_data.pixel_format & PIXEL_BIT_MASK == GX_PIXEL_16BIT:
@@ -931,6 +1047,7 @@ class RawImage:
         :param      file_path:      file path
         :return:    None
         """
+        self.__check_valid("save_raw")
         if not isinstance(file_path, str):
             raise ParameterTypeError("RawImage.save_raw: "
                                      "Expected file_path type is str, not %s" % type(file_path))
@@ -1372,6 +1489,108 @@ class _InterUtility:
         else:
             return -1
 
+class _ConvertHandlePool:
+    """
+    :brief      Thread-safe pool of DxImageProc converter handles, keyed by their configuration
+                (output pixel format, valid bits, alpha value, interpolation type). A handle is
+                configured once when it is created and reused by later conversions with the same
+                configuration instead of being created and destroyed per conversion.
+    """
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__idle_handles = {}
+        self.__buffer_size_cache = {}
+
+    def acquire(self, config):
+        """
+        :brief      Take an idle handle of the configuration or create a new one
+        :param      config:     (output pixel format, valid bits, alpha value, interpolation type)
+        :return:    converter handle, give it back with release
+        """
+        with self.__lock:
+            idle_handles = self.__idle_handles.get(config)
+            if idle_handles:
+                return idle_handles.pop()
+
+        pixel_format, valid_bits, alpha_value, convert_type = config
+        status, handle = dx_image_format_convert_create()
+        if status != DxStatus.OK:
+            raise UnexpectedError("dx_image_format_convert_create failure, Error code:%s" % hex(status).__str__())
+
+        try:
+            status = dx_image_format_convert_set_output_pixel_format(handle, pixel_format)
+            if status != DxStatus.OK:
+                raise UnexpectedError(
+                    "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_valid_bits(handle, valid_bits)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_valid_bits failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_alpha_value(handle, alpha_value)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
+
+            status = dx_image_format_convert_set_interpolation_type(handle, convert_type)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert_set_interpolation_type failure, Error code:%s" % hex(status).__str__())
+        except UnexpectedError:
+            dx_image_format_convert_destroy(handle)
+            raise
+
+        return handle
+
+    def release(self, config, handle):
+        """
+        :brief      Give a handle back to the pool, it is destroyed when CONVERT_HANDLE_POOL_MAX_IDLE
+                    handles of the configuration are idle already
+        :param      config:     configuration the handle was acquired with
+        :param      handle:     converter handle
+        :return:    none
+        """
+        with self.__lock:
+            idle_handles = self.__idle_handles.setdefault(config, [])
+            if len(idle_handles) < CONVERT_HANDLE_POOL_MAX_IDLE:
+                idle_handles.append(handle)
+                return
+
+        status = dx_image_format_convert_destroy(handle)
+        if status != DxStatus.OK:
+            raise UnexpectedError("image_format_convert_destroy failure, Error code:%s" % hex(status).__str__())
+
+    def get_buffer_size(self, handle, pixel_format, width, height):
+        """
+        :brief      Calculating Buffer size for conversion, memoized per (pixel_format, width, height)
+        :return:    image buffer size
+        """
+        key = (pixel_format, width, height)
+        buffer_size = self.__buffer_size_cache.get(key)
+        if buffer_size is None:
+            status, buffer_size = dx_image_format_convert_get_buffer_size_for_conversion(handle, pixel_format,
+                                                                                       width, height)
+            if status != DxStatus.OK:
+                raise UnexpectedError("dx_image_format_convert_get_buffer_size_for_conversion failure, "
+                                      "Error code:%s" % hex(status).__str__())
+            self.__buffer_size_cache[key] = buffer_size
+
+        return buffer_size
+
+    def clear(self):
+        """
+        :brief      Destroy all idle handles
+        :return:    none
+        """
+        with self.__lock:
+            idle_handles = [handle for handles in self.__idle_handles.values() for handle in handles]
+            self.__idle_handles.clear()
+
+        for handle in idle_handles:
+            dx_image_format_convert_destroy(handle)
+
+
+_convert_handle_pool = _ConvertHandlePool()
+
+
 class DxColorImgProcess:
     def __init__(self):
         self.defective_pixel_correct = False  # bool
@@ -13,6 +13,7 @@ from gxipy.dxwrapper import *
 from gxipy.gxidef import *
 from gxipy.ImageFormatConvert import *
 from gxipy.ImageProcessConfig import *
+from gxipy.ImageProcessPipeline import *
 from gxipy.Exception import *
 import types
 
@@ -20,25 +21,32 @@ import types
 class ImageProcess:
 
     def __init__(self):
-        self.image_convert_handle = None
+        # compiled ImageProcessPipeline per ImageProcessConfig used by image_improvement
+        self.__pipelines = {}
 
     def __new__(cls, *args, **kw):
         return object.__new__(cls, *args)
 
     def __del__(self):
-        if self.image_convert_handle is not None:
-            status = dx_image_format_convert_destroy(self.image_convert_handle)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_destroy failure, Error code:%s" % hex(status).__str__())
-            self.image_convert_handle = None
+        for pipeline in self.__pipelines.values():
+            pipeline.release()
+        self.__pipelines = {}
+
+    def create_pipeline(self, image_process_config, output_format=GxPixelFormatEntry.RGB8):
+        """
+        :brief      Create an image process pipeline that owns its intermediate buffers, see ImageProcessPipeline
+        :param      image_process_config:   image process config
+        :param      output_format:          GxPixelFormatEntry.RGB8 or GxPixelFormatEntry.BGR8
+        :return:    ImageProcessPipeline
+        """
+        return ImageProcessPipeline(image_process_config, output_format)
 
     def image_improvement(self, image, output_address, image_process_config):
         """
-        :brief:     Improve image quality of the raw_image
+        :brief      Improve image quality of the raw_image
         :param      image: image is RawImage or GXImageInfo
 
-        :param      output_address: output image
+        :param      output_address: output image, RGB8 for color images, MONO8 for mono images
         :param      image_process_config: image process config
         :param
         :return:    None
@@ -49,174 +57,12 @@ class ImageProcess:
         if not isinstance(image_process_config, ImageProcessConfig):
             raise ParameterTypeError("image_process_config param must be ImageProcessConfig type.")
 
-        channel_order = DxRGBChannelOrder.ORDER_RGB
-        if isinstance(image, (RawImage, RGBImage)):
-            pixel_format = image.frame_data.pixel_format
-            raw_image_width = image.frame_data.width
-            raw_image_height = image.frame_data.height
-            input_image_buffer = image.frame_data.image_buf
-        elif isinstance(image, GxImageInfo):
-            pixel_format = image.image_pixel_format
-            raw_image_width = image.image_width
-            raw_image_height = image.image_height
-            input_image_buffer = image.image_buf
-        else:
-            raise ParameterTypeError("image param must be RawImage or GxImageInfo type.")
-
-        if input_image_buffer is None:
-            raise ParameterTypeError("input_image_buffer param is null pointer.")
-
-        if pixel_format == GxPixelFormatEntry.RGB8:
-            channel_order = DxRGBChannelOrder.ORDER_RGB
-        elif pixel_format == GxPixelFormatEntry.BGR8:
-            channel_order = DxRGBChannelOrder.ORDER_BGR
-
-        yuv_pixel = (GxPixelFormatEntry.YUV422_8, GxPixelFormatEntry.YUV422_8_UYVY)
-        if (pixel_format in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8)) or (pixel_format in yuv_pixel):
-            if (pixel_format == GxPixelFormatEntry.BGR8) or (pixel_format in yuv_pixel):
-
-                self.__check_handle()
-                status = dx_image_format_convert_set_output_pixel_format(self.image_convert_handle,
-                                                                         GxPixelFormatEntry.RGB8)
-                if status != DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(
-                            status).__str__())
-
-                status = dx_image_format_convert_set_valid_bits(self.image_convert_handle, DxValidBit.BIT0_7)
-                if status != DxStatus.OK:
-                    raise UnexpectedError(
-                        "image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
-
-                status, out_lenght = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle,
-                                                                                            GxPixelFormatEntry.RGB8,
-                                                                                            image.frame_data.width,
-                                                                                            image.frame_data.height)
-                if status != DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(
-                            status).__str__())
-
-                image_temp = (c_ubyte * out_lenght)()
-                output_image_temp = addressof(image_temp)
-
-                status, input_length = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle,
-                                                                                              image.frame_data.pixel_format,
-                                                                                              image.frame_data.width,
-                                                                                              image.frame_data.height)
-                if status != DxStatus.OK:
-                    raise UnexpectedError(
-                        "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(
-                            status).__str__())
-
-                status = dx_image_format_convert(self.image_convert_handle, image.frame_data.image_buf, input_length,
-                                                 output_image_temp,
-                                                 out_lenght, image.frame_data.pixel_format,
-                                                 image.frame_data.width, image.frame_data.height, False)
-
-                if status != DxStatus.OK:
-                    raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
-
-                input_image_buffer = output_image_temp
-            status = dx_image_improvement_ex(input_image_buffer, output_address,
-                                             raw_image_width, raw_image_height,
-                                             image_process_config.get_color_correction_param(),
-                                             image_process_config.get_contrast_lut().get_ctype_array(),
-                                             image_process_config.get_gamma_lut().get_ctype_array(),
-                                             channel_order)
-            if status != DxStatus.OK:
-                raise UnexpectedError("RGBImage.image_improvement: failed, error code:%s" % hex(status).__str__())
-            return
-
-        if ((pixel_format & PIXEL_BIT_MASK) != GX_PIXEL_8BIT):
-            dest_pixel_format = Utility.get_convert_dest_8bit_pixel_format(pixel_format)
-            if dest_pixel_format == GxPixelFormatEntry.UNDEFINED:
-                raise UnexpectedError("__convert_to_raw8 get dest pixel format failure")
-
-            self.__check_handle()
-            status = dx_image_format_convert_set_output_pixel_format(self.image_convert_handle, dest_pixel_format)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(
-                        status).__str__())
-
-            status = dx_image_format_convert_set_valid_bits(self.image_convert_handle, image_process_config.get_valid_bits())
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(
-                        status).__str__())
-
-            'Get the buffer length of the input pixel format'
-            status, input_length = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle,
-                                                                                          pixel_format,
-                                                                                          raw_image_width,
-                                                                                          raw_image_height)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(
-                        status).__str__())
-
-            'Get the buffer length of the output pixel format and allocate the output image buffer  output_image_temp'
-            status, out_lenght = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle,
-                                                                                        dest_pixel_format,
-                                                                                        raw_image_width,
-                                                                                        raw_image_height)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(
-                        status).__str__())
-            image_temp = (c_ubyte * out_lenght)()
-            output_8bit_image = addressof(image_temp)
-
-            status = dx_image_format_convert(self.image_convert_handle, input_image_buffer, input_length,
-                                             output_8bit_image,
-                                             out_lenght, pixel_format,
-                                             raw_image_width, raw_image_height, False)
-            if status != DxStatus.OK:
-                raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
-
-            if isinstance(image, (RawImage, RGBImage)):
-                image.frame_data.image_buf = output_8bit_image
-            elif isinstance(image, GxImageInfo):
-                image.image_buf = output_8bit_image
-
-
-        if Utility.is_gray(pixel_format):
-            ImageProcess.__mono_image_process(self, output_address, image, image_process_config)
-        else:
-            rgb_image_array_temp = (c_ubyte * image.frame_data.height * image.frame_data.width * 3)()
-            rgb_image_array_temp_address = addressof(rgb_image_array_temp)
-            ImageProcess.__raw_image_process(rgb_image_array_temp_address, image, image_process_config)
-
-            # convert to rgb
-            self.__check_handle()
-            status = dx_image_format_convert_set_output_pixel_format(self.image_convert_handle,
-                                                                     GxPixelFormatEntry.RGB8)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_set_output_pixel_format failure, Error code:%s" % hex(
-                        status).__str__())
-            status = dx_image_format_convert_set_valid_bits(self.image_convert_handle, DxValidBit.BIT0_7)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "image_format_convert_set_alpha_value failure, Error code:%s" % hex(status).__str__())
-
-            status, out_lenght = dx_image_format_convert_get_buffer_size_for_conversion(self.image_convert_handle,
-                                                                                        GxPixelFormatEntry.BGR8,
-                                                                                        image.frame_data.width,
-                                                                                        image.frame_data.height)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "dx_image_format_convert_get_buffer_size_for_conversion failure, Error code:%s" % hex(
-                        status).__str__())
-
-            input_length = image.frame_data.width * image.frame_data.height * 3
-            status = dx_image_format_convert(self.image_convert_handle, rgb_image_array_temp_address, input_length,
-                                             output_address,
-                                             out_lenght, GxPixelFormatEntry.BGR8,
-                                             image.frame_data.width, image.frame_data.height, False)
-            if status != DxStatus.OK:
-                raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+        pipeline = self.__pipelines.get(image_process_config)
+        if pipeline is None:
+            pipeline = ImageProcessPipeline(image_process_config, GxPixelFormatEntry.RGB8)
+            self.__pipelines[image_process_config] = pipeline
+
+        pipeline.process(image, output_address)
 
     def static_defect_correction(self, input_address, output_address, defect_correction, defect_pos_buffer_address,
                                  defect_pos_buffer_size):
@@ -373,78 +219,6 @@ class ImageProcess:
 
 
 
-    @staticmethod
-    def __raw_image_process(output_address, image, image_process_config):
-        """
-        :brief  Raw8 image process
-        :param  color_img_process_param:  image process param, refer to DxColorImgProcess
-        :return img_rgb
-        """
-        if isinstance(image, (RawImage, RGBImage)):
-            pixel_format = image.frame_data.pixel_format
-            raw_image_width = image.frame_data.width
-            raw_image_height = image.frame_data.height
-            input_image_buffer = image.frame_data.image_buf
-        elif isinstance(image, GxImageInfo):
-            pixel_format = image.image_pixel_format
-            raw_image_width = image.image_width
-            raw_image_height = image.image_height
-            input_image_buffer = image.image_buf
-        else:
-            raise ParameterTypeError("image param must be RawImage or GxImageInfo type")
-
-        if input_image_buffer is None or output_address is None:
-            raise ParameterTypeError("input_image_buffer or output_address is NULL pointer")
-
-        color_filter = ImageProcess.__get_pixel_color_filter(pixel_format)
-        mutex = image_process_config.get_mutex()
-        with mutex:
-            color_img_process_param = image_process_config.get_color_image_process(color_filter)
-            status = dx_raw8_image_process(input_image_buffer, output_address,
-                                           raw_image_width, raw_image_height, color_img_process_param)
-            if status != DxStatus.OK:
-                raise UnexpectedError("RawImage.raw8_image_process: failed, error code:%s" % hex(status).__str__())
-
-    def __mono_image_process(self, output_address, image, image_process_config):
-        """
-        :brief  mono8 image process
-        :param  mono_img_process_param:  image process param, refer to DxMonoImgProcess
-        :return img_mono
-        """
-        if isinstance(image, (RawImage, RGBImage)):
-            raw_image_width = image.frame_data.width
-            raw_image_height = image.frame_data.height
-            input_image_buffer = image.frame_data.image_buf
-        elif isinstance(image, GxImageInfo):
-            raw_image_width = image.image_width
-            raw_image_height = image.image_height
-            input_image_buffer = image.image_buf
-        else:
-            raise ParameterTypeError("image param must be RawImage or GxImageInfo type")
-
-        if input_image_buffer is None or output_address is None:
-            raise ParameterTypeError("input_image_buffer or output_address is NULL pointer")
-
-        mutex = image_process_config.get_mutex()
-        with mutex:
-            mono_img_process_param = image_process_config.get_mono_image_process()
-            status = dx_mono8_image_process(input_image_buffer, output_address,
-                                            raw_image_width, raw_image_height, mono_img_process_param)
-            if status != DxStatus.OK:
-                raise UnexpectedError(
-                    "RawImage.dx_mono8_image_process: failed, error code:%s" % hex(status).__str__())
-
-    def __check_handle(self):
-        """
-        :brief  The transformation handle is initialized the first time it is called
-        :return NONE
-        """
-        if self.image_convert_handle is None:
-            status, handle = dx_image_format_convert_create()
-            if status != DxStatus.OK:
-                raise UnexpectedError("dx_image_format_convert_create failure, Error code:%s" % hex(status).__str__())
-            self.image_convert_handle = handle
-
     def __get_pixel_bit(self, pixel_format):
         """
         :brief  get pixel bit
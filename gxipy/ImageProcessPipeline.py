@@ -0,0 +1,330 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+
+from gxipy.gxwrapper import *
+from gxipy.dxwrapper import *
+from gxipy.gxidef import *
+from gxipy.ImageProc import *
+from gxipy.ImageProc import _convert_handle_pool
+from gxipy.ImageProcessConfig import *
+from gxipy.ImageRoi import *
+from gxipy.Exception import *
+import numpy
+
+# color filter layout of the 8bit Bayer formats
+_BAYER_COLOR_FILTER_DICT = {
+    GxPixelFormatEntry.BAYER_GR8: DxPixelColorFilter.GR,
+    GxPixelFormatEntry.BAYER_RG8: DxPixelColorFilter.RG,
+    GxPixelFormatEntry.BAYER_GB8: DxPixelColorFilter.GB,
+    GxPixelFormatEntry.BAYER_BG8: DxPixelColorFilter.BG,
+}
+
+_COLOR_PIXEL_FORMATS = (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8,
+                        GxPixelFormatEntry.YUV422_8, GxPixelFormatEntry.YUV422_8_UYVY)
+
+
+class ImageProcessPipelineStage:
+    CONVERT = "convert"                  # convert to 8bit raw or to the output color order
+    RAW8_PROCESS = "raw8_process"        # defect correction, denoise, sharpen, lut and color correction, output BGR
+    MONO8_PROCESS = "mono8_process"      # defect correction, sharpen and lut
+    IMPROVEMENT = "improvement"          # color correction, contrast and gamma lut of an RGB/BGR image
+    COLOR_ORDER = "color_order"          # BGR to RGB
+
+    def __init__(self):
+        pass
+
+
+class ImageProcessPipeline:
+    """
+    :brief      Image processing with a fixed plan per (pixel format, width, height, valid bits):
+                convert -> defect correction/denoise/sharpen/lut -> color order.
+                The plan is compiled at the first image of a resolution, it owns the intermediate buffers
+                and the converter handles, further images of the same resolution are processed without
+                allocating. The processing parameters are read from the ImageProcessConfig at every image,
+                so changes of the config take effect immediately.
+    """
+    def __init__(self, image_process_config, output_format=GxPixelFormatEntry.RGB8):
+        """
+        :brief      Constructor for instance initialization
+        :param      image_process_config:   image process config
+        :param      output_format:          GxPixelFormatEntry.RGB8 or GxPixelFormatEntry.BGR8, output format of
+                                            the color images, mono images are always output as MONO8
+        """
+        if not isinstance(image_process_config, ImageProcessConfig):
+            raise ParameterTypeError("image_process_config param must be ImageProcessConfig type.")
+
+        if output_format not in (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8):
+            raise InvalidParameter("ImageProcessPipeline.__init__: output_format only support RGB8 or BGR8")
+
+        self.__config = image_process_config
+        self.__output_format = output_format
+        self.__plan_key = None
+        self.__stages = ()
+        self.__convert = None
+        self.__process_stage = None
+        self.__color_order = None
+        self.__color_filter = DxPixelColorFilter.NONE
+        self.__handles = {}
+        self.__buffers = {}
+        self.__roi_input = None
+        self.__roi_output = None
+
+    def __del__(self):
+        self.release()
+
+    def get_output_format(self):
+        """
+        :brief      Get the output format of the color images
+        :return:    GxPixelFormatEntry.RGB8 or GxPixelFormatEntry.BGR8
+        """
+        return self.__output_format
+
+    def get_output_buffer_size(self, image):
+        """
+        :brief      Get the size of the output buffer process needs for the image
+        :param      image:  RawImage, RGBImage or GxImageInfo
+        :return:    buffer size, unit: byte
+        """
+        pixel_format, width, height, input_address = self.__get_image_info(image)
+        if Utility.is_gray(pixel_format):
+            return width * height
+        return width * height * 3
+
+    def get_plan(self):
+        """
+        :brief      Get the stages of the compiled plan, See detail in ImageProcessPipelineStage
+        :return:    tuple of stage names, empty before the first image
+        """
+        return self.__stages
+
+    def process(self, image, output_address):
+        """
+        :brief      Process the image into the output buffer, the input image is not modified
+                    unless output_address is its own buffer
+        :param      image:              RawImage, RGBImage or GxImageInfo
+        :param      output_address:     output buffer address, size see get_output_buffer_size
+        :return:    None
+        """
+        if output_address is None:
+            raise ParameterTypeError("output_address param is null pointer.")
+
+        pixel_format, width, height, input_address = self.__get_image_info(image)
+        if input_address is None:
+            raise ParameterTypeError("input_image_buffer param is null pointer.")
+
+        plan_key = (pixel_format, width, height, self.__config.get_valid_bits())
+        if plan_key != self.__plan_key:
+            self.__compile(plan_key)
+
+        address = input_address
+        if self.__convert is not None:
+            handle, input_length, output_buffer = self.__convert
+            status = dx_image_format_convert(handle, address, input_length, addressof(output_buffer),
+                                             sizeof(output_buffer), pixel_format, width, height, False)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+            address = addressof(output_buffer)
+
+        mutex = self.__config.get_mutex()
+        stage = self.__process_stage
+        if stage == ImageProcessPipelineStage.MONO8_PROCESS:
+            with mutex:
+                mono_img_process_param = self.__config.get_mono_image_process()
+                status = dx_mono8_image_process(address, output_address, width, height, mono_img_process_param)
+            if status != DxStatus.OK:
+                raise UnexpectedError(
+                    "ImageProcessPipeline.dx_mono8_image_process: failed, error code:%s" % hex(status).__str__())
+        elif stage == ImageProcessPipelineStage.RAW8_PROCESS:
+            bgr_address = output_address if self.__color_order is None else addressof(self.__color_order[1])
+            with mutex:
+                color_img_process_param = self.__config.get_color_image_process(self.__color_filter)
+                status = dx_raw8_image_process(address, bgr_address, width, height, color_img_process_param)
+            if status != DxStatus.OK:
+                raise UnexpectedError(
+                    "ImageProcessPipeline.raw8_image_process: failed, error code:%s" % hex(status).__str__())
+        else:
+            if self.__output_format == GxPixelFormatEntry.BGR8:
+                channel_order = DxRGBChannelOrder.ORDER_BGR
+            else:
+                channel_order = DxRGBChannelOrder.ORDER_RGB
+            status = dx_image_improvement_ex(address, output_address, width, height,
+                                             self.__config.get_color_correction_param(),
+                                             self.__config.get_contrast_lut().get_ctype_array(),
+                                             self.__config.get_gamma_lut().get_ctype_array(),
+                                             channel_order)
+            if status != DxStatus.OK:
+                raise UnexpectedError(
+                    "ImageProcessPipeline.image_improvement: failed, error code:%s" % hex(status).__str__())
+
+        if self.__color_order is not None:
+            handle, bgr_buffer = self.__color_order
+            bgr_length = width * height * 3
+            status = dx_image_format_convert(handle, addressof(bgr_buffer), bgr_length, output_address,
+                                             bgr_length, GxPixelFormatEntry.BGR8, width, height, False)
+            if status != DxStatus.OK:
+                raise UnexpectedError("image_format_convert failure, Error code:%s" % hex(status).__str__())
+
+    def process_roi(self, image, rois):
+        """
+        :brief      Process only regions of interest of the image into compact images. Each region is widened
+                    to the Bayer cell and whole packed pixel groups plus ROI_MARGIN pixels, processed on its
+                    own and the region of interest is copied out. The frame offset
+                    (frame_data.offset_x/offset_y) is used where present.
+        :param      image:  RawImage, RGBImage or GxImageInfo
+        :param      rois:   list of (x, y, width, height) in sensor coordinates
+        :return:    list of numpy.Array objects, one per region of interest, color: height * width * 3
+                    in the output format, mono: height * width
+        """
+        if not isinstance(rois, (list, tuple)):
+            raise ParameterTypeError("rois param must be a list of (x, y, width, height).")
+
+        pixel_format, width, height, input_address = self.__get_image_info(image)
+        if input_address is None:
+            raise ParameterTypeError("input_image_buffer param is null pointer.")
+
+        offset_x, offset_y = ImageRoi.get_offset(image)
+        channels = 1 if Utility.is_gray(pixel_format) else 3
+        roi_images = []
+        for roi in rois:
+            region, core = ImageRoi.get_region(roi, pixel_format, width, height, offset_x, offset_y, ROI_MARGIN)
+            region_width = region[2] - region[0]
+            region_height = region[3] - region[1]
+
+            input_size = NumpyFormatConvert.get_buffer_size(pixel_format, region_width, region_height)
+            if self.__roi_input is None or self.__roi_input.size < input_size:
+                self.__roi_input = numpy.empty(input_size, dtype=numpy.uint8)
+            region_data = ImageRoi.crop(input_address, pixel_format, width, height, region, self.__roi_input)
+
+            output_size = region_width * region_height * channels
+            if self.__roi_output is None or self.__roi_output.size < output_size:
+                self.__roi_output = numpy.empty(output_size, dtype=numpy.uint8)
+
+            region_image = GxImageInfo()
+            region_image.image_width = region_width
+            region_image.image_height = region_height
+            region_image.image_buf = region_data.ctypes.data
+            region_image.image_pixel_format = pixel_format
+            self.process(region_image, self.__roi_output.ctypes.data)
+
+            output_image = self.__roi_output[:output_size].reshape(region_height, region_width, channels)
+            core_x, core_y, core_width, core_height = core
+            roi_image = output_image[core_y:core_y + core_height, core_x:core_x + core_width]
+            roi_images.append(roi_image[:, :, 0].copy() if channels == 1 else roi_image.copy())
+
+        return roi_images
+
+    def release(self):
+        """
+        :brief      Give the converter handles back and free the intermediate buffers, the plan is
+                    compiled again at the next image
+        :return:    None
+        """
+        handles = self.__handles
+        self.__handles = {}
+        self.__buffers = {}
+        self.__roi_input = None
+        self.__roi_output = None
+        self.__plan_key = None
+        self.__stages = ()
+        self.__convert = None
+        self.__process_stage = None
+        self.__color_order = None
+        for handle_config, handle in handles.items():
+            _convert_handle_pool.release(handle_config, handle)
+
+    def __compile(self, plan_key):
+        """
+        :brief      Compile the plan of a pixel format, resolution and valid bits, the buffers of the
+                    previous plan are reused when they are large enough
+        :param      plan_key:   (pixel format, width, height, valid bits)
+        :return:    None
+        """
+        pixel_format, width, height, valid_bits = plan_key
+        self.__plan_key = None
+        stages = []
+        convert = None
+        color_order = None
+        color_filter = DxPixelColorFilter.NONE
+
+        if pixel_format in _COLOR_PIXEL_FORMATS:
+            if pixel_format != self.__output_format:
+                handle = self.__get_handle((self.__output_format, DxValidBit.BIT0_7))
+                convert = (handle, _convert_handle_pool.get_buffer_size(handle, pixel_format, width, height),
+                           self.__get_buffer("color", width * height * 3))
+                stages.append(ImageProcessPipelineStage.CONVERT)
+            stages.append(ImageProcessPipelineStage.IMPROVEMENT)
+        else:
+            raw8_pixel_format = pixel_format
+            if (pixel_format & PIXEL_BIT_MASK) != GX_PIXEL_8BIT:
+                raw8_pixel_format = Utility.get_convert_dest_8bit_pixel_format(pixel_format)
+                if raw8_pixel_format == GxPixelFormatEntry.UNDEFINED:
+                    raise InvalidParameter("ImageProcessPipeline: pixel format %s is not support"
+                                           % hex(pixel_format).__str__())
+                handle = self.__get_handle((raw8_pixel_format, valid_bits))
+                convert = (handle, _convert_handle_pool.get_buffer_size(handle, pixel_format, width, height),
+                           self.__get_buffer("raw8", width * height))
+                stages.append(ImageProcessPipelineStage.CONVERT)
+
+            if Utility.is_gray(pixel_format):
+                stages.append(ImageProcessPipelineStage.MONO8_PROCESS)
+            elif raw8_pixel_format in _BAYER_COLOR_FILTER_DICT:
+                color_filter = _BAYER_COLOR_FILTER_DICT[raw8_pixel_format]
+                stages.append(ImageProcessPipelineStage.RAW8_PROCESS)
+                if self.__output_format == GxPixelFormatEntry.RGB8:
+                    color_order = (self.__get_handle((GxPixelFormatEntry.RGB8, DxValidBit.BIT0_7)),
+                                   self.__get_buffer("bgr", width * height * 3))
+                    stages.append(ImageProcessPipelineStage.COLOR_ORDER)
+            else:
+                raise InvalidParameter("ImageProcessPipeline: pixel format %s is not support"
+                                       % hex(pixel_format).__str__())
+
+        self.__stages = tuple(stages)
+        self.__convert = convert
+        self.__process_stage = stages[1] if convert is not None else stages[0]
+        self.__color_order = color_order
+        self.__color_filter = color_filter
+        self.__plan_key = plan_key
+
+    def __get_handle(self, handle_key):
+        """
+        :brief      Get the converter handle of an output pixel format and valid bits, the handle is taken
+                    from the converter handle pool once and kept until release
+        :param      handle_key:     (output pixel format, valid bits)
+        :return:    converter handle
+        """
+        output_pixel_format, valid_bits = handle_key
+        # the handles never interpolate Bayer data, that is done by dx_raw8_image_process
+        handle_config = (output_pixel_format, valid_bits, 255, DxBayerConvertType.NEIGHBOUR)
+        handle = self.__handles.get(handle_config)
+        if handle is None:
+            handle = _convert_handle_pool.acquire(handle_config)
+            self.__handles[handle_config] = handle
+        return handle
+
+    def __get_buffer(self, name, size):
+        """
+        :brief      Get an intermediate buffer of at least size bytes, it is only reallocated when it is too small
+        :return:    ctypes array
+        """
+        buffer = self.__buffers.get(name)
+        if buffer is None or sizeof(buffer) < size:
+            buffer = (c_ubyte * size)()
+            self.__buffers[name] = buffer
+        return buffer
+
+    @staticmethod
+    def __get_image_info(image):
+        """
+        :brief      Get pixel format, width, height and buffer address of the image
+        :param      image:  RawImage, RGBImage or GxImageInfo
+        :return:    pixel format, width, height, buffer address
+        """
+        if isinstance(image, (RawImage, RGBImage)):
+            return image.frame_data.pixel_format, image.frame_data.width, image.frame_data.height, \
+                   image.frame_data.image_buf
+        elif isinstance(image, GxImageInfo):
+            return image.image_pixel_format, image.image_width, image.image_height, image.image_buf
+        else:
+            raise ParameterTypeError("image param must be RawImage or GxImageInfo type.")
@@ -0,0 +1,164 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxidef import *
+from gxipy.Exception import *
+from gxipy.NumpyFormatConvert import *
+from gxipy.NumpyFormatConvert import _BAYER_RED_POSITION, _GVSP_PACKED_FORMATS, _PFNC_PACKED_FORMATS, \
+    _PFNC_GROUP_SIZE
+import ctypes
+import sys
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+# extra pixels converted around a region of interest, so the interpolation, denoise and sharpen at the
+# border of the region see the same neighbours as in a full frame conversion, a multiple of every alignment
+ROI_MARGIN = 4
+
+# formats that share the chroma of two neighbouring pixels
+_YUV422_FORMATS = (GxPixelFormatEntry.YUV422_8, GxPixelFormatEntry.YUV422_8_UYVY)
+
+
+class ImageRoi:
+    """
+    :brief      Helpers for the conversion of regions of interest (x, y, width, height) of an image.
+                A region is widened to the Bayer cell and to whole packed pixel groups, so the cropped data
+                has the same pixel format (Bayer phase) as the full image and can be converted on its own.
+                The coordinates are sensor coordinates, the frame offset (frame_data.offset_x/offset_y)
+                is subtracted where present.
+    """
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def get_alignment(pixel_format):
+        """
+        :brief      Get the alignment of a region in the image
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :return:    (x alignment, y alignment), unit: pixel
+        """
+        if NumpyFormatConvert.get_unpacked_pixel_format(pixel_format) in _BAYER_RED_POSITION:
+            x_align, y_align = 2, 2
+        else:
+            x_align, y_align = 1, 1
+
+        if pixel_format in _GVSP_PACKED_FORMATS or pixel_format in _YUV422_FORMATS:
+            x_align = max(x_align, 2)
+        elif pixel_format in _PFNC_PACKED_FORMATS:
+            x_align = max(x_align, _PFNC_GROUP_SIZE[(pixel_format & PIXEL_BIT_MASK) >> 16][0])
+
+        return x_align, y_align
+
+    @staticmethod
+    def get_offset(image):
+        """
+        :brief      Get the offset of the image on the sensor
+        :param      image:  RawImage, RGBImage or GxImageInfo
+        :return:    (offset_x, offset_y), (0, 0) when the frame data has no offset
+        """
+        frame_data = getattr(image, "frame_data", None)
+        if frame_data is None:
+            return 0, 0
+        return getattr(frame_data, "offset_x", 0), getattr(frame_data, "offset_y", 0)
+
+    @staticmethod
+    def get_region(roi, pixel_format, width, height, offset_x=0, offset_y=0, margin=0):
+        """
+        :brief      Get the aligned region of the image that holds a region of interest
+        :param      roi:            (x, y, width, height) in sensor coordinates
+        :param      pixel_format:   pixel format of the image, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :param      offset_x:       x offset of the image on the sensor
+        :param      offset_y:       y offset of the image on the sensor
+        :param      margin:         extra pixels around the region of interest
+        :return:    region:     (x start, y start, x end, y end) in image coordinates
+                    core:       (x, y, width, height) of the region of interest in the region
+        """
+        if not isinstance(roi, (tuple, list)) or len(roi) != 4:
+            raise ParameterTypeError("ImageRoi.get_region: roi must be a tuple (x, y, width, height)")
+
+        for value in roi:
+            if not isinstance(value, INT_TYPE):
+                raise ParameterTypeError("ImageRoi.get_region: Expected roi value type is int, not %s"
+                                         % type(value))
+
+        roi_x, roi_y, roi_width, roi_height = roi
+        roi_x -= offset_x
+        roi_y -= offset_y
+        if roi_width <= 0 or roi_height <= 0 or roi_x < 0 or roi_y < 0 \
+                or roi_x + roi_width > width or roi_y + roi_height > height:
+            raise OutOfRange("ImageRoi.get_region: roi %s is not inside the image (%d, %d, %d, %d)"
+                             % (tuple(roi), offset_x, offset_y, width, height))
+
+        x_align, y_align = ImageRoi.get_alignment(pixel_format)
+        x_start = max(0, roi_x - margin)
+        x_start -= x_start % x_align
+        y_start = max(0, roi_y - margin)
+        y_start -= y_start % y_align
+        x_end = min(width, roi_x + roi_width + margin)
+        x_end = min(width, x_end + (-x_end % x_align))
+        y_end = min(height, roi_y + roi_height + margin)
+        y_end = min(height, y_end + (-y_end % y_align))
+
+        return (x_start, y_start, x_end, y_end), (roi_x - x_start, roi_y - y_start, roi_width, roi_height)
+
+    @staticmethod
+    def crop(address, pixel_format, width, height, region, out=None):
+        """
+        :brief      Copy a region of the image into a contiguous buffer, the buffer is an image of the
+                    same pixel format and the size of the region
+        :param      address:        image buffer address
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :param      region:         (x start, y start, x end, y end) returned by get_region
+        :param      out:            uint8 numpy array that is reused when it is large enough
+        :return:    numpy.Array objects, uint8, region height * region row size
+        """
+        pixel_bit = (pixel_format & PIXEL_BIT_MASK) >> 16
+        if pixel_bit == 0 or (width * pixel_bit) % 8 != 0:
+            raise InvalidParameter("ImageRoi.crop: the rows of pixel format %s and width %d do not start "
+                                   "at a byte boundary" % (hex(pixel_format).__str__(), width))
+
+        row_size = width * pixel_bit // 8
+        image_array = (ctypes.c_ubyte * (row_size * height)).from_address(address)
+        image = numpy.frombuffer(image_array, dtype=numpy.uint8).reshape(height, row_size)
+
+        x_start, y_start, x_end, y_end = region
+        rows = image[y_start:y_end, x_start * pixel_bit // 8:(x_end * pixel_bit + 7) // 8]
+        if out is None or out.size < rows.size:
+            out = numpy.empty(rows.size, dtype=numpy.uint8)
+        target = out[:rows.size].reshape(rows.shape)
+        target[...] = rows
+        return target
+
+    @staticmethod
+    def get_numpy_array(buffer, pixel_format, width, height):
+        """
+        :brief      Shape a converted image buffer as numpy array without copying
+        :param      buffer:         uint8 numpy array holding the image
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :return:    numpy.Array objects, height * width for one channel, height * width * channels otherwise,
+                    uint16 for the 16bit mono and 48bit formats, uint8 for the others
+        """
+        pixel_bit = (pixel_format & PIXEL_BIT_MASK) >> 16
+        pixel_bit_mask = pixel_format & PIXEL_BIT_MASK
+        if pixel_bit_mask == GX_PIXEL_48BIT or \
+                (pixel_bit_mask == GX_PIXEL_16BIT and (pixel_format & PIXEL_COLOR_MASK) == PIXEL_MONO):
+            dtype, channel_bit = numpy.uint16, 16
+        else:
+            dtype, channel_bit = numpy.uint8, 8
+
+        channels = pixel_bit // channel_bit
+        image = buffer[:width * height * pixel_bit // 8].view(dtype)
+        if channels == 1:
+            return image.reshape(height, width)
+        return image.reshape(height, width, channels)
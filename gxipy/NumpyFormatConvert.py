@@ -0,0 +1,481 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxidef import *
+from gxipy.Exception import *
+import ctypes
+
+# luminance weights (ITU-R BT.601) in 1/256 steps for the Mono8 output
+LUMA_WEIGHT_R = 77
+LUMA_WEIGHT_G = 150
+LUMA_WEIGHT_B = 29
+
+# position of the red pixel in the 2x2 Bayer cell: (row, column)
+_BAYER_RED_POSITION = {
+    GxPixelFormatEntry.BAYER_RG8: (0, 0), GxPixelFormatEntry.BAYER_GR8: (0, 1),
+    GxPixelFormatEntry.BAYER_GB8: (1, 0), GxPixelFormatEntry.BAYER_BG8: (1, 1),
+    GxPixelFormatEntry.BAYER_RG10: (0, 0), GxPixelFormatEntry.BAYER_GR10: (0, 1),
+    GxPixelFormatEntry.BAYER_GB10: (1, 0), GxPixelFormatEntry.BAYER_BG10: (1, 1),
+    GxPixelFormatEntry.BAYER_RG12: (0, 0), GxPixelFormatEntry.BAYER_GR12: (0, 1),
+    GxPixelFormatEntry.BAYER_GB12: (1, 0), GxPixelFormatEntry.BAYER_BG12: (1, 1),
+    GxPixelFormatEntry.BAYER_RG14: (0, 0), GxPixelFormatEntry.BAYER_GR14: (0, 1),
+    GxPixelFormatEntry.BAYER_GB14: (1, 0), GxPixelFormatEntry.BAYER_BG14: (1, 1),
+    GxPixelFormatEntry.BAYER_RG16: (0, 0), GxPixelFormatEntry.BAYER_GR16: (0, 1),
+    GxPixelFormatEntry.BAYER_GB16: (1, 0), GxPixelFormatEntry.BAYER_BG16: (1, 1),
+}
+
+_MONO_FORMATS = (GxPixelFormatEntry.MONO8, GxPixelFormatEntry.MONO10, GxPixelFormatEntry.MONO12,
+                 GxPixelFormatEntry.MONO14, GxPixelFormatEntry.MONO16)
+
+_RGB_FORMATS = (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8)
+
+# 48bit RGB pixel format: 8bit pixel format with the same channel order
+_RGB48_FORMATS = {
+    GxPixelFormatEntry.RGB10: GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR10: GxPixelFormatEntry.BGR8,
+    GxPixelFormatEntry.RGB12: GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR12: GxPixelFormatEntry.BGR8,
+    GxPixelFormatEntry.RGB14: GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR14: GxPixelFormatEntry.BGR8,
+    GxPixelFormatEntry.RGB16: GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR16: GxPixelFormatEntry.BGR8,
+}
+
+_DEST_FORMATS = (GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8, GxPixelFormatEntry.MONO8)
+
+# 16bit output pixel format: 8bit output pixel format with the same layout
+_DEST_16BIT_FORMATS = {
+    GxPixelFormatEntry.RGB16: GxPixelFormatEntry.RGB8,
+    GxPixelFormatEntry.BGR16: GxPixelFormatEntry.BGR8,
+    GxPixelFormatEntry.MONO16: GxPixelFormatEntry.MONO8,
+}
+
+# valid bits per channel: pixel formats
+_BIT_DEPTH_FORMATS = {
+    8: (GxPixelFormatEntry.MONO8, GxPixelFormatEntry.RGB8, GxPixelFormatEntry.BGR8,
+        GxPixelFormatEntry.BAYER_RG8, GxPixelFormatEntry.BAYER_GR8,
+        GxPixelFormatEntry.BAYER_GB8, GxPixelFormatEntry.BAYER_BG8),
+    10: (GxPixelFormatEntry.MONO10, GxPixelFormatEntry.RGB10, GxPixelFormatEntry.BGR10,
+         GxPixelFormatEntry.BAYER_RG10, GxPixelFormatEntry.BAYER_GR10,
+         GxPixelFormatEntry.BAYER_GB10, GxPixelFormatEntry.BAYER_BG10),
+    12: (GxPixelFormatEntry.MONO12, GxPixelFormatEntry.RGB12, GxPixelFormatEntry.BGR12,
+         GxPixelFormatEntry.BAYER_RG12, GxPixelFormatEntry.BAYER_GR12,
+         GxPixelFormatEntry.BAYER_GB12, GxPixelFormatEntry.BAYER_BG12),
+    14: (GxPixelFormatEntry.MONO14, GxPixelFormatEntry.RGB14, GxPixelFormatEntry.BGR14,
+         GxPixelFormatEntry.BAYER_RG14, GxPixelFormatEntry.BAYER_GR14,
+         GxPixelFormatEntry.BAYER_GB14, GxPixelFormatEntry.BAYER_BG14),
+    16: (GxPixelFormatEntry.MONO16, GxPixelFormatEntry.RGB16, GxPixelFormatEntry.BGR16,
+         GxPixelFormatEntry.BAYER_RG16, GxPixelFormatEntry.BAYER_GR16,
+         GxPixelFormatEntry.BAYER_GB16, GxPixelFormatEntry.BAYER_BG16),
+}
+
+# packed pixel format: unpacked pixel format with the same bit depth and color filter
+_GVSP_PACKED_FORMATS = {
+    GxPixelFormatEntry.MONO10_PACKED: GxPixelFormatEntry.MONO10,
+    GxPixelFormatEntry.MONO12_PACKED: GxPixelFormatEntry.MONO12,
+    GxPixelFormatEntry.BAYER_GR10_PACKED: GxPixelFormatEntry.BAYER_GR10,
+    GxPixelFormatEntry.BAYER_RG10_PACKED: GxPixelFormatEntry.BAYER_RG10,
+    GxPixelFormatEntry.BAYER_GB10_PACKED: GxPixelFormatEntry.BAYER_GB10,
+    GxPixelFormatEntry.BAYER_BG10_PACKED: GxPixelFormatEntry.BAYER_BG10,
+    GxPixelFormatEntry.BAYER_GR12_PACKED: GxPixelFormatEntry.BAYER_GR12,
+    GxPixelFormatEntry.BAYER_RG12_PACKED: GxPixelFormatEntry.BAYER_RG12,
+    GxPixelFormatEntry.BAYER_GB12_PACKED: GxPixelFormatEntry.BAYER_GB12,
+    GxPixelFormatEntry.BAYER_BG12_PACKED: GxPixelFormatEntry.BAYER_BG12,
+}
+
+_PFNC_PACKED_FORMATS = {
+    GxPixelFormatEntry.MONO10_P: GxPixelFormatEntry.MONO10,
+    GxPixelFormatEntry.MONO12_P: GxPixelFormatEntry.MONO12,
+    GxPixelFormatEntry.MONO14_P: GxPixelFormatEntry.MONO14,
+    GxPixelFormatEntry.BAYER_GR10_P: GxPixelFormatEntry.BAYER_GR10,
+    GxPixelFormatEntry.BAYER_RG10_P: GxPixelFormatEntry.BAYER_RG10,
+    GxPixelFormatEntry.BAYER_GB10_P: GxPixelFormatEntry.BAYER_GB10,
+    GxPixelFormatEntry.BAYER_BG10_P: GxPixelFormatEntry.BAYER_BG10,
+    GxPixelFormatEntry.BAYER_GR12_P: GxPixelFormatEntry.BAYER_GR12,
+    GxPixelFormatEntry.BAYER_RG12_P: GxPixelFormatEntry.BAYER_RG12,
+    GxPixelFormatEntry.BAYER_GB12_P: GxPixelFormatEntry.BAYER_GB12,
+    GxPixelFormatEntry.BAYER_BG12_P: GxPixelFormatEntry.BAYER_BG12,
+    GxPixelFormatEntry.BAYER_GR14_P: GxPixelFormatEntry.BAYER_GR14,
+    GxPixelFormatEntry.BAYER_RG14_P: GxPixelFormatEntry.BAYER_RG14,
+    GxPixelFormatEntry.BAYER_GB14_P: GxPixelFormatEntry.BAYER_GB14,
+    GxPixelFormatEntry.BAYER_BG14_P: GxPixelFormatEntry.BAYER_BG14,
+}
+
+# PFNC bit depth: (pixels, bytes) of the smallest group that starts at a byte boundary
+_PFNC_GROUP_SIZE = {
+    10: (4, 5),
+    12: (2, 3),
+    14: (4, 7),
+}
+
+
+class NumpyFormatConvert:
+    """
+    :brief      Pixel format conversion with numpy, used by ImageFormatConvert when the
+                DxConvertBackend.NUMPY backend is selected or DxImageProc is not available.
+                Supported conversions:
+                Bayer RG/GR/GB/BG 8/10/12/14/16 -> RGB8/BGR8/Mono8/RGB16/BGR16/Mono16 (bilinear interpolation)
+                Mono8/10/12/14/16               -> RGB8/BGR8/Mono8/RGB16/BGR16/Mono16
+                RGB8/BGR8, RGB/BGR10/12/14/16   -> RGB8/BGR8/Mono8/RGB16/BGR16/Mono16
+                For the 8bit outputs 10/12/14/16bit data is shifted to 8bit according to DxValidBit,
+                the 16bit outputs keep the bit depth of the input (12bit data stays 0..4095).
+                The GVSP (*_PACKED) and PFNC (*_P) packed formats are unpacked to uint16 with unpack.
+    """
+    def __init__(self):
+        pass
+
+    @staticmethod
+    def is_supported(src_pixel_format, dest_pixel_format):
+        """
+        :brief      Whether the conversion is supported
+        :param      src_pixel_format:   input pixel format, See detail in GxPixelFormatEntry
+        :param      dest_pixel_format:  output pixel format, See detail in GxPixelFormatEntry
+        :return:    True/False
+        """
+        if dest_pixel_format not in _DEST_FORMATS and dest_pixel_format not in _DEST_16BIT_FORMATS:
+            return False
+
+        src_pixel_format = NumpyFormatConvert.get_unpacked_pixel_format(src_pixel_format)
+        return src_pixel_format in _BAYER_RED_POSITION or src_pixel_format in _MONO_FORMATS \
+            or src_pixel_format in _RGB_FORMATS or src_pixel_format in _RGB48_FORMATS
+
+    @staticmethod
+    def get_bit_depth(pixel_format):
+        """
+        :brief      Get the number of valid bits per channel, 10/12/14bit data is stored in the low
+                    bits of the 16bit numpy arrays
+        :param      pixel_format:   pixel format, packed formats included, See detail in GxPixelFormatEntry
+        :return:    valid bits, e.g. 12 for MONO12, BAYER_RG12_P and RGB12, -1 for other formats
+        """
+        pixel_format = NumpyFormatConvert.get_unpacked_pixel_format(pixel_format)
+        for bit_depth, pixel_formats in _BIT_DEPTH_FORMATS.items():
+            if pixel_format in pixel_formats:
+                return bit_depth
+        return -1
+
+    @staticmethod
+    def get_buffer_size(pixel_format, width, height):
+        """
+        :brief      Calculate the buffer size of an image
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :return:    buffer size, unit: byte
+        """
+        pixel_bit = (pixel_format & PIXEL_BIT_MASK) >> 16
+        return (width * height * pixel_bit + 7) // 8
+
+    @staticmethod
+    def get_numpy_array(address, pixel_format, width, height):
+        """
+        :brief      Map an image buffer onto a numpy array without copying
+        :param      address:        buffer address
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :return:    numpy.Array objects, mono and Bayer formats: height * width,
+                    RGB8/BGR8: height * width * 3, 48bit RGB formats: uint16 height * width * 3,
+                    packed formats: the packed bytes
+        """
+        buffer_size = NumpyFormatConvert.get_buffer_size(pixel_format, width, height)
+        image_array = (ctypes.c_ubyte * buffer_size).from_address(address)
+        if NumpyFormatConvert.is_packed(pixel_format):
+            return numpy.frombuffer(image_array, dtype=numpy.uint8)
+        elif pixel_format in _RGB_FORMATS:
+            return numpy.frombuffer(image_array, dtype=numpy.uint8).reshape(height, width, 3)
+        elif pixel_format in _RGB48_FORMATS:
+            return numpy.frombuffer(image_array, dtype=numpy.uint16).reshape(height, width, 3)
+        elif (pixel_format & PIXEL_BIT_MASK) == GX_PIXEL_16BIT:
+            return numpy.frombuffer(image_array, dtype=numpy.uint16).reshape(height, width)
+        else:
+            return numpy.frombuffer(image_array, dtype=numpy.uint8).reshape(height, width)
+
+    @staticmethod
+    def convert(src_image, src_pixel_format, dest_pixel_format, valid_bits=DxValidBit.BIT0_7, flip=False, out=None):
+        """
+        :brief      Convert an image
+        :param      src_image:          input numpy array, mono and Bayer formats: height * width,
+                                        RGB formats: height * width * 3, packed formats: the image
+                                        unpacked with unpack
+        :param      src_pixel_format:   input pixel format, See detail in GxPixelFormatEntry
+        :param      dest_pixel_format:  output pixel format: RGB8, BGR8, MONO8, RGB16, BGR16 or MONO16
+        :param      valid_bits:         valid bits of 10/12/14/16bit input data for the 8bit outputs,
+                                        See detail in DxValidBit
+        :param      flip:               True: flip the image vertically
+        :param      out:                numpy array the image is written into (uint8 for the 8bit outputs,
+                                        uint16 for the 16bit outputs), it is allocated when None
+        :return:    numpy.Array objects, RGB/BGR: height * width * 3, MONO: height * width
+        """
+        if not NumpyFormatConvert.is_supported(src_pixel_format, dest_pixel_format):
+            raise NoImplemented("NumpyFormatConvert.convert: Unsupported conversion %s -> %s"
+                                % (hex(src_pixel_format).__str__(), hex(dest_pixel_format).__str__()))
+
+        src_pixel_format = NumpyFormatConvert.get_unpacked_pixel_format(src_pixel_format)
+        height, width = src_image.shape[0], src_image.shape[1]
+        if dest_pixel_format in _DEST_16BIT_FORMATS:
+            # the values keep the bit depth of the input
+            dest_layout = _DEST_16BIT_FORMATS[dest_pixel_format]
+            dtype = numpy.uint16
+            image = src_image
+        else:
+            dest_layout = dest_pixel_format
+            dtype = numpy.uint8
+            image = NumpyFormatConvert.__to_8bit(src_image, valid_bits)
+
+        if dest_layout == GxPixelFormatEntry.MONO8:
+            out_shape = (height, width)
+        else:
+            out_shape = (height, width, 3)
+
+        if out is None:
+            out = numpy.empty(out_shape, dtype=dtype)
+        elif out.shape != out_shape or out.dtype != dtype:
+            raise InvalidParameter("NumpyFormatConvert.convert: Expected out is a %s array of shape %s"
+                                   % (numpy.dtype(dtype).name, out_shape))
+
+        target = out[::-1] if flip else out
+
+        if src_pixel_format in _RGB_FORMATS or src_pixel_format in _RGB48_FORMATS:
+            NumpyFormatConvert.__rgb_to_dest(image, _RGB48_FORMATS.get(src_pixel_format, src_pixel_format),
+                                             dest_layout, target)
+            return out
+
+        if src_pixel_format in _MONO_FORMATS:
+            if dest_layout == GxPixelFormatEntry.MONO8:
+                target[...] = image
+            else:
+                target[...] = image[:, :, numpy.newaxis]
+            return out
+
+        if dest_layout == GxPixelFormatEntry.MONO8:
+            rgb = numpy.empty((height, width, 3), dtype=dtype)
+            NumpyFormatConvert.__demosaic(image, _BAYER_RED_POSITION[src_pixel_format], rgb, 0, 2)
+            NumpyFormatConvert.__rgb_to_dest(rgb, GxPixelFormatEntry.RGB8, dest_layout, target)
+        elif dest_layout == GxPixelFormatEntry.RGB8:
+            NumpyFormatConvert.__demosaic(image, _BAYER_RED_POSITION[src_pixel_format], target, 0, 2)
+        else:
+            NumpyFormatConvert.__demosaic(image, _BAYER_RED_POSITION[src_pixel_format], target, 2, 0)
+
+        return out
+
+    @staticmethod
+    def is_packed(pixel_format):
+        """
+        :brief      Whether the pixel format is a GVSP (*_PACKED) or PFNC (*_P) packed format
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :return:    True/False
+        """
+        return pixel_format in _GVSP_PACKED_FORMATS or pixel_format in _PFNC_PACKED_FORMATS
+
+    @staticmethod
+    def get_unpacked_pixel_format(pixel_format):
+        """
+        :brief      Get the pixel format of the image returned by unpack
+        :param      pixel_format:   pixel format, See detail in GxPixelFormatEntry
+        :return:    unpacked pixel format, pixel_format itself when it is not packed
+        """
+        if pixel_format in _GVSP_PACKED_FORMATS:
+            return _GVSP_PACKED_FORMATS[pixel_format]
+        elif pixel_format in _PFNC_PACKED_FORMATS:
+            return _PFNC_PACKED_FORMATS[pixel_format]
+        else:
+            return pixel_format
+
+    @staticmethod
+    def unpack(packed_data, pixel_format, width, height, out=None):
+        """
+        :brief      Unpack a GVSP (*_PACKED) or PFNC (*_P) packed image to one uint16 per pixel
+                    GVSP:   2 pixels in 3 bytes, byte 0 and 2 hold the high bits of pixel 0 and 1,
+                            byte 1 holds the low bits of pixel 0 (bit 0~3) and pixel 1 (bit 4~7)
+                    PFNC:   pixels are packed LSB first without gaps, 10bit: 4 pixels in 5 bytes,
+                            12bit: 2 pixels in 3 bytes, 14bit: 4 pixels in 7 bytes
+        :param      packed_data:    packed image data, numpy uint8 array or an object with the buffer
+                                    interface (ctypes array, bytes)
+        :param      pixel_format:   packed pixel format, See detail in GxPixelFormatEntry
+        :param      width:          image width
+        :param      height:         image height
+        :param      out:            uint16 numpy array of height * width the image is written into,
+                                    it is allocated when None
+        :return:    numpy.Array objects, height * width, uint16
+        """
+        if not NumpyFormatConvert.is_packed(pixel_format):
+            raise InvalidParameter("NumpyFormatConvert.unpack: %s is not a packed pixel format"
+                                   % hex(pixel_format).__str__())
+
+        if out is None:
+            out = numpy.empty((height, width), dtype=numpy.uint16)
+        elif out.shape != (height, width) or out.dtype != numpy.uint16 or not out.flags.c_contiguous:
+            raise InvalidParameter("NumpyFormatConvert.unpack: Expected out is a contiguous uint16 array of shape %s"
+                                   % ((height, width),))
+
+        if isinstance(packed_data, numpy.ndarray):
+            packed = numpy.ascontiguousarray(packed_data).view(numpy.uint8).reshape(-1)
+        else:
+            packed = numpy.frombuffer(packed_data, dtype=numpy.uint8)
+
+        if pixel_format in _GVSP_PACKED_FORMATS:
+            group_pixels, group_bytes = 2, 3
+        else:
+            group_pixels, group_bytes = _PFNC_GROUP_SIZE[(pixel_format & PIXEL_BIT_MASK) >> 16]
+
+        pixel_num = width * height
+        group_num = (pixel_num + group_pixels - 1) // group_pixels
+        packed_size = group_num * group_bytes
+        if packed.size < packed_size:
+            packed = numpy.concatenate((packed, numpy.zeros(packed_size - packed.size, dtype=numpy.uint8)))
+        groups = packed[:packed_size].reshape(group_num, group_bytes)
+
+        if pixel_num % group_pixels == 0:
+            pixels = out.reshape(group_num, group_pixels)
+        else:
+            pixels = numpy.empty((group_num, group_pixels), dtype=numpy.uint16)
+
+        if pixel_format in _GVSP_PACKED_FORMATS:
+            NumpyFormatConvert.__unpack_gvsp(groups, pixels, pixel_format)
+        else:
+            NumpyFormatConvert.__unpack_pfnc(packed, groups, pixels, (pixel_format & PIXEL_BIT_MASK) >> 16)
+
+        if pixel_num % group_pixels != 0:
+            out.reshape(-1)[...] = pixels.reshape(-1)[:pixel_num]
+
+        return out
+
+    @staticmethod
+    def __unpack_gvsp(groups, pixels, pixel_format):
+        """
+        :brief      Unpack GVSP Mono/Bayer 10/12bit packed groups of 2 pixels in 3 bytes
+        :return:    none
+        """
+        if pixel_format in (GxPixelFormatEntry.MONO12_PACKED, GxPixelFormatEntry.BAYER_GR12_PACKED,
+                            GxPixelFormatEntry.BAYER_RG12_PACKED, GxPixelFormatEntry.BAYER_GB12_PACKED,
+                            GxPixelFormatEntry.BAYER_BG12_PACKED):
+            low_bits, low_mask = 4, 0x0F
+        else:
+            low_bits, low_mask = 2, 0x03
+
+        low = groups[:, 1]
+        pixels[:, 0] = numpy.left_shift(groups[:, 0], low_bits, dtype=numpy.uint16)
+        pixels[:, 0] |= low & low_mask
+        pixels[:, 1] = numpy.left_shift(groups[:, 2], low_bits, dtype=numpy.uint16)
+        pixels[:, 1] |= (low >> 4) & low_mask
+
+    @staticmethod
+    def __unpack_pfnc(packed, groups, pixels, pixel_bit):
+        """
+        :brief      Unpack PFNC LSB packed groups, every pixel is read with one unaligned little endian
+                    32bit load per group (strided view onto the packed bytes), shifted and masked
+        :return:    none
+        """
+        group_num, group_bytes = groups.shape
+        mask = (1 << pixel_bit) - 1
+        # the 32bit load of the last group can read past the end of the image, it is unpacked from a copy
+        tail = numpy.zeros(group_bytes + 4, dtype=numpy.uint8)
+        tail[:group_bytes] = groups[-1]
+
+        for index in range(pixels.shape[1]):
+            byte_offset, bit_offset = divmod(index * pixel_bit, 8)
+            if group_num > 1:
+                words = numpy.ndarray((group_num - 1,), dtype='<u4', buffer=packed,
+                                      offset=byte_offset, strides=(group_bytes,))
+                pixels[:-1, index] = (words >> bit_offset) & mask
+
+            word = int(tail[byte_offset:byte_offset + 4].view('<u4')[0])
+            pixels[-1, index] = (word >> bit_offset) & mask
+
+    @staticmethod
+    def __to_8bit(src_image, valid_bits):
+        """
+        :brief      Select the 8 valid bits of 10/12/14/16bit data, higher values saturate at 255
+        :return:    uint8 numpy array
+        """
+        if src_image.dtype == numpy.uint8:
+            return src_image
+
+        shifted = src_image >> valid_bits if valid_bits > 0 else src_image
+        return numpy.minimum(shifted, 255).astype(numpy.uint8)
+
+    @staticmethod
+    def __rgb_to_dest(src_image, src_pixel_format, dest_pixel_format, target):
+        """
+        :brief      Convert RGB8/BGR8 into RGB8/BGR8/MONO8, 16bit data is converted into the same layout
+        :return:    none
+        """
+        if dest_pixel_format == GxPixelFormatEntry.MONO8:
+            if src_pixel_format == GxPixelFormatEntry.RGB8:
+                weights = (LUMA_WEIGHT_R, LUMA_WEIGHT_G, LUMA_WEIGHT_B)
+            else:
+                weights = (LUMA_WEIGHT_B, LUMA_WEIGHT_G, LUMA_WEIGHT_R)
+            accumulator = numpy.uint16 if src_image.dtype == numpy.uint8 else numpy.uint32
+            luma = numpy.multiply(src_image[:, :, 0], weights[0], dtype=accumulator)
+            luma += numpy.multiply(src_image[:, :, 1], weights[1], dtype=accumulator)
+            luma += numpy.multiply(src_image[:, :, 2], weights[2], dtype=accumulator)
+            luma >>= 8
+            target[...] = luma
+        elif dest_pixel_format == src_pixel_format:
+            target[...] = src_image
+        else:
+            # per channel copies are considerably faster than a reversed channel view
+            target[:, :, 0] = src_image[:, :, 2]
+            target[:, :, 1] = src_image[:, :, 1]
+            target[:, :, 2] = src_image[:, :, 0]
+
+    @staticmethod
+    def __demosaic(raw8, red_position, target, red_index, blue_index):
+        """
+        :brief      Bilinear Bayer interpolation, the missing colors of every pixel are the
+                    average of the nearest pixels of that color
+        :param      raw8:           uint8 or uint16 Bayer image
+        :param      red_position:   (row, column) of the red pixel in the 2x2 Bayer cell
+        :param      target:         height * width * 3 output array of the dtype of raw8
+        :param      red_index:      channel index of red in target
+        :param      blue_index:     channel index of blue in target
+        :return:    none
+        """
+        height, width = raw8.shape
+        # mirrored border keeps the Bayer phase of the neighbours
+        padded = numpy.pad(raw8, 1, mode='reflect')
+        # the sum of 4 neighbours needs 2 bits more than the input
+        accumulator = numpy.uint16 if raw8.dtype == numpy.uint8 else numpy.uint32
+
+        for row in (0, 1):
+            for column in (0, 1):
+                def neighbour(delta_row, delta_column):
+                    return padded[1 + row + delta_row:1 + height + delta_row:2,
+                                  1 + column + delta_column:1 + width + delta_column:2]
+
+                rows = slice(row, None, 2)
+                columns = slice(column, None, 2)
+                center = raw8[rows, columns]
+                horizontal = numpy.add(neighbour(0, -1), neighbour(0, 1), dtype=accumulator)
+                vertical = numpy.add(neighbour(-1, 0), neighbour(1, 0), dtype=accumulator)
+
+                is_red_row = row == red_position[0]
+                is_red_column = column == red_position[1]
+                if is_red_row == is_red_column:
+                    # red or blue pixel: green from the 4 direct neighbours, the other color from the diagonals
+                    diagonal = numpy.add(neighbour(-1, -1), neighbour(-1, 1), dtype=accumulator)
+                    diagonal += neighbour(1, -1)
+                    diagonal += neighbour(1, 1)
+                    diagonal += 2
+                    diagonal >>= 2
+                    horizontal += vertical
+                    horizontal += 2
+                    horizontal >>= 2
+                    if is_red_row:
+                        own_index, other_index = red_index, blue_index
+                    else:
+                        own_index, other_index = blue_index, red_index
+                    target[rows, columns, own_index] = center
+                    target[rows, columns, 1] = horizontal
+                    target[rows, columns, other_index] = diagonal
+                else:
+                    # green pixel: red and blue from the neighbours in the row or column of that color
+                    horizontal += 1
+                    horizontal >>= 1
+                    vertical += 1
+                    vertical >>= 1
+                    if is_red_row:
+                        row_index, column_index = red_index, blue_index
+                    else:
+                        row_index, column_index = blue_index, red_index
+                    target[rows, columns, 1] = center
+                    target[rows, columns, row_index] = horizontal
+                    target[rows, columns, column_index] = vertical
@@ -0,0 +1,262 @@
+#!/usr/bin/python
+# -*- coding:utf-8 -*-
+# -*-mode:python ; tab-width:4 -*- ex:set tabstop=4 shiftwidth=4 expandtab: -*-
+
+import numpy
+from gxipy.gxidef import *
+from gxipy.Exception import *
+from gxipy.NumpyFormatConvert import *
+from gxipy.NumpyFormatConvert import _BAYER_RED_POSITION
+import ctypes
+import threading
+import time
+import sys
+
+if sys.version_info.major > 2:
+    INT_TYPE = int
+else:
+    INT_TYPE = (int, long)
+
+
+class PreviewTap:
+    """
+    :brief      Decimated live view next to the full resolution frames of a DataStream.
+                The acquisition thread only checks the frame rate cap and, when a preview is due and the
+                preview thread is idle, copies the raw frame into the tap buffer, it never waits for the
+                preview. The preview thread bins the raw data (per Bayer phase, before the interpolation),
+                converts the small image with NumpyFormatConvert and keeps the newest preview.
+                Use DataStream.start_preview to create a tap.
+    """
+    def __init__(self, decimation, max_fps, output_format, callback):
+        """
+        :brief      Constructor for instance initialization
+        :param      decimation:     binning factor per side, range:[1, 64]
+        :param      max_fps:        maximum preview frame rate, unit: frames per second
+        :param      output_format:  GxPixelFormatEntry.BGR8, RGB8 or MONO8
+        :param      callback:       function called in the preview thread with every new preview
+                                    (numpy.Array), or None
+        """
+        if not isinstance(decimation, INT_TYPE):
+            raise ParameterTypeError("PreviewTap.__init__: "
+                                     "Expected decimation type is int, not %s" % type(decimation))
+
+        if not isinstance(max_fps, (INT_TYPE, float)):
+            raise ParameterTypeError("PreviewTap.__init__: "
+                                     "Expected max_fps type is float, not %s" % type(max_fps))
+
+        if decimation < 1 or decimation > 64:
+            raise OutOfRange("PreviewTap.__init__: decimation out of bounds, minimum=1, maximum=64")
+
+        if max_fps <= 0:
+            raise OutOfRange("PreviewTap.__init__: max_fps must be greater than 0")
+
+        if output_format not in (GxPixelFormatEntry.BGR8, GxPixelFormatEntry.RGB8, GxPixelFormatEntry.MONO8):
+            raise InvalidParameter("PreviewTap.__init__: output_format only support BGR8, RGB8 or MONO8")
+
+        if callback is not None and not callable(callback):
+            raise ParameterTypeError("PreviewTap.__init__: "
+                                     "Expected callback is callable, not %s" % type(callback))
+
+        self.__decimation = decimation
+        self.__interval = 1.0 / max_fps
+        self.__output_format = output_format
+        self.__callback = callback
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__running = False
+        self.__busy = False
+        self.__next_time = 0.0
+        self.__buffer = None
+        self.__frame = None
+        self.__preview = None
+        self.__preview_info = None
+        self.__offered_count = 0
+        self.__preview_count = 0
+        self.__rate_skipped_count = 0
+        self.__busy_skipped_count = 0
+        self.__error_count = 0
+
+    def start(self):
+        """
+        :brief      Start the preview thread
+        :return:    none
+        """
+        with self.__condition:
+            if self.__running:
+                return
+            self.__running = True
+
+        self.__thread = threading.Thread(target=self.__preview_loop, name="PreviewTap")
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        :brief      Stop the preview thread, the last preview stays available
+        :return:    none
+        """
+        with self.__condition:
+            self.__running = False
+            self.__condition.notify_all()
+
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+    def is_running(self):
+        """
+        :brief      Whether the preview thread is running
+        :return:    True/False
+        """
+        return self.__running
+
+    def offer(self, frame):
+        """
+        :brief      Called by DataStream for every delivered frame, returns at once when no preview is due
+                    or the preview thread is still busy
+        :param      frame:  GxFrameData, GxFrameBuffer or FrameDescriptor, the image data is copied
+        :return:    none
+        """
+        self.__offered_count += 1
+        now = time.monotonic()
+        if now < self.__next_time or frame.status != GxFrameStatusList.SUCCESS:
+            self.__rate_skipped_count += 1
+            return
+
+        if self.__busy or not self.__running:
+            self.__busy_skipped_count += 1
+            return
+
+        image_size = NumpyFormatConvert.get_buffer_size(frame.pixel_format, frame.width, frame.height)
+        if image_size > frame.image_size or frame.image_buf is None:
+            return
+
+        if self.__buffer is None or self.__buffer.size < image_size:
+            self.__buffer = numpy.empty(image_size, dtype=numpy.uint8)
+        ctypes.memmove(self.__buffer.ctypes.data, frame.image_buf, image_size)
+
+        with self.__condition:
+            self.__next_time = now + self.__interval
+            self.__busy = True
+            self.__frame = (frame.pixel_format, frame.width, frame.height, frame.frame_id, frame.timestamp)
+            self.__condition.notify_all()
+
+    def get_preview(self):
+        """
+        :brief      Get the newest preview
+        :return:    numpy.Array objects, BGR8/RGB8: height * width * 3, MONO8: height * width,
+                    None before the first preview
+        """
+        return self.__preview
+
+    def get_preview_info(self):
+        """
+        :brief      Get the frame the newest preview was made of
+        :return:    dict: frame_id, timestamp, width, height (of the full frame), None before the first preview
+        """
+        return self.__preview_info
+
+    def get_statistics(self):
+        """
+        :brief      Get the preview counters
+        :return:    dict: offered_count:        frames offered by the data stream
+                          preview_count:        previews made
+                          rate_skipped_count:   frames skipped by the frame rate cap or an incomplete status
+                          busy_skipped_count:   frames skipped while the preview thread was busy
+                          error_count:          frames the preview failed for
+        """
+        return {
+            'offered_count': self.__offered_count,
+            'preview_count': self.__preview_count,
+            'rate_skipped_count': self.__rate_skipped_count,
+            'busy_skipped_count': self.__busy_skipped_count,
+            'error_count': self.__error_count,
+        }
+
+    @staticmethod
+    def bin(image, pixel_format, decimation):
+        """
+        :brief      Average decimation * decimation pixels, Bayer images per color phase so the result is a
+                    Bayer image of the same pixel format, rows and columns that do not fill a block are cut off
+        :param      image:          numpy array, mono and Bayer formats: height * width,
+                                    RGB8/BGR8: height * width * 3
+        :param      pixel_format:   unpacked pixel format, See detail in GxPixelFormatEntry
+        :param      decimation:     binning factor per side
+        :return:    numpy.Array objects of the same dtype, height / decimation * width / decimation
+        """
+        if decimation == 1:
+            return image
+
+        # the pixels of one block are summed row by row and column by column into uint32, which is
+        # much faster than one sum over the non contiguous block axes
+        phase = 2 if pixel_format in _BAYER_RED_POSITION else 1
+        block = phase * decimation
+        height = image.shape[0] // block
+        width = image.shape[1] // block
+        channels = image.shape[2:]
+        rows = image[:height * block, :width * block].reshape((height, decimation, phase, width * block) + channels)
+        row_sum = rows[:, 0].astype(numpy.uint32)
+        for index in range(1, decimation):
+            row_sum += rows[:, index]
+
+        columns = row_sum.reshape((height, phase, width, decimation, phase) + channels)
+        binned = columns[:, :, :, 0].copy()
+        for index in range(1, decimation):
+            binned += columns[:, :, :, index]
+        binned = binned.reshape((height * phase, width * phase) + channels)
+
+        binned //= decimation * decimation
+        return binned.astype(image.dtype)
+
+    def __make_preview(self, pixel_format, width, height):
+        """
+        :brief      Bin and convert the frame in the tap buffer
+        :return:    numpy.Array objects in the output format
+        """
+        image = NumpyFormatConvert.get_numpy_array(self.__buffer.ctypes.data, pixel_format, width, height)
+        if NumpyFormatConvert.is_packed(pixel_format):
+            image = NumpyFormatConvert.unpack(image, pixel_format, width, height)
+            pixel_format = NumpyFormatConvert.get_unpacked_pixel_format(pixel_format)
+
+        binned = PreviewTap.bin(image, pixel_format, self.__decimation)
+        # the 8 most significant bits of the pixel bit depth
+        valid_bits = max(DxValidBit.BIT0_7, NumpyFormatConvert.get_bit_depth(pixel_format) - 8)
+        return NumpyFormatConvert.convert(binned, pixel_format, self.__output_format, valid_bits)
+
+    def __preview_loop(self):
+        """
+        :brief      Preview thread, makes a preview of every frame handed over by offer
+        :return:    none
+        """
+        while True:
+            with self.__condition:
+                while self.__running and not self.__busy:
+                    self.__condition.wait()
+                if not self.__running:
+                    self.__busy = False
+                    return
+                pixel_format, width, height, frame_id, timestamp = self.__frame
+
+            try:
+                if not NumpyFormatConvert.is_supported(pixel_format, self.__output_format):
+                    raise NoImplemented("PreviewTap: pixel format %s is not support" % hex(pixel_format).__str__())
+                preview = self.__make_preview(pixel_format, width, height)
+            except Exception as error:
+                self.__error_count += 1
+                print("PreviewTap: preview failed, %s" % error)
+                preview = None
+            finally:
+                with self.__condition:
+                    self.__busy = False
+
+            if preview is None:
+                continue
+
+            self.__preview = preview
+            self.__preview_info = {'frame_id': frame_id, 'timestamp': timestamp, 'width': width, 'height': height}
+            self.__preview_count += 1
+            if self.__callback is not None:
+                try:
+                    self.__callback(preview)
+                except Exception as error:
+                    print("PreviewTap: callback failed, %s" % error)
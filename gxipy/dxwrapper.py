@@ -16,6 +16,7 @@ if sys.platform == 'linux2' or sys.platform == 'linux':
         dll = CDLL(filepath)
     except OSError:
         print('Cannot find libdximageproc.so or libgxiapi.so.')
+        dll = None
 else:
     try:
         if (sys.version_info.major == 3 and sys.version_info.minor >= 8) or (sys.version_info.major > 3):
@@ -24,6 +25,7 @@ else:
             dll = WinDLL('DxImageProc.dll')
     except OSError:
         print('Cannot find DxImageProc.dll.')
+        dll = None
 
 def string_encoding(string):
     """
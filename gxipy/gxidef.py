@@ -1228,6 +1228,16 @@ class DxValidBit:
     def __init__(self):
         pass
 
+
+# image format convert backend
+class DxConvertBackend:
+    SDK = 0                 # DxImageProc library
+    NUMPY = 1               # numpy, see NumpyFormatConvert
+    AUTO = 2                # DxImageProc library when it is available, otherwise numpy
+
+    def __init__(self):
+        pass
+
 class GxNodeNameSpaceList:
     NAMESPACE_CUSTOM                                            = 0             # name resides in custom namespace
     NAMESPACE_STANDARD                                        = 1             # name resides in one of the standard namespaces
@@ -1290,3 +1300,12 @@ class GxImageInfo:
     def __init__(self):
         pass
 
+
+# Background grab ring buffer policy
+class GxGrabPolicyList:
+    LATEST_ONLY = 0                                     # Keep only the newest frame
+    FIFO_BLOCK = 1                                      # Keep all frames, the grab thread waits while the ring is full
+    FIFO_DROP_OLDEST = 2                                # Keep all frames, drop the oldest frame while the ring is full
+
+    def __init__(self):
+        pass
@@ -14,6 +14,7 @@ if sys.platform == 'linux2' or sys.platform == 'linux':
         dll = CDLL('/usr/lib/libgxiapi.so')
     except OSError:
         print("Cannot find libgxiapi.so.")
+        dll = None
 else:
     try:
         env_dist = os.environ
@@ -37,6 +38,7 @@ else:
             dll = WinDLL('GxIAPI.dll')
     except OSError:
         print('Cannot find GxIAPI.dll.')
+        dll = None
 
 
 # Error code
@@ -2614,6 +2616,9 @@ if hasattr(dll, 'GXGetImage'):
         return status
 
 if hasattr(dll, "GXDQBuf"):
+    dll.GXDQBuf.argtypes = [c_void_p, ctypes.POINTER(ctypes.POINTER(GxFrameBuffer)), c_uint]
+    dll.GXDQBuf.restype = c_int
+
     def gx_dq_buf(handle, pp_frame_buffer, time_out = 200):
         """
         :brief      After starting acquisition, you can call this function to get images directly.
@@ -2626,19 +2631,13 @@ if hasattr(dll, "GXDQBuf"):
                                     Type: int, minnum: 0
         :return:    status:         State return value, See detail in GxStatusList
         """
-        handle_c = c_void_p()
-        handle_c.value = handle
-
-        time_out_c = c_uint()
-        time_out_c.value = time_out
-
-        dll.GXDQBuf.argtypes = [c_void_p, ctypes.POINTER(ctypes.POINTER(GxFrameBuffer)), c_uint]
-        dll.GXDQBuf.restype = c_int
-
-        status = dll.GXDQBuf(handle_c, pp_frame_buffer, time_out_c)
+        status = dll.GXDQBuf(handle, pp_frame_buffer, time_out)
         return status
 
 if hasattr(dll, "GXQBuf"):
+    dll.GXQBuf.argtypes = [c_void_p, ctypes.POINTER(GxFrameBuffer)]
+    dll.GXQBuf.restype = c_int
+
     def gx_q_buf(handle, p_frame_buffer):
         """
         :brief      Call this interface to return after using the cache
@@ -2648,13 +2647,74 @@ if hasattr(dll, "GXQBuf"):
                                     Type: First level pointer
         :return:    status:         State return value, See detail in GxStatusList
         """
+        status = dll.GXQBuf(handle, p_frame_buffer)
+        return status
+
+if hasattr(dll, "GXDQAllBufs"):
+    dll.GXDQAllBufs.argtypes = [c_void_p, ctypes.POINTER(ctypes.POINTER(GxFrameBuffer)), c_uint,
+                                ctypes.POINTER(c_uint), c_uint]
+    dll.GXDQAllBufs.restype = c_int
+
+    def gx_dequeue_all_bufs(handle, pp_frame_buffer_array, buff_num, time_out = 200):
+        """
+        :brief      After starting acquisition, you can call this function to get all the images
+                    already acquired in one call, at most buff_num images.
+                    After the image processing is completed, the gx_queue_all_bufs interface needs to be called
+                    otherwise the collection will not be able to continue.
+        :param      handle:                 The handle of the device
+                                            Type: Long, Greater than 0
+        :param      pp_frame_buffer_array:  [out]User introduced to receive the image data
+                                            Type: Array of first level pointer, length buff_num
+        :param      buff_num:               The size of pp_frame_buffer_array
+                                            Type: int, Greater than 0
+        :param      time_out:               The timeout time of capture image.(unit: ms)
+                                            Type: int, minnum: 0
+        :return:    status:                 State return value, See detail in GxStatusList
+                    frame_count:            The number of images that are actually returned
+        """
+        frame_count_c = c_uint()
+
+        status = dll.GXDQAllBufs(handle, pp_frame_buffer_array, buff_num, byref(frame_count_c), time_out)
+        return status, frame_count_c.value
+
+if hasattr(dll, "GXQAllBufs"):
+    def gx_queue_all_bufs(handle):
+        """
+        :brief      Return all the image buffers obtained by gx_dequeue_all_bufs to the GxIAPI library
+        :param      handle:         The handle of the device
+                                    Type: Long, Greater than 0
+        :return:    status:         State return value, See detail in GxStatusList
+        """
         handle_c = c_void_p()
         handle_c.value = handle
 
-        dll.GXQBuf.argtypes = [c_void_p, ctypes.POINTER(GxFrameBuffer)]
-        dll.GXQBuf.restype = c_int
+        status = dll.GXQAllBufs(handle_c)
+        return status
+
+if hasattr(dll, 'GXStreamOn'):
+    def gx_stream_on(handle):
+        """
+        :brief      Start acquisition
+        :param      handle:     The handle of the device
+        :return:    status:     State return value, See detail in GxStatusList
+        """
+        handle_c = c_void_p()
+        handle_c.value = handle
+
+        status = dll.GXStreamOn(handle_c)
+        return status
 
-        status = dll.GXQBuf(handle_c, p_frame_buffer)
+if hasattr(dll, 'GXStreamOff'):
+    def gx_stream_off(handle):
+        """
+        :brief      Stop acquisition
+        :param      handle:     The handle of the device
+        :return:    status:     State return value, See detail in GxStatusList
+        """
+        handle_c = c_void_p()
+        handle_c.value = handle
+
+        status = dll.GXStreamOff(handle_c)
         return status
 
 if hasattr(dll, 'GXFlushQueue'):
@@ -3278,20 +3338,6 @@ if hasattr(dll, 'GXGetEnumDetailValue'):
         return status,enum_feature_c
 
 '''
-if hasattr(dll, 'GXStreamOn'):
-    def gx_stream_on(handle):
-        """
-        :brief      Start acquisition
-        :param      handle:     The handle of the device
-        :return:    status:     State return value, See detail in GxStatusList
-        """
-        handle_c = c_void_p()
-        handle_c.value = handle
-
-        status = dll.GXStreamOn(handle_c)
-        return status
-
-
 if hasattr(dll, 'GXDQBuf'):
     def gx_dequeue_buf(handle, time_out):
         """
@@ -3334,65 +3380,6 @@ if hasattr(dll, 'GXQBuf'):
 
         status = dll.GXQBuf(handle_c, frame_data_p_p)
         return status
-        
-
-if hasattr(dll, 'GXDQAllBufs'):
-    def gx_dequeue_all_bufs(handle, buff_num, time_out):
-        """
-        :brief      Get images
-                    After the image processing is completed, the gx_queue_all_bufs interface needs to be called
-                    otherwise the collection will not be able to continue.
-        :param      handle:         The handle of the device
-        :param      buff_num:       The number of images expected to be obtained
-        :param      time_out:       The timeout time of capture image.(unit: ms)
-        :return:    status:         State return value, See detail in GxStatusList
-                    frame_data:     Image data arrays
-                    frame_count:    The number of images that are actually returned
-        """
-        handle_c = c_void_p()
-        handle_c.value = handle
-
-        time_out_c = c_uint()
-        time_out_c.value = time_out
-
-        frame_data_p = (c_void_p * buff_num)()
-        frame_count_c = c_uint()
-
-        status = dll.GXDQAllBufs(handle_c, frame_data_p, buff_num, byref(frame_count_c), time_out_c)
-        frame_data = (GxFrameData * buff_num)()
-
-        for i in range(buff_num):
-            memmove(addressof(frame_data[i]), frame_data_p[i], sizeof(GxFrameData))
-
-        return status, frame_data, frame_count_c.value
-
-
-if hasattr(dll, 'GXQAllBufs'):
-    def gx_queue_all_bufs(handle):
-        """
-        :brief      The image data Buf is returned to the GxIAPI library and used for collection.
-        :param      handle:     The handle of the device
-        :return:    status:     State return value, See detail in GxStatusList
-        """
-        handle_c = c_void_p()
-        handle_c.value = handle
-
-        status = dll.GXQAllBufs(handle_c)
-        return status
-
-
-if hasattr(dll, 'GXStreamOff'):
-    def gx_stream_off(handle):
-        """
-        :brief      Stop acquisition
-        :param      handle:     The handle of the device
-        :return:    status:     State return value, See detail in GxStatusList
-        """
-        handle_c = c_void_p()
-        handle_c.value = handle
-
-        status = dll.GXStreamOff(handle_c)
-        return status
 '''
 
 def array_decoding(int_array_c):